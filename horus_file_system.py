@@ -17,6 +17,7 @@ import sys
 import json
 import subprocess
 import re
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
@@ -349,6 +350,9 @@ class HorusFileSystem:
         self.scene_base: str = ""
         self.horus_data: str = ""
         self.status_cache: Dict[str, Dict] = {}  # {episode_sequence: status_data}
+        # Media scans read status_cache on worker threads while the UI edits it
+        self._status_lock = threading.Lock()
+        self.status_revision = 0  # bumped on every status save
 
     def auto_detect(self) -> bool:
         """Auto-detect available access method based on PREFERRED_ACCESS_MODE."""
@@ -437,6 +441,17 @@ class HorusFileSystem:
             path = path.replace("/", "\\")
         return path
 
+    def convert_paths_for_rv(self, paths: List[str]) -> List[str]:
+        """Convert several paths for RV playback, checking the mode/platform once."""
+        if self.access_mode == "local" or sys.platform != 'win32':
+            return list(paths)
+        return [
+            path.replace(LINUX_PROJECT_ROOT, WINDOWS_PROJECT_ROOT)
+                .replace(LINUX_IMAGE_ROOT, WINDOWS_IMAGE_ROOT)
+                .replace("/", "\\") if path else path
+            for path in paths
+        ]
+
     def get_playback_path(self, media_item: Dict, prefer_image_seq: bool = True) -> str:
         """Get the appropriate file path for playback based on preference.
 
@@ -809,6 +824,7 @@ class HorusFileSystem:
         Path structure: .../version/v001/, .../version/v002/
         Returns dict keyed by shot_dept_version.
         """
+        import fnmatch
         import glob
         # Find version folders - search_path may contain wildcards
         # Convert to OS-specific path and add v* pattern
@@ -816,7 +832,17 @@ class HorusFileSystem:
         pattern = os.path.join(search_path_os, 'v*')
 
         print(f"   Image seq local pattern: {pattern}")
-        folders = [f for f in glob.glob(pattern) if os.path.isdir(f)]
+        # Expand the wildcards to the version/ directories, then read each with
+        # one scandir: DirEntry.is_dir() comes from the directory listing, so
+        # there is no extra stat() per version folder (slow on network mounts)
+        folders = []
+        for version_dir in glob.glob(search_path_os):
+            try:
+                with os.scandir(version_dir) as entries:
+                    folders.extend(entry.path for entry in entries
+                                   if fnmatch.fnmatch(entry.name, 'v*') and entry.is_dir())
+            except OSError:
+                continue
         print(f"   Found {len(folders)} version folders")
 
         img_map = {}
@@ -1320,9 +1346,11 @@ class HorusFileSystem:
         cache_key = f"{episode}_{sequence}"
 
         # Check in-memory cache first
-        if cache_key in self.status_cache:
+        with self._status_lock:
+            cached = self.status_cache.get(cache_key)
+        if cached is not None:
             print(f"   ✅ load_sequence_status_cache: Using in-memory cache for {cache_key}")
-            return self.status_cache[cache_key]
+            return cached
 
         # Load from file
         path = self.get_sequence_status_file_path(episode, sequence)
@@ -1333,7 +1361,9 @@ class HorusFileSystem:
         if content:
             try:
                 data = json.loads(content)
-                self.status_cache[cache_key] = data
+                # A status edit may have cached a newer copy while the file was read
+                with self._status_lock:
+                    data = self.status_cache.setdefault(cache_key, data)
                 print(f"   ✅ load_sequence_status_cache: Loaded {len(data.get('statuses', {}))} statuses from file")
                 return data
             except json.JSONDecodeError as e:
@@ -1349,8 +1379,8 @@ class HorusFileSystem:
             "last_updated": datetime.utcnow().isoformat(),
             "statuses": {}
         }
-        self.status_cache[cache_key] = empty_cache
-        return empty_cache
+        with self._status_lock:
+            return self.status_cache.setdefault(cache_key, empty_cache)
 
     def save_sequence_status_cache(self, episode: str, sequence: str, cache_data: Dict) -> bool:
         """Save status cache for a sequence."""
@@ -1360,7 +1390,9 @@ class HorusFileSystem:
         cache_key = f"{episode}_{sequence}"
 
         # Update in-memory cache
-        self.status_cache[cache_key] = cache_data
+        with self._status_lock:
+            self.status_cache[cache_key] = cache_data
+            self.status_revision += 1
 
         # Update last_updated timestamp
         cache_data["last_updated"] = datetime.utcnow().isoformat()
@@ -1370,6 +1402,22 @@ class HorusFileSystem:
         content = json.dumps(cache_data, indent=2)
         return self.provider.write_file(path, content)
 
+    def apply_cached_statuses(self, media_items: List[Dict]):
+        """Refresh each media item's "status" from the in-memory status cache.
+
+        For listings built on a worker thread while statuses were being edited.
+        """
+        with self._status_lock:
+            caches = dict(self.status_cache)
+
+        for item in media_items:
+            cache_data = caches.get(f"{item.get('episode')}_{item.get('sequence')}")
+            if cache_data is None:
+                continue
+            status_key = f"{item.get('shot')}_{item.get('department')}_{item.get('version')}"
+            status_entry = cache_data.get("statuses", {}).get(status_key)
+            item["status"] = status_entry.get("current_status", "wip") if status_entry else "wip"
+
     def get_shot_status(self, episode: str, sequence: str, shot: str,
                         department: str, version: str) -> str:
         """Get status for a specific version from sequence status cache.
@@ -6,6 +6,7 @@ Storage: {PROJECT_ROOT}/SWA/.horus/playlists.json
 """
 
 import json
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -20,11 +21,16 @@ class HorusPlaylistManager:
     def __init__(self):
         self.fs = None  # HorusFileSystem instance
         self._cache = None  # Cached playlists
+        self._id_index = {}  # playlist _id -> playlist dict in _cache
+        self._id_index_source = None  # _cache list the index was built from
+        self.last_saved_at = 0.0  # time.monotonic() of last successful save
+        self.revision = 0  # bumped whenever the cache changes (lets async readers spot edits)
 
     def set_file_system(self, fs):
         """Set the file system provider."""
         self.fs = fs
         self._cache = None  # Clear cache when fs changes
+        self.revision += 1
 
     def _generate_uuid(self) -> str:
         """Generate unique ID for playlist/clip."""
@@ -61,8 +67,10 @@ class HorusPlaylistManager:
         if self._cache is None:
             return True  # Nothing to save
 
+        self.revision += 1
         result = self.fs.save_playlists(self._cache)
         if result:
+            self.last_saved_at = time.monotonic()
             print(f"✅ Saved {len(self._cache)} playlists to backend")
         else:
             print("❌ Failed to save playlists")
@@ -71,8 +79,19 @@ class HorusPlaylistManager:
     def refresh(self):
         """Force reload from storage."""
         self._cache = None
+        self.revision += 1
         return self.load_playlists()
 
+    def is_loaded(self) -> bool:
+        """Whether playlists have been read into the cache."""
+        return self._cache is not None
+
+    def set_cache(self, playlists: List[Dict]):
+        """Replace the cache with playlists read from storage elsewhere (e.g. a worker thread)."""
+        self._cache = playlists if playlists else []
+        self.revision += 1
+        return self._cache
+
     # ========================================================================
     # Playlist CRUD Methods
     # ========================================================================
@@ -109,6 +128,8 @@ class HorusPlaylistManager:
 
         playlists.append(new_playlist)
         self._cache = playlists
+        if self._id_index_source is playlists:
+            self._id_index[playlist_id] = new_playlist
 
         if self.save_playlists():
             print(f"✅ Created playlist: {name} ({playlist_id})")
@@ -118,8 +139,20 @@ class HorusPlaylistManager:
     def get_playlist(self, playlist_id: str) -> Optional[Dict]:
         """Get playlist by ID."""
         playlists = self.load_playlists()
+
+        # Index is rebuilt whenever the cache list is replaced (load/refresh)
+        if self._id_index_source is not playlists:
+            self._id_index = {p.get("_id"): p for p in playlists}
+            self._id_index_source = playlists
+
+        playlist = self._id_index.get(playlist_id)
+        if playlist is not None:
+            return playlist
+
+        # Playlists appended to the cache list directly are not indexed yet
         for playlist in playlists:
             if playlist.get("_id") == playlist_id:
+                self._id_index[playlist_id] = playlist
                 return playlist
         return None
 
@@ -147,6 +180,7 @@ class HorusPlaylistManager:
                 name = playlist.get("name", "Unknown")
                 playlists.pop(i)
                 self._cache = playlists
+                self._id_index.pop(playlist_id, None)
                 if self.save_playlists():
                     print(f"✅ Deleted playlist: {name}")
                     return True
@@ -164,14 +198,58 @@ class HorusPlaylistManager:
             print(f"❌ Playlist not found: {playlist_id}")
             return None
 
-        clip_id = self._generate_uuid()
         clips = playlist.get("clips", [])
 
         # Calculate position (add to end)
-        position = len(clips)
+        new_clip = self._build_clip(media_data, len(clips), self._get_timestamp())
+        clip_id = new_clip["clip_id"]
+
+        clips.append(new_clip)
+        playlist["clips"] = clips
+        playlist["updated_at"] = self._get_timestamp()
+        self._update_metadata(playlist)
+
+        if self.save_playlists():
+            print(f"✅ Added clip to playlist: {media_data.get('file_name', clip_id)}")
+            return clip_id
+        return None
 
-        new_clip = {
-            "clip_id": clip_id,
+    def add_clips(self, playlist_id: str, media_list: List[Dict]) -> List[str]:
+        """Add several clips to playlist with a single save. Returns the new clip IDs.
+
+        If the save fails the cached playlist is rolled back and [] is returned.
+        """
+        playlist = self.get_playlist(playlist_id)
+        if not playlist:
+            print(f"❌ Playlist not found: {playlist_id}")
+            return []
+
+        if not media_list:
+            return []
+
+        state = self._clip_state(playlist)
+        clips = playlist.get("clips", [])
+        timestamp = self._get_timestamp()
+        new_clips = [
+            self._build_clip(media_data, len(clips) + i, timestamp)
+            for i, media_data in enumerate(media_list)
+        ]
+
+        clips.extend(new_clips)
+        playlist["clips"] = clips
+        playlist["updated_at"] = timestamp
+        self._update_metadata(playlist)
+
+        if self.save_playlists():
+            print(f"✅ Added {len(new_clips)} clips to playlist")
+            return [c["clip_id"] for c in new_clips]
+        self._restore_clip_state(playlist, state)
+        return []
+
+    def _build_clip(self, media_data: Dict, position: int, timestamp: str) -> Dict:
+        """Build a clip record from media data."""
+        return {
+            "clip_id": self._generate_uuid(),
             "episode": media_data.get("episode", ""),
             "sequence": media_data.get("sequence", ""),
             "shot": media_data.get("shot", ""),
@@ -181,14 +259,12 @@ class HorusPlaylistManager:
             "file_name": media_data.get("file_name", ""),
             "frame_range": media_data.get("frame_range", [1001, 1100]),
             "position": position,
-            "added_at": self._get_timestamp()
+            "added_at": timestamp
         }
 
-        clips.append(new_clip)
-        playlist["clips"] = clips
-        playlist["updated_at"] = self._get_timestamp()
-
-        # Update metadata
+    def _update_metadata(self, playlist: Dict):
+        """Recompute clip_count/total_frames metadata for playlist."""
+        clips = playlist.get("clips", [])
         playlist["metadata"] = {
             "clip_count": len(clips),
             "total_frames": sum(
@@ -197,10 +273,23 @@ class HorusPlaylistManager:
             )
         }
 
-        if self.save_playlists():
-            print(f"✅ Added clip to playlist: {media_data.get('file_name', clip_id)}")
-            return clip_id
-        return None
+    @staticmethod
+    def _clip_state(playlist: Dict) -> tuple:
+        """Snapshot the fields the clip methods change, for _restore_clip_state()."""
+        clips = playlist.get("clips", [])
+        return (clips, list(clips), [c.get("position") for c in clips],
+                playlist.get("updated_at"), playlist.get("metadata"))
+
+    @staticmethod
+    def _restore_clip_state(playlist: Dict, state: tuple):
+        """Roll a playlist back to a _clip_state() snapshot after a failed save."""
+        clips, items, positions, updated_at, metadata = state
+        clips[:] = items
+        for clip, position in zip(items, positions):
+            clip["position"] = position
+        playlist["clips"] = clips
+        playlist["updated_at"] = updated_at
+        playlist["metadata"] = metadata
 
     def remove_clip(self, playlist_id: str, clip_id: str) -> bool:
         """Remove a clip from playlist."""
@@ -222,18 +311,43 @@ class HorusPlaylistManager:
 
         playlist["clips"] = clips
         playlist["updated_at"] = self._get_timestamp()
-
-        # Update metadata
-        playlist["metadata"] = {
-            "clip_count": len(clips),
-            "total_frames": sum(
-                (c.get("frame_range", [0, 0])[1] - c.get("frame_range", [0, 0])[0] + 1)
-                for c in clips
-            )
-        }
+        self._update_metadata(playlist)
 
         return self.save_playlists()
 
+    def remove_clips(self, playlist_id: str, clip_ids: List[str]) -> int:
+        """Remove several clips from playlist with a single save. Returns number removed.
+
+        If the save fails the cached playlist is rolled back and 0 is returned.
+        """
+        playlist = self.get_playlist(playlist_id)
+        if not playlist:
+            return 0
+
+        remove_ids = set(clip_ids)
+        clips = playlist.get("clips", [])
+        kept = [c for c in clips if c.get("clip_id") not in remove_ids]
+        removed = len(clips) - len(kept)
+        if not removed:
+            return 0
+
+        state = self._clip_state(playlist)
+
+        # Reindex positions
+        for i, clip in enumerate(kept):
+            clip["position"] = i
+
+        # Mutate in place so callers holding the playlist dict see the change
+        clips[:] = kept
+        playlist["clips"] = clips
+        playlist["updated_at"] = self._get_timestamp()
+        self._update_metadata(playlist)
+
+        if self.save_playlists():
+            return removed
+        self._restore_clip_state(playlist, state)
+        return 0
+
     def reorder_clips(self, playlist_id: str, clip_order: List[str]) -> bool:
         """Reorder clips in playlist by providing ordered list of clip IDs."""
         playlist = self.get_playlist(playlist_id)
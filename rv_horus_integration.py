@@ -8,11 +8,30 @@ Integrates our modular MediaBrowser dock widgets with Horus's JSON database
 to display media data from the Horus application within Open RV.
 """
 
+import bisect
 import sys
 import os
 import json
+import logging
+import re
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+from PySide2.QtCore import (Qt, QAbstractListModel, QModelIndex, QObject, QPersistentModelIndex,
+                            QRunnable, QSignalBlocker, QSize, QThreadPool, QTimer, Signal, Slot)
+from PySide2.QtGui import QColor, QPainter
+from PySide2.QtWidgets import (QDialog, QFrame, QHBoxLayout, QInputDialog, QLabel, QListWidget,
+                               QMenu, QMessageBox, QPushButton, QStyle, QStyledItemDelegate,
+                               QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget)
+
+logger = logging.getLogger("horus.timeline_playlist")
+# Per-keystroke/per-row media browser diagnostics; debug level so they cost nothing by default
+media_logger = logging.getLogger("horus.media")
+
 print("Loading Open RV MediaBrowser with Horus integration...")
 
 # Import Horus File System backend
@@ -24,6 +43,12 @@ except ImportError as e:
     HORUS_FS_AVAILABLE = False
     print(f"⚠️ Horus File System module not available: {e}")
 
+# Open RV command API (imported once; absent when loaded outside RV)
+try:
+    import rv.commands as _rvc
+except ImportError:
+    _rvc = None
+
 # ============================================================================
 # UI State Management - Save/Restore dock positions, sizes, visibility
 # ============================================================================
@@ -473,6 +498,19 @@ annotations_popup_window = None
 # Horus File System - for real server access
 horus_fs = None
 
+_search_widget_cache = (None, None)  # (search_dock, search_dock.widget())
+
+
+def _get_search_widget():
+    """Return the Navigator panel widget, calling search_dock.widget() once per dock."""
+    global _search_widget_cache
+    dock, widget = _search_widget_cache
+    if dock is not search_dock or widget is None:
+        widget = search_dock.widget() if search_dock else None
+        _search_widget_cache = (search_dock, widget)
+    return widget
+
+
 # Horus Comment Manager
 horus_comments = None
 
@@ -499,10 +537,53 @@ USE_FILE_SYSTEM_BACKEND = True    # Use new file system backend instead of sampl
 timeline_playlist_data = []
 current_playlist_id = None
 
+# Timeline tracks panel (ruler/tracks are built lazily per selected playlist)
+timeline_tracks_panel = None
+
+# Playlist panel widgets (cached at creation so handlers skip dock/getattr lookups;
+# cleared when the panel is destroyed)
+_playlist_widget = None
+_playlist_search = None
+_playlist_completer = None
+_playlist_table = None
+_current_label = None
+
+
+def _register_playlist_widgets(widget, search, completer, table, label):
+    """Cache the playlist panel widgets; cleared when the panel is destroyed."""
+    global _playlist_widget, _playlist_search, _playlist_completer, _playlist_table, _current_label
+    _playlist_widget = widget
+    _playlist_search = search
+    _playlist_completer = completer
+    _playlist_table = table
+    _current_label = label
+
+    def _forget(*_args):
+        global _playlist_widget, _playlist_search, _playlist_completer, _playlist_table, _current_label
+        # A newer panel may already have registered its own widgets
+        if _playlist_widget is widget:
+            _playlist_widget = _playlist_search = _playlist_completer = None
+            _playlist_table = _current_label = None
+
+    widget.destroyed.connect(_forget)
+
+# Lookup indexes over timeline_playlist_data (rebuilt on every reload).
+# A name maps to its first playlist, like the linear scans they replace.
+_playlist_by_name = {}
+_playlist_by_name_lower = {}
+_playlist_by_id = {}
+
+# clip_id -> {ep}_{shot} table name, kept on the UI side (not in the clip dicts)
+_clip_display_names = {}
+
+# Playlist table rows are materialized in batches as the user scrolls
+PLAYLIST_ROW_BATCH = 100
+_playlist_pending_clips = []
+
 def create_comments_panel():
     """Create comments and annotations panel."""
     try:
-        from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
+        from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                                        QLabel, QPushButton, QFrame, QListWidget,
                                        QListWidgetItem, QSplitter, QLineEdit,
                                        QComboBox, QScrollArea, QGroupBox)
@@ -554,6 +635,8 @@ def create_comments_panel():
         comments_scroll.setFrameStyle(QFrame.NoFrame)  # Clean appearance
 
         comments_container = QWidget()
+        # One stylesheet for every comment/reply widget (see COMMENT_WIDGET_QSS)
+        comments_container.setStyleSheet(COMMENT_WIDGET_QSS)
         comments_container_layout = QVBoxLayout(comments_container)
         comments_container_layout.setContentsMargins(5, 5, 5, 5)
         comments_container_layout.setSpacing(10)
@@ -571,6 +654,19 @@ def create_comments_panel():
         placeholder_label.setAlignment(Qt.AlignCenter)
         comments_container_layout.addWidget(placeholder_label)
 
+        # Shown for media without comments; kept across reloads and toggled
+        no_comments_label = QLabel("No comments yet. Be the first to comment!")
+        no_comments_label.setStyleSheet("""
+            QLabel {
+                color: #888888;
+                font-style: italic;
+                padding: 20px;
+            }
+        """)
+        no_comments_label.setAlignment(Qt.AlignCenter)
+        no_comments_label.hide()
+        comments_container_layout.addWidget(no_comments_label)
+
         comments_container_layout.addStretch()
         comments_scroll.setWidget(comments_container)
 
@@ -621,6 +717,7 @@ def create_comments_panel():
         widget.annotations_popup_btn = annotations_popup_btn
         widget.comments_scroll = comments_scroll
         widget.comments_container = comments_container
+        widget.no_comments_label = no_comments_label
         widget.comment_text = comment_text
         widget.add_comment_btn = add_comment_btn
         widget.add_frame_comment_btn = add_frame_comment_btn
@@ -720,11 +817,67 @@ def create_sample_vfx_comments():
         }
     ]
 
+# comment/reply id -> (reply input QFrame, reply QTextEdit), so the reply
+# handlers don't search the comments dock with findChild()
+_reply_widgets = {}
+
+
+def _register_reply_widgets(comment_id, reply_input_frame, reply_text):
+    """Record the reply input widgets of a comment; dropped when the frame is destroyed."""
+    entry = (reply_input_frame, reply_text)
+    _reply_widgets[comment_id] = entry
+
+    def _forget(*_args):
+        # A reload may already have registered a newer widget for this id
+        if _reply_widgets.get(comment_id) is entry:
+            del _reply_widgets[comment_id]
+
+    reply_input_frame.destroyed.connect(_forget)
+
+
+# Comment and reply widget styling, keyed by the "commentRole" property. Set
+# once on the comments container (rather than on the QApplication, where the
+# panel's own apply_rv_styling() sheet would override it) instead of one
+# setStyleSheet() per label/button of every comment.
+COMMENT_WIDGET_QSS = """
+QLabel[commentRole="avatar"] {
+    background-color: #0078d7;
+    color: white;
+    border-radius: 14px;
+    font-weight: bold;
+    font-size: 11px;
+}
+QLabel[commentRole="replyAvatar"] {
+    background-color: #666666;
+    color: white;
+    border-radius: 10px;
+    font-weight: bold;
+    font-size: 9px;
+}
+QLabel[commentRole="user"] { font-weight: bold; color: #e0e0e0; }
+QLabel[commentRole="replyUser"] { font-weight: bold; color: #e0e0e0; font-size: 11px; }
+QLabel[commentRole="time"] { color: #888888; font-size: 10px; }
+QLabel[commentRole="replyTime"] { color: #888888; font-size: 9px; }
+QLabel[commentRole="frame"] { color: #0078d7; font-size: 10px; font-weight: bold; }
+QLabel[commentRole="priorityHigh"] { color: #ff4444; font-size: 10px; }
+QLabel[commentRole="priority"] { color: #ffaa00; font-size: 10px; }
+QLabel[commentRole="statusResolved"] { color: #44ff44; font-size: 10px; }
+QLabel[commentRole="status"] { color: #ffaa00; font-size: 10px; }
+QLabel[commentRole="text"] { color: #e0e0e0; padding: 2px 0px; }
+QLabel[commentRole="replyText"] { color: #e0e0e0; font-size: 11px; }
+QPushButton[commentRole="action"] { color: #888888; font-size: 10px; border: none; padding: 2px 4px; }
+QPushButton[commentRole="replyAction"] { color: #888888; font-size: 9px; border: none; padding: 1px 2px; }
+QPushButton[commentRole="replyInput"] { font-size: 10px; padding: 2px 4px; }
+QPushButton[commentRole="nestedReplyInput"] { font-size: 9px; padding: 1px 2px; }
+QFrame[commentRole="replyLine"] { background-color: #555555; }
+"""
+
+
 def create_comment_widget(comment_data):
     """Create a threaded comment widget following Facebook/Slack patterns."""
     try:
         from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                                       QPushButton, QFrame, QTextEdit)
+                                       QPushButton, QFrame)
         from PySide2.QtCore import Qt
 
         main_widget = QWidget()
@@ -742,15 +895,7 @@ def create_comment_widget(comment_data):
         avatar_label = QLabel(comment_data["avatar"])
         avatar_label.setFixedSize(28, 28)  # 15% smaller than original 32x32
         avatar_label.setAlignment(Qt.AlignCenter)
-        avatar_label.setStyleSheet("""
-            QLabel {
-                background-color: #0078d7;
-                color: white;
-                border-radius: 14px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-        """)
+        avatar_label.setProperty("commentRole", "avatar")
         comment_layout.addWidget(avatar_label)
 
         # Comment content
@@ -762,30 +907,30 @@ def create_comment_widget(comment_data):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         user_label = QLabel(comment_data["user"])
-        user_label.setStyleSheet("font-weight: bold; color: #e0e0e0;")
+        user_label.setProperty("commentRole", "user")
         header_layout.addWidget(user_label)
 
         time_label = QLabel(comment_data["time"])
-        time_label.setStyleSheet("color: #888888; font-size: 10px;")
+        time_label.setProperty("commentRole", "time")
         header_layout.addWidget(time_label)
 
         # Frame indicator if present
         if comment_data.get("frame"):
             frame_label = QLabel(f"Frame {comment_data['frame']}")
-            frame_label.setStyleSheet("color: #0078d7; font-size: 10px; font-weight: bold;")
+            frame_label.setProperty("commentRole", "frame")
             header_layout.addWidget(frame_label)
 
         # Priority and status if present
         if comment_data.get("priority"):
             priority_label = QLabel(f"Priority: {comment_data['priority']}")
-            priority_color = "#ff4444" if comment_data["priority"] == "High" else "#ffaa00"
-            priority_label.setStyleSheet(f"color: {priority_color}; font-size: 10px;")
+            priority_label.setProperty(
+                "commentRole", "priorityHigh" if comment_data["priority"] == "High" else "priority")
             header_layout.addWidget(priority_label)
 
         if comment_data.get("status"):
             status_label = QLabel(f"Status: {comment_data['status']}")
-            status_color = "#44ff44" if comment_data["status"] == "Resolved" else "#ffaa00"
-            status_label.setStyleSheet(f"color: {status_color}; font-size: 10px;")
+            status_label.setProperty(
+                "commentRole", "statusResolved" if comment_data["status"] == "Resolved" else "status")
             header_layout.addWidget(status_label)
 
         header_layout.addStretch()
@@ -794,7 +939,7 @@ def create_comment_widget(comment_data):
         # Comment text
         text_label = QLabel(comment_data["text"])
         text_label.setWordWrap(True)
-        text_label.setStyleSheet("color: #e0e0e0; padding: 2px 0px;")
+        text_label.setProperty("commentRole", "text")
         content_layout.addWidget(text_label)
 
         # Actions (likes, reply)
@@ -803,12 +948,12 @@ def create_comment_widget(comment_data):
 
         like_btn = QPushButton(f"Like {comment_data['likes']}")
         like_btn.setFlat(True)
-        like_btn.setStyleSheet("color: #888888; font-size: 10px; border: none; padding: 2px 4px;")
+        like_btn.setProperty("commentRole", "action")
         actions_layout.addWidget(like_btn)
 
         reply_btn = QPushButton("Reply")
         reply_btn.setFlat(True)
-        reply_btn.setStyleSheet("color: #888888; font-size: 10px; border: none; padding: 2px 4px;")
+        reply_btn.setProperty("commentRole", "action")
         reply_btn.setObjectName(f"reply_btn_{comment_data['id']}")
         actions_layout.addWidget(reply_btn)
 
@@ -835,19 +980,20 @@ def create_comment_widget(comment_data):
         post_reply_btn = QPushButton("Post Reply")
         post_reply_btn.setObjectName(f"post_reply_{comment_data['id']}")
         post_reply_btn.setMaximumWidth(80)
-        post_reply_btn.setStyleSheet("font-size: 10px; padding: 2px 4px;")
+        post_reply_btn.setProperty("commentRole", "replyInput")
         reply_buttons_layout.addWidget(post_reply_btn)
 
         cancel_reply_btn = QPushButton("Cancel")
         cancel_reply_btn.setObjectName(f"cancel_reply_{comment_data['id']}")
         cancel_reply_btn.setMaximumWidth(50)
-        cancel_reply_btn.setStyleSheet("font-size: 10px; padding: 2px 4px;")
+        cancel_reply_btn.setProperty("commentRole", "replyInput")
         reply_buttons_layout.addWidget(cancel_reply_btn)
 
         reply_buttons_layout.addStretch()
         reply_input_layout.addLayout(reply_buttons_layout)
 
         content_layout.addWidget(reply_input_frame)
+        _register_reply_widgets(comment_data['id'], reply_input_frame, reply_text)
 
         # Connect reply button signals
         reply_btn.clicked.connect(lambda: show_reply_input(comment_data['id']))
@@ -873,7 +1019,7 @@ def create_reply_widget(reply_data):
     """Create a reply widget with indentation."""
     try:
         from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                                       QPushButton, QFrame, QTextEdit)
+                                       QPushButton, QFrame)
         from PySide2.QtCore import Qt
 
         reply_widget = QWidget()
@@ -884,7 +1030,7 @@ def create_reply_widget(reply_data):
         # Connecting line
         line_frame = QFrame()
         line_frame.setFixedWidth(2)
-        line_frame.setStyleSheet("background-color: #555555;")
+        line_frame.setProperty("commentRole", "replyLine")
         reply_layout.addWidget(line_frame)
 
         # Reply content
@@ -897,15 +1043,7 @@ def create_reply_widget(reply_data):
         avatar_label = QLabel(reply_data["avatar"])
         avatar_label.setFixedSize(20, 20)  # 15% smaller than original 24x24
         avatar_label.setAlignment(Qt.AlignCenter)
-        avatar_label.setStyleSheet("""
-            QLabel {
-                background-color: #666666;
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 9px;
-            }
-        """)
+        avatar_label.setProperty("commentRole", "replyAvatar")
         content_layout.addWidget(avatar_label)
 
         # Reply text content
@@ -917,11 +1055,11 @@ def create_reply_widget(reply_data):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         user_label = QLabel(reply_data["user"])
-        user_label.setStyleSheet("font-weight: bold; color: #e0e0e0; font-size: 11px;")
+        user_label.setProperty("commentRole", "replyUser")
         header_layout.addWidget(user_label)
 
         time_label = QLabel(reply_data["time"])
-        time_label.setStyleSheet("color: #888888; font-size: 9px;")
+        time_label.setProperty("commentRole", "replyTime")
         header_layout.addWidget(time_label)
 
         header_layout.addStretch()
@@ -930,7 +1068,7 @@ def create_reply_widget(reply_data):
         # Reply text
         text_label = QLabel(reply_data["text"])
         text_label.setWordWrap(True)
-        text_label.setStyleSheet("color: #e0e0e0; font-size: 11px;")
+        text_label.setProperty("commentRole", "replyText")
         text_content_layout.addWidget(text_label)
 
         # Reply actions
@@ -939,12 +1077,12 @@ def create_reply_widget(reply_data):
 
         like_btn = QPushButton(f"Like {reply_data['likes']}")
         like_btn.setFlat(True)
-        like_btn.setStyleSheet("color: #888888; font-size: 9px; border: none; padding: 1px 2px;")
+        like_btn.setProperty("commentRole", "replyAction")
         actions_layout.addWidget(like_btn)
 
         reply_btn = QPushButton("Reply")
         reply_btn.setFlat(True)
-        reply_btn.setStyleSheet("color: #888888; font-size: 9px; border: none; padding: 1px 2px;")
+        reply_btn.setProperty("commentRole", "replyAction")
         reply_btn.setObjectName(f"reply_btn_{reply_data['id']}")
         actions_layout.addWidget(reply_btn)
 
@@ -971,19 +1109,20 @@ def create_reply_widget(reply_data):
         post_reply_btn = QPushButton("Post")
         post_reply_btn.setObjectName(f"post_reply_{reply_data['id']}")
         post_reply_btn.setMaximumWidth(40)
-        post_reply_btn.setStyleSheet("font-size: 9px; padding: 1px 2px;")
+        post_reply_btn.setProperty("commentRole", "nestedReplyInput")
         reply_buttons_layout.addWidget(post_reply_btn)
 
         cancel_reply_btn = QPushButton("Cancel")
         cancel_reply_btn.setObjectName(f"cancel_reply_{reply_data['id']}")
         cancel_reply_btn.setMaximumWidth(45)
-        cancel_reply_btn.setStyleSheet("font-size: 9px; padding: 1px 2px;")
+        cancel_reply_btn.setProperty("commentRole", "nestedReplyInput")
         reply_buttons_layout.addWidget(cancel_reply_btn)
 
         reply_buttons_layout.addStretch()
         reply_input_layout.addLayout(reply_buttons_layout)
 
         text_content_layout.addWidget(reply_input_frame)
+        _register_reply_widgets(reply_data['id'], reply_input_frame, reply_text)
 
         # Connect reply button signals
         reply_btn.clicked.connect(lambda: show_reply_input(reply_data['id']))
@@ -999,6 +1138,29 @@ def create_reply_widget(reply_data):
         print(f"Error creating reply widget: {e}")
         return QWidget()
 
+_GLYPH_ICONS = {}  # glyph -> QIcon, rendered once
+
+
+def _glyph_icon(glyph, size=16, color="#e0e0e0"):
+    """Return a cached QIcon with a text glyph rendered into a pixmap.
+
+    Buttons then blit the pixmap instead of shaping the glyph on every repaint.
+    """
+    key = (glyph, size, color)
+    icon = _GLYPH_ICONS.get(key)
+    if icon is None:
+        from PySide2.QtGui import QIcon, QPixmap
+
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(QColor(color))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        icon = _GLYPH_ICONS[key] = QIcon(pixmap)
+    return icon
+
+
 def create_playlist_panel():
     """Create Playlist Manager panel with search (top) + items table (bottom).
 
@@ -1044,12 +1206,14 @@ def create_playlist_panel():
         """)
 
         # Create completer with an EMPTY model first (will be populated after data loads)
-        from PySide2.QtCore import QStringListModel
+        # The one model is kept for the panel's lifetime and updated via setStringList()
         playlist_model = QStringListModel([])
 
         playlist_completer = QCompleter(playlist_model)
         playlist_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        playlist_completer.setFilterMode(Qt.MatchContains)
+        playlist_completer.setFilterMode(Qt.MatchStartsWith)
+        # Names are kept sorted so the completer can binary-search prefixes
+        playlist_completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
         playlist_completer.setCompletionMode(QCompleter.PopupCompletion)
         playlist_completer.setMaxVisibleItems(10)
         playlist_completer.setWidget(playlist_search)  # Explicitly set widget
@@ -1105,17 +1269,20 @@ def create_playlist_panel():
         new_btn.clicked.connect(create_new_playlist)
         controls_layout.addWidget(new_btn)
 
-        rename_btn = QPushButton("✎ Rename")
+        rename_btn = QPushButton("Rename")
+        rename_btn.setIcon(_glyph_icon("✎"))
         rename_btn.setStyleSheet(btn_style)
         rename_btn.clicked.connect(rename_current_playlist)
         controls_layout.addWidget(rename_btn)
 
-        delete_btn = QPushButton("✕ Delete")
+        delete_btn = QPushButton("Delete")
+        delete_btn.setIcon(_glyph_icon("✕"))
         delete_btn.setStyleSheet(btn_style)
         delete_btn.clicked.connect(delete_current_playlist)
         controls_layout.addWidget(delete_btn)
 
-        play_btn = QPushButton("▶ Play All")
+        play_btn = QPushButton("Play All")
+        play_btn.setIcon(_glyph_icon("▶"))
         play_btn.setStyleSheet(btn_style.replace("#404040", "#0078d4"))
         play_btn.clicked.connect(play_current_playlist)
         controls_layout.addWidget(play_btn)
@@ -1164,7 +1331,9 @@ def create_playlist_panel():
 
         playlist_table.verticalHeader().setDefaultSectionSize(25)
 
-        # No custom stylesheet - use Qt defaults to match Navigator 100%
+        # No custom table stylesheet - use Qt defaults to match Navigator 100%;
+        # only the status dropdowns in column 3 are styled, once for all rows
+        playlist_table.setStyleSheet(STATUS_COMBO_STYLE)
 
         # Context menu for right-click
         playlist_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -1173,6 +1342,12 @@ def create_playlist_panel():
         # Double-click to load in RV
         playlist_table.itemDoubleClicked.connect(on_playlist_item_double_click)
 
+        # Materialize remaining rows on demand (near bottom of scroll, or all on sort)
+        playlist_table.verticalScrollBar().valueChanged.connect(on_playlist_table_scrolled)
+        playlist_table.verticalScrollBar().rangeChanged.connect(
+            lambda *_: fill_playlist_table_viewport())
+        header.sortIndicatorChanged.connect(lambda *_: fetch_more_playlist_rows(all_rows=True))
+
         layout.addWidget(playlist_table, 1)  # Stretch factor 1
 
         # ===== Connect signals =====
@@ -1186,66 +1361,147 @@ def create_playlist_panel():
         widget.current_label = current_label
         widget.playlist_table = playlist_table
 
-        # Load initial data
-        load_timeline_playlist_data()
-
-        # Populate autocomplete with loaded playlists
-        # Update the existing model (created earlier) with playlist names
-        playlist_names = []
-        if timeline_playlist_data:
-            for playlist in timeline_playlist_data:
-                name = playlist.get("name", "Unnamed")
-                playlist_names.append(name)
-
-        print(f"📋 Populating autocomplete model with playlists: {playlist_names}")
+        # Cache widget references for the playlist handlers
+        _register_playlist_widgets(widget, playlist_search, playlist_completer,
+                                   playlist_table, current_label)
 
-        # Update the model that's already attached to the completer
-        model = playlist_search._playlist_model
-        model.setStringList(playlist_names)
-
-        # Store additional reference on widget
-        widget._autocomplete_model = model
+        # Store model reference on widget
+        widget._autocomplete_model = playlist_search._playlist_model
 
-        print(f"✅ Initial autocomplete populated with {len(playlist_names)} playlists")
-        print(f"   Model row count: {model.rowCount()}")
+        # Load initial data off the UI thread; autocomplete is populated when it arrives
+        current_label.setText("📋 Loading playlists...")
+        load_timeline_playlist_data_async()
 
         print("✅ Playlist Manager panel created successfully")
         return widget
 
     except Exception as e:
-        print(f"Error creating Playlist Manager panel: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error creating Playlist Manager panel: %s", e)
         return None
 
+# Static styling for the timeline playlist panels, keyed by objectName and set
+# on each panel's root widget (not the QApplication, which would restyle the
+# whole host app) instead of per-widget setStyleSheet calls
+TIMELINE_PANEL_QSS = """
+QFrame#TimelinePlaylistHeader {
+    background-color: #2d2d2d;
+    border-bottom: 1px solid #555555;
+}
+QFrame#TimelinePlaylistHeader QLabel {
+    color: #e0e0e0;
+    font-weight: bold;
+    font-size: 14px;
+}
+QFrame#TimelinePlaylistHeader QPushButton {
+    background-color: #404040;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    padding: 5px 10px;
+    border-radius: 3px;
+}
+QFrame#TimelinePlaylistHeader QPushButton:hover {
+    background-color: #4a4a4a;
+    border-color: #0078d4;
+}
+QLabel#PlaylistTreeHeader {
+    font-weight: bold;
+    color: #e0e0e0;
+    font-size: 12px;
+}
+QTreeWidget#PlaylistTree {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    selection-background-color: #0078d4;
+    outline: none;
+}
+QTreeWidget#PlaylistTree::item {
+    padding: 4px;
+    border-bottom: 1px solid #3a3a3a;
+}
+QTreeWidget#PlaylistTree::item:selected {
+    background-color: #0078d4;
+    color: white;
+}
+QTreeWidget#PlaylistTree::item:hover {
+    background-color: #404040;
+}
+QFrame#PlaylistTreeControls {
+    background-color: #3a3a3a;
+    border: 1px solid #555555;
+    border-radius: 3px;
+}
+QFrame#PlaylistTreeControls QPushButton {
+    background-color: #404040;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    padding: 4px 8px;
+    border-radius: 2px;
+    font-size: 11px;
+}
+QFrame#PlaylistTreeControls QPushButton:hover {
+    background-color: #4a4a4a;
+    border-color: #0078d4;
+}
+QFrame#TimelineTracksHeader {
+    background-color: #2d2d2d;
+    border-bottom: 1px solid #555555;
+}
+QFrame#TimelineTracksHeader QLabel {
+    color: #e0e0e0;
+    font-size: 11px;
+}
+QLabel#TimelineCurrentPlaylist {
+    font-weight: bold;
+}
+QFrame#TimelineTracksHeader QPushButton {
+    background-color: #404040;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    padding: 3px 8px;
+    border-radius: 2px;
+    font-size: 10px;
+}
+QFrame#TimelineTracksHeader QPushButton:hover {
+    background-color: #4a4a4a;
+    border-color: #0078d4;
+}
+QFrame#TimelineTracksHeader QComboBox {
+    background-color: #404040;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    padding: 2px 5px;
+    border-radius: 2px;
+    font-size: 10px;
+}
+QLabel#TimelineEmptyLabel {
+    color: #888888;
+    font-size: 14px;
+    padding: 20px;
+}
+QFrame#TimelineTrack {
+    background-color: #2d2d2d;
+    border-bottom: 1px solid #555555;
+}
+QLabel#TimelineTrackLabel {
+    background-color: #3a3a3a;
+    color: #e0e0e0;
+    padding: 0px;
+    border-right: 1px solid #555555;
+    font-size: 11px;
+    font-weight: bold;
+}
+"""
+
+
 def create_timeline_playlist_header():
     """Create header with title and main controls."""
     from PySide2.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
 
     header = QFrame()
+    header.setObjectName("TimelinePlaylistHeader")
+    header.setStyleSheet(TIMELINE_PANEL_QSS)
     header.setFixedHeight(40)
-    header.setStyleSheet("""
-        QFrame {
-            background-color: #2d2d2d;
-            border-bottom: 1px solid #555555;
-        }
-        QLabel {
-            color: #e0e0e0;
-            font-weight: bold;
-            font-size: 14px;
-        }
-        QPushButton {
-            background-color: #404040;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 5px 10px;
-            border-radius: 3px;
-        }
-        QPushButton:hover {
-            background-color: #4a4a4a;
-            border-color: #0078d4;
-        }
-    """)
 
     layout = QHBoxLayout(header)
     layout.setContentsMargins(10, 5, 10, 5)
@@ -1276,6 +1532,7 @@ def create_playlist_tree_panel():
     from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeWidget, QAbstractItemView, QFrame, QGridLayout, QPushButton
 
     panel = QWidget()
+    panel.setStyleSheet(TIMELINE_PANEL_QSS)
     panel.setMinimumWidth(250)
     panel.setMaximumWidth(400)
 
@@ -1285,7 +1542,7 @@ def create_playlist_tree_panel():
 
     # Playlist tree header
     tree_header = QLabel("Playlists")
-    tree_header.setStyleSheet("font-weight: bold; color: #e0e0e0; font-size: 12px;")
+    tree_header.setObjectName("PlaylistTreeHeader")
     layout.addWidget(tree_header)
 
     # Playlist tree widget
@@ -1295,27 +1552,8 @@ def create_playlist_tree_panel():
     playlist_tree.setSelectionMode(QAbstractItemView.SingleSelection)
     playlist_tree.setDragDropMode(QAbstractItemView.InternalMove)
 
-    # Setup tree styling
-    playlist_tree.setStyleSheet("""
-        QTreeWidget {
-            background-color: #2d2d2d;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            selection-background-color: #0078d4;
-            outline: none;
-        }
-        QTreeWidget::item {
-            padding: 4px;
-            border-bottom: 1px solid #3a3a3a;
-        }
-        QTreeWidget::item:selected {
-            background-color: #0078d4;
-            color: white;
-        }
-        QTreeWidget::item:hover {
-            background-color: #404040;
-        }
-    """)
+    # Setup tree styling (TIMELINE_PANEL_QSS)
+    playlist_tree.setObjectName("PlaylistTree")
 
     # Connect selection handler
     playlist_tree.itemSelectionChanged.connect(on_playlist_tree_selection_changed)
@@ -1325,26 +1563,8 @@ def create_playlist_tree_panel():
 
     # Playlist controls
     controls = QFrame()
+    controls.setObjectName("PlaylistTreeControls")
     controls.setFixedHeight(56)  # Reduced by 30% (80 * 0.7 = 56)
-    controls.setStyleSheet("""
-        QFrame {
-            background-color: #3a3a3a;
-            border: 1px solid #555555;
-            border-radius: 3px;
-        }
-        QPushButton {
-            background-color: #404040;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 4px 8px;
-            border-radius: 2px;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #4a4a4a;
-            border-color: #0078d4;
-        }
-    """)
 
     controls_layout = QGridLayout(controls)
     controls_layout.setContentsMargins(5, 5, 5, 5)
@@ -1376,11 +1596,17 @@ def create_playlist_tree_panel():
     return panel
 
 def create_timeline_tracks_panel():
-    """Create right panel with timeline tracks."""
+    """Create right panel with timeline tracks.
+
+    Only the empty placeholder is built here; ruler and track widgets are
+    created on demand by rebuild_timeline_tracks() when a playlist is selected.
+    """
+    global timeline_tracks_panel
     from PySide2.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel, QFrame, QHBoxLayout, QPushButton, QComboBox
     from PySide2.QtCore import Qt
 
     panel = QWidget()
+    panel.setStyleSheet(TIMELINE_PANEL_QSS)
 
     layout = QVBoxLayout(panel)
     layout.setContentsMargins(5, 5, 5, 5)
@@ -1388,54 +1614,27 @@ def create_timeline_tracks_panel():
 
     # Timeline header with controls
     timeline_header = QFrame()
+    timeline_header.setObjectName("TimelineTracksHeader")
     timeline_header.setFixedHeight(40)  # Original demo size - more spacious
-    timeline_header.setStyleSheet("""
-        QFrame {
-            background-color: #2d2d2d;
-            border-bottom: 1px solid #555555;
-        }
-        QLabel {
-            color: #e0e0e0;
-            font-size: 11px;
-        }
-        QPushButton {
-            background-color: #404040;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 3px 8px;
-            border-radius: 2px;
-            font-size: 10px;
-        }
-        QPushButton:hover {
-            background-color: #4a4a4a;
-            border-color: #0078d4;
-        }
-        QComboBox {
-            background-color: #404040;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 2px 5px;
-            border-radius: 2px;
-            font-size: 10px;
-        }
-    """)
 
     header_layout = QHBoxLayout(timeline_header)
     header_layout.setContentsMargins(10, 5, 10, 5)
 
     # Current playlist name
     current_playlist_label = QLabel("No playlist selected")
-    current_playlist_label.setStyleSheet("font-weight: bold;")
+    current_playlist_label.setObjectName("TimelineCurrentPlaylist")
     header_layout.addWidget(current_playlist_label)
 
     header_layout.addStretch()
 
     # Timeline controls
-    play_btn = QPushButton("▶ Play")
+    play_btn = QPushButton("Play")
+    play_btn.setIcon(_glyph_icon("▶"))
     play_btn.clicked.connect(play_current_playlist)
     header_layout.addWidget(play_btn)
 
-    stop_btn = QPushButton("⏹ Stop")
+    stop_btn = QPushButton("Stop")
+    stop_btn.setIcon(_glyph_icon("⏹"))
     stop_btn.clicked.connect(stop_playlist_playback)
     header_layout.addWidget(stop_btn)
 
@@ -1465,14 +1664,7 @@ def create_timeline_tracks_panel():
 
     # Add empty message initially
     empty_label = QLabel("Select a playlist to view timeline")
-    empty_label.setStyleSheet("""
-        QLabel {
-            color: #888888;
-            font-size: 14px;
-            padding: 20px;
-            text-align: center;
-        }
-    """)
+    empty_label.setObjectName("TimelineEmptyLabel")
     empty_label.setAlignment(Qt.AlignCenter)
     timeline_layout.addWidget(empty_label)
 
@@ -1485,9 +1677,117 @@ def create_timeline_tracks_panel():
     panel.timeline_content = timeline_content
     panel.timeline_layout = timeline_layout
     panel.scroll_area = scroll_area
+    panel.empty_label = empty_label
+    panel.rebuild_timeline = lambda clips, tracks=None: rebuild_timeline_tracks(panel, clips, tracks)
 
+    timeline_tracks_panel = panel
     return panel
 
+
+def rebuild_timeline_tracks(panel, clips, tracks=None):
+    """Replace the timeline content with a ruler and track widgets for clips."""
+    layout = panel.timeline_layout
+    empty_label = panel.empty_label
+
+    # Clear previous ruler/tracks (keep the placeholder label alive)
+    while layout.count():
+        item = layout.takeAt(0)
+        child = item.widget()
+        if child is not None and child is not empty_label:
+            child.deleteLater()
+
+    if not clips:
+        layout.addWidget(empty_label)
+        empty_label.show()
+        return
+
+    empty_label.hide()
+    records = [TimelineClip.from_dict(clip) for clip in clips]
+    total_duration, clips_by_track = _index_timeline_clips(records)
+    layout.addWidget(create_timeline_ruler(clips, total_duration))
+
+    # Playlists without explicit tracks get a single track holding every clip
+    if not tracks:
+        tracks = [{"track_id": None, "name": "Clips"}]
+        clips_by_track = {None: sorted(records, key=_clip_position)}
+    for track_data in tracks:
+        track_clips = clips_by_track.get(track_data.get("track_id"), [])
+        layout.addWidget(create_timeline_track_widget(track_data, track_clips, presorted=True))
+
+    layout.addStretch()
+
+
+class TimelineClip:
+    """Compact read-only view of a playlist clip for timeline rendering.
+
+    Built once per timeline rebuild so the track/clip widgets use attribute
+    access instead of repeated dict.get() calls. The source dict is kept in
+    `data` (it is what gets saved and passed to click handlers).
+    """
+
+    __slots__ = ("position", "duration", "track", "department", "sequence",
+                 "shot", "version", "data")
+
+    def __init__(self, position, duration, track, department, sequence, shot, version, data):
+        self.position = position
+        self.duration = duration
+        self.track = track
+        self.department = department
+        self.sequence = sequence
+        self.shot = shot
+        self.version = version
+        self.data = data
+
+    @classmethod
+    def from_dict(cls, clip):
+        """Create from a playlist clip dict."""
+        return cls(
+            clip.get("position", 0),
+            clip.get("duration", 0),
+            clip.get("track"),
+            clip.get("department", "unknown"),
+            clip.get("sequence", ""),
+            clip.get("shot", ""),
+            clip.get("version", "v001"),
+            clip,
+        )
+
+
+def _clip_position(clip):
+    """Sort key for timeline clips."""
+    return clip.position
+
+
+def _index_timeline_clips(clips):
+    """Compute total duration and per-track clips sorted by position in one pass.
+
+    clips are TimelineClip records.
+    """
+    total_duration = 0
+    clips_by_track = {}
+    for clip in clips:
+        end = clip.position + clip.duration
+        if end > total_duration:
+            total_duration = end
+        clips_by_track.setdefault(clip.track, []).append(clip)
+
+    for track_clips in clips_by_track.values():
+        track_clips.sort(key=_clip_position)
+
+    return total_duration, clips_by_track
+
+
+def load_playlist_timeline(playlist):
+    """Build the timeline tracks for a playlist if the tracks panel exists."""
+    if timeline_tracks_panel is None:
+        return
+
+    try:
+        timeline_tracks_panel.current_playlist_label.setText(playlist.get("name", "Unnamed"))
+        timeline_tracks_panel.rebuild_timeline(playlist.get("clips", []), playlist.get("tracks", []))
+    except Exception as e:
+        logger.exception("Error building playlist timeline: %s", e)
+
 def _ensure_playlist_manager():
     """Ensure playlist manager is initialized with file system."""
     global horus_playlists, horus_fs
@@ -1499,10 +1799,72 @@ def _ensure_playlist_manager():
     # Always ensure file system is set
     if horus_fs and horus_playlists.fs is None:
         horus_playlists.set_file_system(horus_fs)
+        _watch_playlists_file()
 
     return horus_playlists
 
 
+_playlists_file_watcher = None
+PLAYLIST_SELF_SAVE_GRACE = 2.0  # Seconds to ignore file changes after our own save
+
+
+def _watch_playlists_file():
+    """Watch playlists.json so edits from other sessions trigger a reload."""
+    global _playlists_file_watcher
+
+    try:
+        if not horus_fs or horus_fs.access_mode != "local":
+            return  # QFileSystemWatcher only works on locally mounted paths
+
+        path = horus_fs.get_playlists_file_path()
+        if not os.path.exists(path):
+            return
+
+        from PySide2.QtCore import QFileSystemWatcher
+
+        if _playlists_file_watcher is None:
+            _playlists_file_watcher = QFileSystemWatcher()
+            _playlists_file_watcher.fileChanged.connect(on_playlists_file_changed)
+
+        old_files = _playlists_file_watcher.files()
+        if old_files:
+            _playlists_file_watcher.removePaths(old_files)
+        _playlists_file_watcher.addPath(path)
+        print(f"👁️ Watching playlists file: {path}")
+
+    except Exception as e:
+        print(f"⚠️ Could not watch playlists file: {e}")
+
+
+@Slot(str)
+def on_playlists_file_changed(path):
+    """Reload playlists only when playlists.json changed outside this session."""
+    # Editors that replace the file drop it from the watch list
+    if _playlists_file_watcher is not None and path not in _playlists_file_watcher.files():
+        if os.path.exists(path):
+            _playlists_file_watcher.addPath(path)
+
+    pm = horus_playlists
+    if pm is None:
+        return
+
+    # Our own saves also touch the file; the in-memory cache is already current
+    if time.monotonic() - pm.last_saved_at < PLAYLIST_SELF_SAVE_GRACE:
+        return
+
+    print(f"📋 Playlists file changed externally, reloading: {path}")
+    load_timeline_playlist_data_async(refresh=True, on_done=_reload_current_playlist_table)
+
+
+def _reload_current_playlist_table():
+    """Re-show the selected playlist after a reload (or clear it if it is gone)."""
+    playlist = _playlist_by_id.get(current_playlist_id)
+    if playlist:
+        load_playlist_items_to_table(playlist)
+    elif current_playlist_id:
+        clear_playlist_table()
+
+
 def load_timeline_playlist_data():
     """Load playlist data using HorusPlaylistManager backend."""
     global timeline_playlist_data, horus_playlists
@@ -1520,22 +1882,221 @@ def load_timeline_playlist_data():
             print(f"   Playlist file path: {playlist_path}")
 
         # Load playlists from backend
-        timeline_playlist_data = horus_playlists.load_playlists()
+        _reload_playlists()
 
         if timeline_playlist_data:
             print(f"✅ Loaded {len(timeline_playlist_data)} playlists from backend")
             for playlist in timeline_playlist_data:
-                clip_count = len(playlist.get('clips', []))
+                clip_count = _playlist_clip_count(playlist)
                 print(f"   - {playlist.get('name', 'Unnamed')} ({clip_count} clips)")
         else:
-            timeline_playlist_data = []
             print("📋 No playlists found, starting fresh")
 
     except Exception as e:
-        print(f"❌ Error loading playlist data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error loading playlist data: %s", e)
         timeline_playlist_data = []
+        _rebuild_playlist_index()
+
+
+def _reload_playlists():
+    """Refresh timeline_playlist_data from the playlist manager and reindex.
+
+    Use this instead of assigning timeline_playlist_data directly so the
+    name/id lookup dicts never drift from the data. The list is the manager's
+    own cache, so single-playlist mutations only need _index_playlist() /
+    _unindex_playlist() rather than a full reload.
+    """
+    global timeline_playlist_data
+
+    pm = _ensure_playlist_manager()
+    timeline_playlist_data = pm.load_playlists()
+    _rebuild_playlist_index()
+    return timeline_playlist_data
+
+
+def _rebuild_playlist_index():
+    """Rebuild the name/id lookup dicts from timeline_playlist_data."""
+    global _playlist_by_name, _playlist_by_name_lower, _playlist_by_id
+
+    playlists = timeline_playlist_data or []
+    _playlist_by_name = {}
+    _playlist_by_name_lower = {}
+    for playlist in playlists:
+        name = playlist.get("name", "")
+        _playlist_by_name.setdefault(name, playlist)
+        _playlist_by_name_lower.setdefault(name.lower(), playlist)
+    _playlist_by_id = {p.get("_id"): p for p in playlists}
+    _clip_display_names.clear()  # clips may have changed on disk
+
+
+def _index_playlist(playlist):
+    """Add or refresh one playlist in the name/id lookup dicts."""
+    if not playlist:
+        return
+    name = playlist.get("name", "")
+    _playlist_by_name.setdefault(name, playlist)
+    _playlist_by_name_lower.setdefault(name.lower(), playlist)
+    _playlist_by_id[playlist.get("_id")] = playlist
+
+
+def _unindex_playlist(playlist):
+    """Drop one playlist from the name/id lookup dicts.
+
+    If another playlist shares its name, the first such one takes over.
+    """
+    if not playlist:
+        return
+    name = playlist.get("name", "")
+    name_lower = name.lower()
+    if _playlist_by_name.get(name) is playlist:
+        del _playlist_by_name[name]
+    if _playlist_by_name_lower.get(name_lower) is playlist:
+        del _playlist_by_name_lower[name_lower]
+    _playlist_by_id.pop(playlist.get("_id"), None)
+
+    for other in timeline_playlist_data or []:
+        if other is playlist:
+            continue
+        other_name = other.get("name", "")
+        if other_name == name:
+            _playlist_by_name.setdefault(name, other)
+        if other_name.lower() == name_lower:
+            _playlist_by_name_lower.setdefault(name_lower, other)
+
+
+def _playlist_clip_count(playlist):
+    """Clip count for labels, from the metadata the playlist manager keeps current."""
+    metadata = playlist.get("metadata")
+    if metadata and "clip_count" in metadata:
+        return metadata["clip_count"]
+    return len(playlist.get("clips", []))
+
+
+def _clip_display_name(clip):
+    """Format a clip name as {ep}_{shot} (same as Navigator), e.g. "Ep02_SH0010"."""
+    episode = clip.get("episode", "")
+    shot = clip.get("shot", clip.get("name", "Unknown"))
+    if episode and shot:
+        return f"{episode}_{shot}"
+    elif shot:
+        return shot
+    return clip.get("name", "Unknown")
+
+
+def _cached_clip_display_name(clip):
+    """_clip_display_name(), formatted once per clip_id."""
+    clip_id = clip.get("clip_id")
+    name = _clip_display_names.get(clip_id) if clip_id else None
+    if name is None:
+        name = _clip_display_name(clip)
+        if clip_id:
+            _clip_display_names[clip_id] = name
+    return name
+
+
+class PlaylistLoaderSignals(QObject):
+    """Signals for PlaylistLoader (QRunnable is not a QObject)."""
+    finished = Signal(object)  # (loader, playlists)
+
+
+class PlaylistLoader(QRunnable):
+    """Read playlists from storage on a QThreadPool worker thread.
+
+    The worker never touches the manager's cache; on_playlists_loaded()
+    installs the result on the UI thread.
+    """
+
+    def __init__(self, generation, playlist_manager, refresh=False, on_done=None):
+        super().__init__()
+        self.generation = generation
+        self.playlist_manager = playlist_manager
+        self.revision = playlist_manager.revision  # cache state the read started from
+        self.refresh = refresh
+        self.on_done = [on_done] if on_done else []  # callbacks, run in order
+        self.signals = PlaylistLoaderSignals()
+
+    def run(self):
+        try:
+            fs = self.playlist_manager.fs
+            playlists = fs.load_playlists() if fs else []
+        except Exception as e:
+            logger.exception("Error loading playlists in background: %s", e)
+            playlists = []
+        self.signals.finished.emit((self, playlists or []))
+
+
+_playlist_load_generation = 0  # bumped per load; older results are dropped
+_playlist_loaders = {}  # generation -> in-flight loader (keeps it and its signals alive)
+
+
+def load_timeline_playlist_data_async(refresh=False, on_done=None):
+    """Load playlist data in the background and refresh the UI when done.
+
+    refresh=True re-reads storage instead of using the manager's cache.
+    on_done() is called on the UI thread after the index and autocomplete
+    have been updated.
+    """
+    global _playlist_load_generation
+
+    try:
+        pm = _ensure_playlist_manager()
+        _playlist_load_generation += 1
+        loader = PlaylistLoader(_playlist_load_generation, pm, refresh=refresh, on_done=on_done)
+
+        # Loads still in flight will be dropped; this one takes over their work
+        for pending in _playlist_loaders.values():
+            loader.refresh = loader.refresh or pending.refresh
+            loader.on_done[:0] = pending.on_done
+            pending.on_done = []
+
+        loader.signals.finished.connect(on_playlists_loaded)
+        _playlist_loaders[_playlist_load_generation] = loader
+        QThreadPool.globalInstance().start(loader)
+        print("📋 Loading playlists in background...")
+    except Exception as e:
+        logger.exception("Error starting playlist loader: %s", e)
+        # Fall back to synchronous load
+        if refresh and horus_playlists:
+            horus_playlists.refresh()
+        load_timeline_playlist_data()
+        _refresh_playlist_ui()
+        if on_done:
+            on_done()
+
+
+@Slot(object)
+def on_playlists_loaded(result):
+    """Receive a PlaylistLoader result on the UI thread."""
+    loader, playlists = result
+    _playlist_loaders.pop(loader.generation, None)
+
+    # A newer load was started while this one ran and took over its on_done
+    if loader.generation != _playlist_load_generation:
+        return
+
+    # Install what the worker read, unless playlists were edited (and saved)
+    # meanwhile; a plain load also keeps a cache that is already there
+    pm = _ensure_playlist_manager()
+    if pm.revision == loader.revision and (loader.refresh or not pm.is_loaded()):
+        pm.set_cache(playlists)
+
+    _refresh_playlist_ui()
+
+    for callback in loader.on_done:
+        callback()
+
+
+def _refresh_playlist_ui():
+    """Reindex the manager's playlists and update the autocomplete and label."""
+    # The manager's cache is the source of truth; index that list rather than a copy
+    _reload_playlists()
+    print(f"✅ Loaded {len(timeline_playlist_data)} playlists from backend")
+
+    update_playlist_autocomplete()
+
+    if not current_playlist_id and _current_label is not None:
+        _current_label.setText("📋 Current: No playlist selected")
+
 
 def save_timeline_playlist_data():
     """Save playlist data using HorusPlaylistManager backend."""
@@ -1551,116 +2112,118 @@ def save_timeline_playlist_data():
             print("❌ Failed to save playlist data")
 
     except Exception as e:
-        print(f"❌ Error saving playlist data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error saving playlist data: %s", e)
 
 def update_playlist_autocomplete():
     """Update the playlist search autocomplete with available playlists."""
-    global timeline_playlist_dock, timeline_playlist_data
+    global timeline_playlist_data
 
     print(f"📋 update_playlist_autocomplete called:")
-    print(f"   timeline_playlist_dock: {timeline_playlist_dock}")
     print(f"   timeline_playlist_data: {len(timeline_playlist_data) if timeline_playlist_data else 0} playlists")
 
-    if not timeline_playlist_dock:
-        print("   ⚠️ Early return: timeline_playlist_dock is None")
-        return
-    if not timeline_playlist_dock.widget():
-        print("   ⚠️ Early return: timeline_playlist_dock.widget() is None")
+    if _playlist_search is None:
+        print("   ⚠️ Early return: playlist panel not created")
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-        playlist_search = getattr(widget, 'playlist_search', None)
-        print(f"   playlist_search: {playlist_search}")
-        if not playlist_search:
-            print("   ⚠️ Early return: playlist_search is None")
-            return
-
         # Get the existing model (stored on the search widget)
-        model = getattr(playlist_search, '_playlist_model', None)
+        model = getattr(_playlist_search, '_playlist_model', None)
         print(f"   model: {model}")
         if not model:
             print("   ⚠️ Early return: model is None")
             return
 
-        # Get playlist names
-        playlist_names = []
-        if timeline_playlist_data:
-            for playlist in timeline_playlist_data:
-                name = playlist.get("name", "Unnamed")
-                playlist_names.append(name)
+        # Get playlist names (sorted to match the completer's model sorting)
+        playlist_names = sorted(
+            (playlist.get("name", "Unnamed") for playlist in timeline_playlist_data or []),
+            key=str.lower
+        )
 
         print(f"   playlist_names: {playlist_names}")
 
         # Update existing model (don't create new one)
-        model.setStringList(playlist_names)
+        _apply_playlist_name_delta(model, playlist_names)
 
         print(f"✅ Updated autocomplete with {len(playlist_names)} playlists")
         print(f"   Model now has: {model.rowCount()} rows, stringList: {model.stringList()}")
 
     except Exception as e:
-        print(f"❌ Error updating playlist autocomplete: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error updating playlist autocomplete: %s", e)
+
+
+PLAYLIST_MODEL_MAX_DELTA = 16  # Above this many row changes, reset the model instead
+
+
+def _apply_playlist_name_delta(model, playlist_names):
+    """Bring the completer's QStringListModel to playlist_names with row edits.
+
+    Most mutations add, remove or rename one playlist (or none, e.g. when
+    clips are added), so inserting/removing the changed rows avoids resetting
+    the completer model on every call. playlist_names must be sorted with
+    key=str.lower, like the model.
+    """
+    current = model.stringList()
+    if current == playlist_names:
+        return
+
+    removed = Counter(current) - Counter(playlist_names)
+    added = Counter(playlist_names) - Counter(current)
+    if sum(removed.values()) + sum(added.values()) > PLAYLIST_MODEL_MAX_DELTA:
+        model.setStringList(playlist_names)
+        return
+
+    for row in range(len(current) - 1, -1, -1):
+        name = current[row]
+        if removed[name] > 0:
+            removed[name] -= 1
+            model.removeRow(row)
+
+    keys = [name.lower() for name in model.stringList()]
+    for name in sorted(added.elements(), key=str.lower):
+        row = bisect.bisect_right(keys, name.lower())
+        model.insertRow(row)
+        model.setData(model.index(row), name)
+        keys.insert(row, name.lower())
 
 
+@Slot(str)
 def on_playlist_search_changed(text):
     """Handle playlist search text change - show completer popup with filtered results."""
-    global timeline_playlist_dock
-
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    if _playlist_completer is None:
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-        completer = getattr(widget, 'playlist_completer', None)
-
-        if completer:
-            # Set completion prefix to filter results
-            completer.setCompletionPrefix(text)
-            # Show completer popup with filtered results
-            completer.complete()
+        # Set completion prefix to filter results
+        _playlist_completer.setCompletionPrefix(text)
+        # Show completer popup with filtered results
+        _playlist_completer.complete()
     except Exception as e:
-        print(f"❌ Error in search changed: {e}")
+        logger.exception("Error in search changed: %s", e)
 
 
 def on_playlist_search_clicked():
     """Handle click on playlist search box - show all playlists."""
-    global timeline_playlist_dock
-
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    if _playlist_completer is None:
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-        completer = getattr(widget, 'playlist_completer', None)
-        playlist_search = getattr(widget, 'playlist_search', None)
-
-        if completer and playlist_search:
-            # Clear filter and show all
-            completer.setCompletionPrefix("")
-            completer.complete()
+        # Clear filter and show all
+        _playlist_completer.setCompletionPrefix("")
+        _playlist_completer.complete()
     except Exception as e:
-        print(f"❌ Error in search clicked: {e}")
+        logger.exception("Error in search clicked: %s", e)
 
 
+@Slot()
 def on_playlist_search_enter_pressed():
     """Handle Enter key in playlist search - select matching playlist."""
-    global timeline_playlist_dock, timeline_playlist_data
+    global timeline_playlist_data
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    if _playlist_search is None:
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-        playlist_search = getattr(widget, 'playlist_search', None)
-
-        if not playlist_search:
-            return
-
-        search_text = playlist_search.text().strip()
+        search_text = _playlist_search.text().strip()
         if not search_text:
             return
 
@@ -1670,46 +2233,43 @@ def on_playlist_search_enter_pressed():
         for i, p in enumerate(timeline_playlist_data or []):
             print(f"   [{i}] {p.get('name', 'Unnamed')}")
 
-        # Find playlist that matches (case-insensitive)
-        for playlist in timeline_playlist_data or []:
+        # Find playlist that matches (exact, then case-insensitive)
+        needle = search_text.lower()
+        playlist = _playlist_by_name.get(search_text) or _playlist_by_name_lower.get(needle)
+        if playlist:
+            # Found exact match
             name = playlist.get("name", "")
-            if name.lower() == search_text.lower():
-                # Found exact match
-                print(f"✅ Found exact match: {name}")
-                on_playlist_selected_from_completer(name)
-                return
+            print(f"✅ Found exact match: {name}")
+            on_playlist_selected_from_completer(name)
+            return
 
-        # No exact match - try partial match (first match)
-        for playlist in timeline_playlist_data or []:
-            name = playlist.get("name", "")
-            if search_text.lower() in name.lower():
+        # No exact match - try prefix match (first match, same as completer)
+        for name_lower, playlist in _playlist_by_name_lower.items():
+            if name_lower.startswith(needle):
+                name = playlist.get("name", "")
                 print(f"✅ Found partial match: {name}")
                 on_playlist_selected_from_completer(name)
-                playlist_search.setText(name)  # Update search text
+                _playlist_search.setText(name)  # Update search text
                 return
 
         print(f"❌ No playlist found matching: {search_text}")
 
     except Exception as e:
-        print(f"❌ Error in search enter: {e}")
+        logger.exception("Error in search enter: %s", e)
 
 
+@Slot(str)
 def on_playlist_selected_from_completer(playlist_name):
     """Handle playlist selection from autocomplete dropdown."""
-    global timeline_playlist_dock, timeline_playlist_data, current_playlist_id
+    global timeline_playlist_data, current_playlist_id
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    if _playlist_widget is None:
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-
         # Find the playlist by name
-        selected_playlist = None
-        for playlist in timeline_playlist_data or []:
-            if playlist.get("name") == playlist_name:
-                selected_playlist = playlist
-                break
+        selected_playlist = (_playlist_by_name.get(playlist_name)
+                             or _playlist_by_name_lower.get(playlist_name.lower()))
 
         if not selected_playlist:
             print(f"❌ Playlist not found: {playlist_name}")
@@ -1719,64 +2279,127 @@ def on_playlist_selected_from_completer(playlist_name):
         current_playlist_id = selected_playlist.get("_id")
 
         # Update current label
-        clip_count = len(selected_playlist.get("clips", []))
-        widget.current_label.setText(f"📋 Current: {playlist_name} ({clip_count} clips)")
+        clip_count = _playlist_clip_count(selected_playlist)
+        _current_label.setText(f"📋 Current: {playlist_name} ({clip_count} clips)")
 
         # Load playlist items into table
         load_playlist_items_to_table(selected_playlist)
+        load_playlist_timeline(selected_playlist)
 
         # Clear search box after selection
-        playlist_search = getattr(widget, 'playlist_search', None)
-        if playlist_search:
-            playlist_search.clear()
+        _playlist_search.clear()
 
         print(f"✅ Selected playlist: {playlist_name}")
 
     except Exception as e:
-        print(f"❌ Error selecting playlist: {e}")
+        logger.exception("Error selecting playlist: %s", e)
 
 
 def load_playlist_items_to_table(playlist_data):
-    """Load playlist clips into the table (same format as Navigator)."""
-    global timeline_playlist_dock
+    """Load playlist clips into the table (same format as Navigator).
+
+    Only the first PLAYLIST_ROW_BATCH rows are built here; the rest are added
+    by fetch_more_playlist_rows() as the table is scrolled.
+    """
+    global _playlist_pending_clips
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    table = _playlist_table
+    if table is None:
         return
 
     try:
-        from PySide2.QtWidgets import QTableWidgetItem
-        from PySide2.QtCore import Qt
-
-        widget = timeline_playlist_dock.widget()
-        table = getattr(widget, 'playlist_table', None)
-        if not table:
-            return
-
         # Clear table
         table.setRowCount(0)
+        _playlist_pending_clips = []
 
         clips = playlist_data.get("clips", [])
         if not clips:
             print("   No clips in playlist")
             return
 
-        # Populate table with clips
-        from PySide2.QtWidgets import QComboBox
+        _playlist_pending_clips = list(clips)
+        fetch_more_playlist_rows()
+        fill_playlist_table_viewport()
+
+        print(f"📊 Loaded {len(clips)} clips into playlist table "
+              f"({table.rowCount()} rows shown)")
+
+    except Exception as e:
+        logger.exception("Error loading playlist items: %s", e)
+
+
+@Slot(int)
+def on_playlist_table_scrolled(value):
+    """Fetch the next batch of rows when the table is scrolled near the bottom."""
+    if not _playlist_pending_clips or _playlist_table is None:
+        return
+    scrollbar = _playlist_table.verticalScrollBar()
+    if value >= scrollbar.maximum() - scrollbar.pageStep():
+        fetch_more_playlist_rows()
+
+
+def fill_playlist_table_viewport():
+    """Fetch batches until the rows overflow the viewport.
+
+    Without this a short first batch never scrolls, so the rest is never fetched.
+    """
+    table = _playlist_table
+    if table is None:
+        return
+    row_height = max(1, table.verticalHeader().defaultSectionSize())
+    visible_rows = table.viewport().height() // row_height + 1
+    while _playlist_pending_clips and table.rowCount() <= visible_rows:
+        rows = table.rowCount()
+        fetch_more_playlist_rows()
+        if table.rowCount() == rows:
+            break
+
+
+def _playlist_selected_rows(table):
+    """Selected playlist table rows.
+
+    A whole-table selection (Ctrl+A) first builds the pending rows and
+    selects them too, so actions cover every clip, not just the built rows.
+    """
+    selected_rows = table.selectionModel().selectedRows()
+    if _playlist_pending_clips and selected_rows and len(selected_rows) == table.rowCount():
+        fetch_more_playlist_rows(all_rows=True)
+        table.selectAll()
+        selected_rows = table.selectionModel().selectedRows()
+    return selected_rows
+
+
+def fetch_more_playlist_rows(all_rows=False):
+    """Append the next batch of pending clips (or all of them) to the playlist table."""
+    global _playlist_pending_clips
+
+    table = _playlist_table
+    if table is None or not _playlist_pending_clips:
+        return
+
+    try:
+        from PySide2.QtWidgets import QTableWidgetItem
+        from PySide2.QtCore import Qt
+
+        if all_rows:
+            batch, _playlist_pending_clips = _playlist_pending_clips, []
+        else:
+            batch = _playlist_pending_clips[:PLAYLIST_ROW_BATCH]
+            _playlist_pending_clips = _playlist_pending_clips[PLAYLIST_ROW_BATCH:]
+
+        # Sorting re-orders rows on every setItem; re-enabling it sorts once
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
 
-        for clip in clips:
-            row = table.rowCount()
-            table.insertRow(row)
+        row = table.rowCount()
+        table.setRowCount(row + len(batch))
 
-            # Name column: {ep}_{shot} format (same as Navigator) - READ ONLY
+        for clip in batch:
+            # Name column: {ep}_{shot} format (cached per clip) - READ ONLY
             episode = clip.get("episode", "")
             shot = clip.get("shot", clip.get("name", "Unknown"))
-            # Format name as {ep}_{shot}, e.g. "Ep02_SH0010"
-            if episode and shot:
-                name = f"{episode}_{shot}"
-            elif shot:
-                name = shot
-            else:
-                name = clip.get("name", "Unknown")
+            name = _cached_clip_display_name(clip)
             name_item = QTableWidgetItem(name)
             name_item.setData(Qt.UserRole, clip)  # Store full clip data
             name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)  # Read-only
@@ -1805,10 +2428,14 @@ def load_playlist_items_to_table(playlist_data):
             status_combo = create_status_dropdown(status, clip, on_playlist_status_changed)
             table.setCellWidget(row, 3, status_combo)
 
-        print(f"📊 Loaded {len(clips)} clips into playlist table")
+            row += 1
+
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
 
     except Exception as e:
-        print(f"❌ Error loading playlist items: {e}")
+        table.setUpdatesEnabled(True)
+        logger.exception("Error loading playlist rows: %s", e)
 
 
 def on_playlist_status_changed(new_status, combo_box):
@@ -1865,31 +2492,24 @@ def on_playlist_status_changed(new_status, combo_box):
             clip_id = clip_data.get("_id")
             if clip_id:
                 pm.update_clip(current_playlist_id, clip_id, {"status": new_status})
-                timeline_playlist_data = pm.load_playlists()
 
     except Exception as e:
-        print(f"❌ Error updating playlist status: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error updating playlist status: %s", e)
 
 
+@Slot("QPoint")
 def on_playlist_table_context_menu(position):
     """Handle right-click on playlist table - show context menu (same as Navigator)."""
-    global timeline_playlist_dock, timeline_playlist_data
+    global timeline_playlist_data
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    table = _playlist_table
+    if table is None:
         return
 
     try:
         from PySide2.QtWidgets import QMenu
-        from PySide2.QtCore import Qt
 
-        widget = timeline_playlist_dock.widget()
-        table = getattr(widget, 'playlist_table', None)
-        if not table:
-            return
-
-        selected_rows = table.selectionModel().selectedRows()
+        selected_rows = _playlist_selected_rows(table)
         if not selected_rows:
             return
 
@@ -1935,7 +2555,7 @@ def on_playlist_table_context_menu(position):
             add_playlist_items_to_playlist(playlist_id, selected_rows, table)
 
     except Exception as e:
-        print(f"❌ Error showing context menu: {e}")
+        logger.exception("Error showing context menu: %s", e)
 
 
 def create_new_playlist_with_playlist_items(selected_rows, table):
@@ -1962,7 +2582,7 @@ def create_new_playlist_with_playlist_items(selected_rows, table):
             return
 
         # Add selected items to new playlist
-        added_count = 0
+        clip_datas = []
         for index in selected_rows:
             row = index.row()
             name_item = table.item(row, 0)
@@ -1973,21 +2593,19 @@ def create_new_playlist_with_playlist_items(selected_rows, table):
             if not clip_data:
                 continue
 
-            # Add clip to new playlist
-            clip_id = pm.add_clip(playlist_id, clip_data)
-            if clip_id:
-                added_count += 1
+            clip_datas.append(clip_data)
 
-        # Reload data
-        timeline_playlist_data = pm.load_playlists()
+        # Add all clips to the new playlist with a single save
+        added_count = len(pm.add_clips(playlist_id, clip_datas))
+
+        # Shared with the manager cache; only the index needs updating
+        _index_playlist(pm.get_playlist(playlist_id))
         update_playlist_autocomplete()
 
         print(f"✅ Created playlist '{playlist_name}' with {added_count} items")
 
     except Exception as e:
-        print(f"❌ Error creating playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error creating playlist: %s", e)
 
 
 def add_playlist_items_to_playlist(playlist_id, selected_rows, table):
@@ -2002,7 +2620,7 @@ def add_playlist_items_to_playlist(playlist_id, selected_rows, table):
         if not pm:
             return
 
-        added_count = 0
+        clip_datas = []
         for index in selected_rows:
             row = index.row()
             name_item = table.item(row, 0)
@@ -2013,21 +2631,18 @@ def add_playlist_items_to_playlist(playlist_id, selected_rows, table):
             if not clip_data:
                 continue
 
-            # Add clip to playlist
-            clip_id = pm.add_clip(playlist_id, clip_data)
-            if clip_id:
-                added_count += 1
+            clip_datas.append(clip_data)
+
+        # Add all clips to the playlist with a single save
+        added_count = len(pm.add_clips(playlist_id, clip_datas))
 
-        # Reload data
-        timeline_playlist_data = pm.load_playlists()
+        # Shared with the manager cache; only the index needs updating
+        _index_playlist(pm.get_playlist(playlist_id))
         update_playlist_autocomplete()
 
         # Get playlist name
-        playlist_name = "Unknown"
-        for p in timeline_playlist_data or []:
-            if p.get("_id") == playlist_id:
-                playlist_name = p.get("name", "Unknown")
-                break
+        playlist = _playlist_by_id.get(playlist_id)
+        playlist_name = playlist.get("name", "Unknown") if playlist else "Unknown"
 
         print(f"✅ Added {added_count} items to playlist: {playlist_name}")
         QMessageBox.information(
@@ -2036,11 +2651,10 @@ def add_playlist_items_to_playlist(playlist_id, selected_rows, table):
         )
 
     except Exception as e:
-        print(f"❌ Error adding to playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error adding to playlist: %s", e)
 
 
+@Slot("QTableWidgetItem*")
 def on_playlist_item_double_click(item):
     """Handle double-click on playlist item - load in RV."""
     load_selected_playlist_item_in_rv()
@@ -2048,20 +2662,16 @@ def on_playlist_item_double_click(item):
 
 def load_selected_playlist_item_in_rv():
     """Load the selected playlist item in RV - SAME AS NAVIGATOR."""
-    global timeline_playlist_dock, horus_fs, horus_comments, current_media_context
+    global horus_fs, horus_comments, current_media_context
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    table = _playlist_table
+    if table is None:
         return
 
     try:
         from PySide2.QtCore import Qt
 
-        widget = timeline_playlist_dock.widget()
-        table = getattr(widget, 'playlist_table', None)
-        if not table:
-            return
-
-        selected_rows = table.selectionModel().selectedRows()
+        selected_rows = _playlist_selected_rows(table)
         if not selected_rows:
             return
 
@@ -2109,16 +2719,15 @@ def load_selected_playlist_item_in_rv():
             print(f"   Media type: {clip_data.get('media_type')}")
 
     except Exception as e:
-        print(f"❌ Error loading in RV: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error loading in RV: %s", e)
 
 
 def remove_selected_from_playlist():
     """Remove selected items from current playlist."""
-    global timeline_playlist_dock, current_playlist_id, horus_playlists
+    global current_playlist_id, horus_playlists
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    table = _playlist_table
+    if table is None:
         return
 
     if not current_playlist_id:
@@ -2128,17 +2737,13 @@ def remove_selected_from_playlist():
     try:
         from PySide2.QtCore import Qt
 
-        widget = timeline_playlist_dock.widget()
-        table = getattr(widget, 'playlist_table', None)
-        if not table:
-            return
-
-        selected_rows = table.selectionModel().selectedRows()
+        selected_rows = _playlist_selected_rows(table)
         if not selected_rows:
             return
 
-        # Get clip IDs to remove
+        # Get clip IDs (and their table rows) to remove
         clip_ids_to_remove = []
+        rows_to_remove = []
         for index in selected_rows:
             row = index.row()
             name_item = table.item(row, 0)
@@ -2148,121 +2753,150 @@ def remove_selected_from_playlist():
                     clip_id = clip_data.get("clip_id") or clip_data.get("_id")
                     if clip_id:
                         clip_ids_to_remove.append(clip_id)
+                        rows_to_remove.append(row)
 
-        # Remove clips from playlist via backend
-        pm = _ensure_playlist_manager()
-        if pm:
-            for clip_id in clip_ids_to_remove:
-                pm.remove_clip(current_playlist_id, clip_id)
-            print(f"✅ Removed {len(clip_ids_to_remove)} clips from playlist")
-
-        # Reload playlist data and refresh table
-        load_timeline_playlist_data()
+        if not clip_ids_to_remove:
+            return
 
-        # Refresh the table
-        for playlist in timeline_playlist_data or []:
-            if playlist.get("_id") == current_playlist_id:
-                load_playlist_items_to_table(playlist)
-                # Update current label
-                clip_count = len(playlist.get("clips", []))
-                widget.current_label.setText(f"📋 Current: {playlist.get('name', 'Unknown')} ({clip_count} clips)")
-                break
+        # Remove clips from playlist via backend (single save)
+        pm = _ensure_playlist_manager()
+        if not pm:
+            return
+        removed = pm.remove_clips(current_playlist_id, clip_ids_to_remove)
+        if not removed:
+            # Nothing matched or the save failed (the backend rolled back)
+            print("❌ Failed to remove clips from playlist")
+            return
+        print(f"✅ Removed {removed} clips from playlist")
+
+        playlist = _playlist_by_id.get(current_playlist_id)
+        if removed == len(rows_to_remove):
+            # The backend mutates the cached playlist dict in place, so only the
+            # affected rows need to go - no reload or table rebuild
+            for row in sorted(rows_to_remove, reverse=True):
+                table.removeRow(row)
+        elif playlist:
+            # Some rows were already gone from the playlist; rebuild from it
+            load_playlist_items_to_table(playlist)
+
+        if playlist:
+            # Update current label
+            clip_count = _playlist_clip_count(playlist)
+            _current_label.setText(f"📋 Current: {playlist.get('name', 'Unknown')} ({clip_count} clips)")
 
     except Exception as e:
-        print(f"❌ Error removing from playlist: {e}")
+        logger.exception("Error removing from playlist: %s", e)
 
 
 def clear_playlist_table():
     """Clear the playlist table and reset current label."""
-    global timeline_playlist_dock, current_playlist_id
+    global current_playlist_id
 
-    if not timeline_playlist_dock or not timeline_playlist_dock.widget():
+    if _playlist_widget is None:
         return
 
     try:
-        widget = timeline_playlist_dock.widget()
-
         # Clear table
-        table = getattr(widget, 'playlist_table', None)
-        if table:
-            table.setRowCount(0)
+        _playlist_table.setRowCount(0)
+        _playlist_pending_clips.clear()
 
         # Reset current label
-        current_label = getattr(widget, 'current_label', None)
-        if current_label:
-            current_label.setText("📋 Current: No playlist selected")
+        _current_label.setText("📋 Current: No playlist selected")
 
         # Clear search
-        playlist_search = getattr(widget, 'playlist_search', None)
-        if playlist_search:
-            playlist_search.clear()
+        _playlist_search.clear()
 
         # Reset current playlist ID
         current_playlist_id = None
 
     except Exception as e:
-        print(f"❌ Error clearing playlist table: {e}")
+        logger.exception("Error clearing playlist table: %s", e)
 
 
-def create_timeline_ruler(clips):
-    """Create timeline ruler with timecode markers."""
-    from PySide2.QtWidgets import QFrame, QHBoxLayout, QLabel
-    from PySide2.QtCore import Qt
+class TimelineRulerWidget(QWidget):
+    """Timeline ruler that paints its timecode ticks in a single paintEvent.
 
-    ruler = QFrame()
-    ruler.setFixedHeight(25)  # Legacy timeline size - compact proportions
-    ruler.setStyleSheet("""
-        QFrame {
-            background-color: #1e1e1e;
-            border-bottom: 1px solid #555555;
-        }
-        QLabel {
-            color: #cccccc;
-            font-size: 10px;
-            font-family: monospace;
-        }
-    """)
-
-    layout = QHBoxLayout(ruler)
-    layout.setContentsMargins(80, 0, 0, 0)  # Offset for track labels (matches professional label width)
-    layout.setSpacing(0)
+    Replaces one QLabel per tick; only ticks inside the exposed rect are drawn.
+    """
 
+    def __init__(self, total_frames, fps=24, tick=30, tick_width=150, offset=80, parent=None):
+        super().__init__(parent)
+        self._total_frames = int(total_frames)
+        self._fps = fps
+        self._tick = tick
+        self._tick_width = tick_width  # Pixels per tick (original demo size)
+        self._offset = offset  # Offset for track labels
+        self._tick_count = (self._total_frames + tick - 1) // tick + 1 if self._total_frames > 0 else 0
+
+        self.setFixedHeight(25)  # Legacy timeline size - compact proportions
+        self.setMinimumWidth(self._offset + self._tick_count * self._tick_width)
+
+    def sizeHint(self):
+        return QSize(self.minimumWidth(), 25)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        width, height = self.width(), self.height()
+        painter.fillRect(0, 0, width, height, QColor("#1e1e1e"))
+        painter.setPen(QColor("#555555"))
+        painter.drawLine(0, height - 1, width, height - 1)
+
+        if self._tick_count:
+            font = painter.font()
+            font.setFamily("monospace")
+            font.setPixelSize(10)
+            painter.setFont(font)
+            painter.setPen(QColor("#cccccc"))
+
+            # Only draw ticks that intersect the exposed area
+            rect = event.rect()
+            first = max(0, (rect.left() - self._offset) // self._tick_width)
+            last = min(self._tick_count - 1, (rect.right() - self._offset) // self._tick_width)
+            for i in range(first, last + 1):
+                x = self._offset + i * self._tick_width
+                painter.drawText(x, 0, self._tick_width, height, Qt.AlignCenter,
+                                 _frame_to_timecode(i * self._tick, self._fps))
+
+        painter.end()
+
+
+def _frame_to_timecode(frame, fps=24):
+    """Format a frame number as MM:SS:FF."""
+    seconds = frame / fps
+    minutes = int(seconds // 60)
+    secs = int(seconds % 60)
+    frames = frame % fps
+    return f"{minutes:02d}:{secs:02d}:{frames:02d}"
+
+
+def create_timeline_ruler(clips, total_duration=None):
+    """Create timeline ruler with timecode markers.
+
+    Pass total_duration when it is already known to skip rescanning clips.
+    """
     # Calculate total duration
-    total_duration = 0
-    if clips:
-        total_duration = max(clip.get("position", 0) + clip.get("duration", 0) for clip in clips)
-
-    # Add timecode markers every 30 frames (assuming 24fps)
-    if total_duration > 0:
-        for frame in range(0, int(total_duration) + 30, 30):
-            seconds = frame / 24
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            frames = frame % 24
-
-            timecode = f"{minutes:02d}:{secs:02d}:{frames:02d}"
-            marker = QLabel(timecode)
-            marker.setFixedWidth(150)  # Original demo size - better proportions
-            marker.setAlignment(Qt.AlignCenter)
-            layout.addWidget(marker)
+    if total_duration is None:
+        total_duration = 0
+        if clips:
+            total_duration = max(clip.get("position", 0) + clip.get("duration", 0) for clip in clips)
 
-    layout.addStretch()
-    return ruler
+    # Markers every 30 frames (assuming 24fps), painted by a single widget
+    return TimelineRulerWidget(total_duration)
 
-def create_timeline_track_widget(track_data, clips):
-    """Create a timeline track widget with clips."""
+def create_timeline_track_widget(track_data, clips, presorted=False):
+    """Create a timeline track widget with clips.
+
+    With presorted=True, clips are taken to be this track's TimelineClip
+    records already sorted by position (see _index_timeline_clips);
+    otherwise clips is the playlist's list of clip dicts.
+    """
     from PySide2.QtWidgets import QFrame, QHBoxLayout, QLabel, QWidget, QPushButton
     from PySide2.QtCore import Qt
 
     track = QFrame()
+    track.setObjectName("TimelineTrack")
     track_height = track_data.get("height", 45)  # Legacy timeline size - compact and professional
     track.setFixedHeight(track_height)
-    track.setStyleSheet("""
-        QFrame {
-            background-color: #2d2d2d;
-            border-bottom: 1px solid #555555;
-        }
-    """)
 
     layout = QHBoxLayout(track)
     layout.setContentsMargins(0, 0, 0, 0)
@@ -2270,17 +2904,8 @@ def create_timeline_track_widget(track_data, clips):
 
     # Track label
     track_label = QLabel(track_data.get("name", "Track"))
+    track_label.setObjectName("TimelineTrackLabel")
     track_label.setFixedSize(80, 45)  # Legacy timeline proportions - match track height
-    track_label.setStyleSheet("""
-        QLabel {
-            background-color: #3a3a3a;
-            color: #e0e0e0;
-            padding: 0px;
-            border-right: 1px solid #555555;
-            font-size: 11px;
-            font-weight: bold;
-        }
-    """)
     track_label.setAlignment(Qt.AlignCenter)
     layout.addWidget(track_label)
 
@@ -2294,26 +2919,18 @@ def create_timeline_track_widget(track_data, clips):
     print(f"🔧 DEBUG: Clips area height set to {track_height}px with vertical centering")
 
     # Filter clips for this track
-    track_clips = [clip for clip in clips if clip.get("track") == track_data.get("track_id")]
-    track_clips.sort(key=lambda x: x.get("position", 0))
-
-    # Department colors
-    department_colors = {
-        "animation": "#1f4e79",
-        "lighting": "#d68910",
-        "compositing": "#196f3d",
-        "fx": "#6c3483",
-        "modeling": "#a93226",
-        "texturing": "#8b4513",
-        "rigging": "#2e8b57",
-        "layout": "#4682b4"
-    }
+    if presorted:
+        track_clips = clips
+    else:
+        track_id = track_data.get("track_id")
+        track_clips = [TimelineClip.from_dict(clip) for clip in clips if clip.get("track") == track_id]
+        track_clips.sort(key=_clip_position)
 
     # Add clips to track
     current_position = 0
     for clip in track_clips:
-        clip_position = clip.get("position", 0)
-        clip_duration = clip.get("duration", 0)
+        clip_position = clip.position
+        clip_duration = clip.duration
 
         # Add gap if needed
         if clip_position > current_position:
@@ -2323,7 +2940,7 @@ def create_timeline_track_widget(track_data, clips):
             clips_layout.addWidget(gap)
 
         # Create clip widget
-        clip_widget = create_timeline_clip_widget(clip, department_colors, track_height)
+        clip_widget = create_timeline_clip_widget(clip, _DEPT_QCOLORS, track_height)
         clips_layout.addWidget(clip_widget)
 
         current_position = clip_position + clip_duration
@@ -2333,49 +2950,86 @@ def create_timeline_track_widget(track_data, clips):
 
     return track
 
-def create_timeline_clip_widget(clip_data, department_colors, track_height=45):
-    """Create a timeline clip widget using exact legacy timeline approach."""
-    from PySide2.QtWidgets import QLabel
-    from PySide2.QtCore import Qt
+# Timeline clip colors, parsed into QColors once at import
+_DEPT_COLORS = {
+    "animation": "#1f4e79",
+    "lighting": "#d68910",
+    "compositing": "#196f3d",
+    "fx": "#6c3483",
+    "modeling": "#a93226",
+    "texturing": "#8b4513",
+    "rigging": "#2e8b57",
+    "layout": "#4682b4"
+}
+_DEPT_QCOLORS = {dept: QColor(color) for dept, color in _DEPT_COLORS.items()}
+_DEFAULT_QCOLOR = QColor("#666666")
+_CLIP_TEXT_QCOLOR = QColor("#ffffff")
+_CLIP_BORDER_QCOLOR = QColor(255, 255, 255, 51)  # rgba(255, 255, 255, 0.2)
+
+
+class ClipLabel(QLabel):
+    """Timeline clip label; clip data lives in the "clip_data" Qt property.
+
+    Paints its own department-colored background so no per-clip stylesheet
+    has to be parsed.
+    """
 
+    def __init__(self, text, color=None, parent=None):
+        super().__init__(text, parent)
+        self._color = color if color is not None else _DEFAULT_QCOLOR
+        font = self.font()
+        font.setPixelSize(9)
+        font.setBold(True)
+        self.setFont(font)
+
+    def mousePressEvent(self, event):
+        on_timeline_clip_clicked(self.property("clip_data"))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.rect()
+        painter.fillRect(rect, self._color)
+        painter.setPen(_CLIP_BORDER_QCOLOR)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.setPen(_CLIP_TEXT_QCOLOR)
+        painter.drawText(rect.adjusted(2, 2, -2, -2), Qt.AlignCenter, self.text())
+        painter.end()
+
+
+def create_timeline_clip_widget(clip_data, department_colors=None, track_height=45):
+    """Create a timeline clip widget using exact legacy timeline approach.
+
+    clip_data may be a TimelineClip or a playlist clip dict.
+    department_colors maps department -> QColor (defaults to _DEPT_QCOLORS).
+    """
     print(f"🔧 DEBUG: create_timeline_clip_widget called with track_height={track_height}")
 
-    duration = clip_data.get("duration", 0)
-    department = clip_data.get("department", "unknown")
+    if isinstance(clip_data, dict):
+        clip_data = TimelineClip.from_dict(clip_data)
+
+    department = clip_data.department
 
     # Use full track height to fill entire area
     width = 120
     clip_height = track_height  # Fill entire track height (45px)
 
     # Get shot info like legacy timeline
-    shot_name = clip_data.get("shot", "")
-    version = clip_data.get("version", "v001")
+    shot_name = clip_data.shot
+    version = clip_data.version
+
+    # Get department color
+    if department_colors is None:
+        department_colors = _DEPT_QCOLORS
+    color = department_colors.get(department, _DEFAULT_QCOLOR)
 
     # Create QLabel like legacy timeline (not QPushButton)
-    clip = QLabel(f"{shot_name}\n{version}")
+    clip = ClipLabel(f"{shot_name}\n{version}", color)
+    clip.setProperty("clip_data", clip_data.data)
     clip.setFixedSize(width, clip_height)  # Exact legacy timeline sizing
     print(f"🔧 DEBUG: Created clip {shot_name} with size {width}x{clip_height}px")
 
-    # Get department color
-    color = department_colors.get(department, "#666666")
-
-    # Use exact legacy timeline styling
-    clip.setStyleSheet(f"""
-        QLabel {{
-            background-color: {color};
-            color: #ffffff;
-            font-size: 9px;
-            font-weight: bold;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            padding: 2px;
-            margin: 0px;
-        }}
-    """)
     clip.setAlignment(Qt.AlignCenter)
-    clip.setToolTip(f"{clip_data.get('sequence', '')}/{clip_data.get('shot', '')} - {clip_data.get('version', '')}")
-
-    # Add click handler (QLabel needs mouse events)
-    clip.mousePressEvent = lambda event: on_timeline_clip_clicked(clip_data)
+    clip.setToolTip(f"{clip_data.sequence}/{clip_data.shot} - {clip_data.data.get('version', '')}")
 
     return clip
 
@@ -2387,8 +3041,7 @@ def on_timeline_clip_clicked(clip_data):
 
         if file_path:
             # Load in RV
-            import rv.commands as rvc
-            rvc.addSource(file_path)
+            _rvc.addSource(file_path)
             print(f"✅ Loading clip from playlist: {file_path}")
             print(f"   Shot: {clip_data.get('sequence', '')}/{clip_data.get('shot', '')} {clip_data.get('version', '')}")
             return
@@ -2411,8 +3064,7 @@ def on_timeline_clip_clicked(clip_data):
                 file_path = media_record.get("file_path", "")
                 if file_path:
                     # Load in RV
-                    import rv.commands as rvc
-                    rvc.addSource(file_path)
+                    _rvc.addSource(file_path)
                     print(f"✅ Loading clip from media record: {file_path}")
                 else:
                     print(f"❌ No file path for clip: {media_id}")
@@ -2422,24 +3074,28 @@ def on_timeline_clip_clicked(clip_data):
             print("Horus connector not available")
 
     except Exception as e:
-        print(f"Error loading clip from playlist: {e}")
+        logger.exception("Error loading clip from playlist: %s", e)
 
 # Playlist management functions
+
+# Login user recorded as playlist owner and comment author
+# (resolved once; the login user does not change)
+_CURRENT_USER = os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+
+
+@Slot()
 def create_new_playlist():
     """Create a new playlist using backend."""
     global horus_playlists, timeline_playlist_data
 
     try:
-        from PySide2.QtWidgets import QInputDialog
-
         name, ok = QInputDialog.getText(None, "New Playlist", "Enter playlist name:")
         if ok and name:
             # Initialize playlist manager with file system
             _ensure_playlist_manager()
 
             # Get current user
-            import os
-            user = os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+            user = _CURRENT_USER
 
             # Create playlist via backend
             playlist_id = horus_playlists.create_playlist(
@@ -2450,17 +3106,34 @@ def create_new_playlist():
             )
 
             if playlist_id:
-                # Reload data to sync
-                timeline_playlist_data = horus_playlists.load_playlists()
+                # Shared with the manager cache; only the index needs updating
+                _index_playlist(horus_playlists.get_playlist(playlist_id))
                 update_playlist_autocomplete()
                 print(f"✅ Created new playlist: {name}")
             else:
                 print(f"❌ Failed to create playlist: {name}")
 
     except Exception as e:
-        print(f"Error creating new playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error creating new playlist: %s", e)
+
+
+# Navigator media fields copied into a new playlist clip, with their defaults
+_CLIP_FIELDS = ("name", "shot", "episode", "sequence", "department", "version", "status", "file_path")
+_CLIP_DEFAULTS = {
+    "name": "Unknown",
+    "shot": "",
+    "episode": "",
+    "sequence": "",
+    "department": "",
+    "version": "v001",
+    "status": "submit",
+    "file_path": "",
+}
+
+
+def _clip_data_from_media(media_item):
+    """Build playlist clip data from a Navigator media item."""
+    return {**_CLIP_DEFAULTS, **{k: media_item[k] for k in _CLIP_FIELDS if k in media_item}}
 
 
 def create_new_playlist_with_items(selected_rows, media_table):
@@ -2468,9 +3141,6 @@ def create_new_playlist_with_items(selected_rows, media_table):
     global horus_playlists, timeline_playlist_data, current_playlist_id, timeline_playlist_dock
 
     try:
-        from PySide2.QtWidgets import QInputDialog, QMessageBox
-        from PySide2.QtCore import Qt
-
         name, ok = QInputDialog.getText(None, "New Playlist", "Enter playlist name:")
         if not ok or not name:
             return
@@ -2482,8 +3152,7 @@ def create_new_playlist_with_items(selected_rows, media_table):
             return
 
         # Get current user
-        import os
-        user = os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+        user = _CURRENT_USER
 
         # Create playlist via backend
         playlist_id = pm.create_playlist(
@@ -2497,55 +3166,35 @@ def create_new_playlist_with_items(selected_rows, media_table):
             print(f"❌ Failed to create playlist: {name}")
             return
 
-        # Add selected items to the new playlist
-        added_count = 0
-        for index in selected_rows:
-            row = index.row()
-            name_item = media_table.item(row, 0)
-            if not name_item:
-                continue
-
-            media_item = name_item.data(Qt.UserRole)
-            if not media_item:
-                continue
+        # Collect clip data for the selected items (read UserRole straight from
+        # the model index; no QTableWidgetItem wrapper per row)
+        media_items = [
+            _navigator_media_item(index.sibling(index.row(), 0).data(Qt.UserRole))
+            for index in selected_rows
+        ]
+        media_items = [m for m in media_items if m]
 
-            # Create clip data from media item
-            clip_data = {
-                "name": media_item.get('name', 'Unknown'),
-                "shot": media_item.get('shot', ''),
-                "episode": media_item.get('episode', ''),
-                "sequence": media_item.get('sequence', ''),
-                "department": media_item.get('department', ''),
-                "version": media_item.get('version', 'v001'),
-                "status": media_item.get('status', 'submit'),
-                "file_path": media_item.get('file_path', ''),
-            }
+        clip_datas = [_clip_data_from_media(media_item) for media_item in media_items]
 
-            # Add clip to playlist
-            clip_id = pm.add_clip(playlist_id, clip_data)
-            if clip_id:
-                added_count += 1
+        # Add all clips to the new playlist with a single save
+        clip_ids = pm.add_clips(playlist_id, clip_datas)
+        added_count = len(clip_ids)
 
-        # Reload data to sync
-        timeline_playlist_data = pm.load_playlists()
+        # Shared with the manager cache; only the index needs updating
+        _index_playlist(pm.get_playlist(playlist_id))
         update_playlist_autocomplete()
 
         # Select the new playlist
         current_playlist_id = playlist_id
-        for p in timeline_playlist_data or []:
-            if p.get("_id") == playlist_id:
-                load_playlist_items_to_table(p)
-                # Update label
-                if timeline_playlist_dock and timeline_playlist_dock.widget():
-                    widget = timeline_playlist_dock.widget()
-                    current_label = getattr(widget, 'current_label', None)
-                    playlist_search = getattr(widget, 'playlist_search', None)
-                    if current_label:
-                        clip_count = len(p.get("clips", []))
-                        current_label.setText(f"📋 Current: {name} ({clip_count} clips)")
-                    if playlist_search:
-                        playlist_search.setText(name)
-                break
+        p = _playlist_by_id.get(playlist_id)
+        if p:
+            load_playlist_items_to_table(p)
+            # Update label
+            if _current_label is not None:
+                clip_count = _playlist_clip_count(p)
+                _current_label.setText(f"📋 Current: {name} ({clip_count} clips)")
+            if _playlist_search is not None:
+                _playlist_search.setText(name)
 
         print(f"✅ Created playlist '{name}' with {added_count} items")
         QMessageBox.information(
@@ -2554,31 +3203,24 @@ def create_new_playlist_with_items(selected_rows, media_table):
         )
 
     except Exception as e:
-        print(f"Error creating new playlist with items: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error creating new playlist with items: %s", e)
 
 
+@Slot()
 def duplicate_current_playlist():
     """Duplicate the selected playlist."""
     try:
         if not current_playlist_id:
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warning", "Please select a playlist to duplicate.")
             return
 
         # Find current playlist
-        current_playlist = None
-        for playlist in timeline_playlist_data:
-            if playlist["_id"] == current_playlist_id:
-                current_playlist = playlist
-                break
+        current_playlist = _playlist_by_id.get(current_playlist_id)
 
         if not current_playlist:
             return
 
         # Create duplicate
-        from PySide2.QtWidgets import QInputDialog
         from datetime import datetime
 
         name, ok = QInputDialog.getText(
@@ -2588,34 +3230,41 @@ def duplicate_current_playlist():
         )
 
         if ok and name:
-            # Generate new ID
-            new_id = f"playlist_{len(timeline_playlist_data) + 1:03d}"
-
-            # Create duplicate
-            duplicate = current_playlist.copy()
-            duplicate["_id"] = new_id
-            duplicate["name"] = name
-            duplicate["created_at"] = datetime.now().isoformat() + "Z"
-            duplicate["updated_at"] = datetime.now().isoformat() + "Z"
-            duplicate["status"] = "draft"
+            # Generate new ID (same UUID form as HorusPlaylistManager ids)
+            new_id = str(uuid.uuid4())
+
+            # Create duplicate; clips are copied so edits to one playlist's
+            # clips never show up in the other
+            # One UTC timestamp for both fields (the "Z" suffix means UTC)
+            now_iso = datetime.utcnow().isoformat() + "Z"
+            duplicate = {
+                **current_playlist,
+                "_id": new_id,
+                "name": name,
+                "created_at": now_iso,
+                "updated_at": now_iso,
+                "status": "draft",
+                "clips": [dict(c) for c in current_playlist.get("clips", [])],
+            }
 
             # Add to data and save
             timeline_playlist_data.append(duplicate)
+            _rebuild_playlist_index()
             save_timeline_playlist_data()
             update_playlist_autocomplete()
 
             print(f"Duplicated playlist: {name}")
 
     except Exception as e:
-        print(f"Error duplicating playlist: {e}")
+        logger.exception("Error duplicating playlist: %s", e)
 
+@Slot()
 def rename_current_playlist():
     """Rename the selected playlist using backend."""
     global horus_playlists, timeline_playlist_data
 
     try:
         if not current_playlist_id:
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warning", "Please select a playlist to rename.")
             return
 
@@ -2628,8 +3277,6 @@ def rename_current_playlist():
             return
 
         # Get new name
-        from PySide2.QtWidgets import QInputDialog
-
         name, ok = QInputDialog.getText(
             None, "Rename Playlist",
             "Enter new name:",
@@ -2638,38 +3285,31 @@ def rename_current_playlist():
 
         if ok and name:
             if horus_playlists.update_playlist(current_playlist_id, {"name": name}):
-                # Reload data to sync
-                timeline_playlist_data = horus_playlists.load_playlists()
+                # Re-key by name; the dict itself was updated in place, and a
+                # full rebuild keeps first-match order for duplicate names
+                _rebuild_playlist_index()
                 update_playlist_autocomplete()
 
                 # Update current playlist label
-                if timeline_playlist_dock and timeline_playlist_dock.widget():
-                    widget = timeline_playlist_dock.widget()
-                    current_label = getattr(widget, 'current_label', None)
-                    if current_label:
-                        # Get clip count
-                        for p in timeline_playlist_data or []:
-                            if p.get("_id") == current_playlist_id:
-                                clip_count = len(p.get("clips", []))
-                                current_label.setText(f"📋 Current: {name} ({clip_count} clips)")
-                                break
+                p = _playlist_by_id.get(current_playlist_id)
+                if p and _current_label is not None:
+                    clip_count = _playlist_clip_count(p)
+                    _current_label.setText(f"📋 Current: {name} ({clip_count} clips)")
 
                 print(f"✅ Renamed playlist to: {name}")
             else:
                 print(f"❌ Failed to rename playlist")
 
     except Exception as e:
-        print(f"Error renaming playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error renaming playlist: %s", e)
 
+@Slot()
 def delete_current_playlist():
     """Delete the selected playlist using backend."""
     global horus_playlists, timeline_playlist_data
 
     try:
         if not current_playlist_id:
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warning", "Please select a playlist to delete.")
             return
 
@@ -2682,8 +3322,6 @@ def delete_current_playlist():
             return
 
         # Confirm deletion
-        from PySide2.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             None, "Delete Playlist",
             f"Are you sure you want to delete playlist '{playlist['name']}'?",
@@ -2693,8 +3331,8 @@ def delete_current_playlist():
 
         if reply == QMessageBox.Yes:
             if horus_playlists.delete_playlist(current_playlist_id):
-                # Reload data to sync
-                timeline_playlist_data = horus_playlists.load_playlists()
+                # Already gone from the shared list; just drop it from the index
+                _unindex_playlist(playlist)
                 update_playlist_autocomplete()
                 clear_playlist_table()
                 print(f"✅ Deleted playlist: {playlist['name']}")
@@ -2702,36 +3340,34 @@ def delete_current_playlist():
                 print(f"❌ Failed to delete playlist")
 
     except Exception as e:
-        print(f"Error deleting playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error deleting playlist: %s", e)
 
+@Slot()
 def show_add_media_dialog():
     """Show dialog to add media to current playlist."""
     try:
         if not current_playlist_id:
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warning", "Please select a playlist first.")
             return
 
-        from PySide2.QtWidgets import QMessageBox
         QMessageBox.information(
             None, "Add Media",
             "Right-click media items in the Media Grid to add them to the current playlist."
         )
 
     except Exception as e:
-        print(f"Error showing add media dialog: {e}")
+        logger.exception("Error showing add media dialog: %s", e)
 
+@Slot()
 def refresh_timeline_playlists():
     """Refresh playlist data from database."""
     try:
-        load_timeline_playlist_data()
-        update_playlist_autocomplete()
-        print("Refreshed playlist data")
+        load_timeline_playlist_data_async(refresh=True, on_done=_reload_current_playlist_table)
+        print("Refreshing playlist data...")
     except Exception as e:
-        print(f"Error refreshing playlists: {e}")
+        logger.exception("Error refreshing playlists: %s", e)
 
+@Slot()
 def play_current_playlist():
     """Start timeline playback."""
     try:
@@ -2741,23 +3377,25 @@ def play_current_playlist():
         else:
             print("No playlist selected for playback")
     except Exception as e:
-        print(f"Error playing playlist: {e}")
+        logger.exception("Error playing playlist: %s", e)
 
+@Slot()
 def stop_playlist_playback():
     """Stop timeline playback."""
     try:
         print("Stopping playlist playback")
         # TODO: Implement playback stop
     except Exception as e:
-        print(f"Error stopping playback: {e}")
+        logger.exception("Error stopping playback: %s", e)
 
+@Slot(str)
 def on_timeline_zoom_changed(zoom_text):
     """Handle timeline zoom change."""
     try:
         print(f"Timeline zoom changed to: {zoom_text}")
         # TODO: Implement timeline zoom functionality
     except Exception as e:
-        print(f"Error changing zoom: {e}")
+        logger.exception("Error changing zoom: %s", e)
 
 def add_media_to_current_playlist(media_record):
     """Add a media record to the current playlist using backend."""
@@ -2765,7 +3403,6 @@ def add_media_to_current_playlist(media_record):
 
     try:
         if not current_playlist_id:
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warning", "Please select a playlist first.")
             return
 
@@ -2774,17 +3411,18 @@ def add_media_to_current_playlist(media_record):
 
         # Extract department from filename
         filename = media_record.get("file_name", "")
-        department = "unknown"
-        for dept in ["animation", "lighting", "compositing", "fx", "modeling", "texturing", "rigging", "layout"]:
-            if dept in filename.lower():
-                department = dept
-                break
+        fn_lower = filename.lower()
+        match = _DEPT_RE.search(fn_lower)
+        department = match.group(1) if match else "unknown"
 
         # Prepare media data for backend
         media_data = {
-            "episode": media_record.get("episode", extract_episode_from_filename(filename)),
-            "sequence": media_record.get("sequence", extract_sequence_from_filename(filename)),
-            "shot": media_record.get("shot", extract_shot_from_filename(filename)),
+            "episode": (media_record["episode"] if "episode" in media_record
+                        else extract_episode_from_filename(filename, filename_lower=fn_lower)),
+            "sequence": (media_record["sequence"] if "sequence" in media_record
+                         else extract_sequence_from_filename(filename, filename_lower=fn_lower)),
+            "shot": (media_record["shot"] if "shot" in media_record
+                     else extract_shot_from_filename(filename, filename_lower=fn_lower)),
             "department": department,
             "version": media_record.get("version", "v001"),
             "file_path": media_record.get("file_path", ""),
@@ -2799,8 +3437,8 @@ def add_media_to_current_playlist(media_record):
         clip_id = horus_playlists.add_clip(current_playlist_id, media_data)
 
         if clip_id:
-            # Reload data to sync
-            timeline_playlist_data = horus_playlists.load_playlists()
+            # Shared with the manager cache; only the index needs updating
+            _index_playlist(horus_playlists.get_playlist(current_playlist_id))
 
             # Reload timeline if this playlist is currently selected
             playlist = horus_playlists.get_playlist(current_playlist_id)
@@ -2810,7 +3448,6 @@ def add_media_to_current_playlist(media_record):
             # Update tree to show new clip count
             update_playlist_autocomplete()
 
-            from PySide2.QtWidgets import QMessageBox
             QMessageBox.information(
                 None, "Added to Playlist",
                 f"Added '{filename}' to playlist '{playlist.get('name', 'Unknown')}'"
@@ -2821,53 +3458,35 @@ def add_media_to_current_playlist(media_record):
             print(f"❌ Failed to add media to playlist")
 
     except Exception as e:
-        print(f"❌ Error adding media to playlist: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error adding media to playlist: %s", e)
 
 
-def extract_episode_from_filename(filename):
-    """Extract episode from filename."""
-    import re
-    # Look for Ep01, ep01, episode01 patterns
-    match = re.search(r'(ep\d+|episode\d+)', filename.lower())
-    if match:
-        ep = match.group(1)
-        # Normalize to Ep## format
-        if ep.startswith('episode'):
-            ep = 'Ep' + ep[7:]
-        else:
-            ep = 'Ep' + ep[2:]
-        return ep
-    return "Ep01"
-
-def extract_sequence_from_filename(filename):
-    """Extract sequence from filename."""
-    import re
-    # Look for sq0010, seq010, sequence010 patterns
-    match = re.search(r'(sq\d+|seq\d+|sequence\d+)', filename.lower())
-    if match:
-        seq = match.group(1)
-        # Normalize to sq#### format
-        if seq.startswith('seq'):
-            seq = 'sq' + seq[3:]
-        elif seq.startswith('sequence'):
-            seq = 'sq' + seq[8:]
-        return seq
-    return "sq0000"
-
-def extract_shot_from_filename(filename):
-    """Extract shot from filename."""
-    import re
-    # Look for sh0010, shot010, shot0010 patterns
-    match = re.search(r'(sh\d+|shot\d+)', filename.lower())
-    if match:
-        shot = match.group(1)
-        # Normalize to sh#### format
-        if shot.startswith('shot'):
-            shot = 'sh' + shot[4:]
-        return shot
-    return "sh0000"
+# Filename patterns, compiled once (longest prefix first; digits captured)
+_EP_RE = re.compile(r'(?:episode|ep)(\d+)')
+_SEQ_RE = re.compile(r'(?:sequence|seq|sq)(\d+)')
+_SHOT_RE = re.compile(r'(?:shot|sh)(\d+)')
+# Departments recognised in media filenames (edit here; _DEPT_RE is built from it)
+_DEPT_NAMES = ("animation", "lighting", "compositing", "fx", "modeling", "texturing", "rigging", "layout")
+_DEPT_RE = re.compile("(" + "|".join(_DEPT_NAMES) + ")")
+
+
+def extract_episode_from_filename(filename, filename_lower=None):
+    """Extract episode from filename (pass filename_lower to reuse a lowercased name)."""
+    # Look for Ep01, ep01, episode01 patterns and normalize to Ep## format
+    match = _EP_RE.search(filename_lower if filename_lower is not None else filename.lower())
+    return f"Ep{match.group(1)}" if match else "Ep01"
+
+def extract_sequence_from_filename(filename, filename_lower=None):
+    """Extract sequence from filename (pass filename_lower to reuse a lowercased name)."""
+    # Look for sq0010, seq010, sequence010 patterns and normalize to sq#### format
+    match = _SEQ_RE.search(filename_lower if filename_lower is not None else filename.lower())
+    return f"sq{match.group(1)}" if match else "sq0000"
+
+def extract_shot_from_filename(filename, filename_lower=None):
+    """Extract shot from filename (pass filename_lower to reuse a lowercased name)."""
+    # Look for sh0010, shot010, shot0010 patterns and normalize to sh#### format
+    match = _SHOT_RE.search(filename_lower if filename_lower is not None else filename.lower())
+    return f"sh{match.group(1)}" if match else "sh0000"
 
 def create_timeline_panel():
     """Create timeline panel with shot sequence and department management."""
@@ -3003,6 +3622,15 @@ def create_timeline_panel():
         print(f"Error creating timeline panel: {e}")
         return QWidget()
 
+SEARCH_FILTER_DEBOUNCE_MS = 150  # ms to wait after the last keystroke
+
+
+def _flush_filter_timer(filter_timer):
+    """Apply a pending debounced search right away (e.g. on Enter)."""
+    if filter_timer.isActive():
+        filter_timer.stop()
+        apply_filters()
+
 def create_search_panel():
     """Create search panel with Horus project selection."""
     try:
@@ -3011,7 +3639,7 @@ def create_search_panel():
                                        QFrame, QTableWidget, QGridLayout,
                                        QTableWidgetItem, QHeaderView, QAbstractItemView,
                                        QSizePolicy)
-        from PySide2.QtCore import Qt
+        from PySide2.QtCore import Qt, QTimer
 
         widget = QWidget()
         widget.setMinimumWidth(150)  # Allow widget to shrink
@@ -3169,6 +3797,12 @@ def create_search_panel():
         # Set row height
         media_table.verticalHeader().setDefaultSectionSize(25)
 
+        # Status dropdowns are styled once here, not with a stylesheet per row
+        media_table.setStyleSheet(STATUS_COMBO_STYLE)
+
+        # Thumbnail placeholders are painted, not stored on every item
+        media_table.setItemDelegateForColumn(0, MediaThumbnailDelegate(media_table))
+
         # Connect double-click signal
         media_table.itemDoubleClicked.connect(on_media_table_double_click)
 
@@ -3184,9 +3818,17 @@ def create_search_panel():
         department_filter.currentTextChanged.connect(apply_filters)
         shot_filter.currentTextChanged.connect(apply_filters)
         status_filter.currentTextChanged.connect(apply_filters)
-        search_input.textChanged.connect(apply_filters)
         version_toggle.stateChanged.connect(apply_filters)
 
+        # Debounce typing: filter once the user pauses instead of on every keystroke
+        filter_timer = QTimer(widget)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(SEARCH_FILTER_DEBOUNCE_MS)
+        filter_timer.timeout.connect(apply_filters)
+        search_input.textChanged.connect(lambda _text: filter_timer.start())
+        search_input.returnPressed.connect(lambda: _flush_filter_timer(filter_timer))
+        widget._filter_timer = filter_timer
+
         # Store references
         widget.project_selector = project_selector
         widget.refresh_horus_btn = reset_btn
@@ -3212,8 +3854,7 @@ def create_search_panel():
 def create_media_grid_panel():
     """Create media grid panel for Horus data."""
     try:
-        from PySide2.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QGridLayout, 
-                                       QLabel)
+        from PySide2.QtWidgets import QWidget, QVBoxLayout, QListView, QLabel, QMenu
         from PySide2.QtCore import Qt
         
         widget = QWidget()
@@ -3232,16 +3873,34 @@ def create_media_grid_panel():
         path_label.setObjectName("path_label")
         layout.addWidget(path_label)
         
-        # Grid
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        
-        grid_container = QWidget()
-        grid_layout = QGridLayout(grid_container)
-        grid_layout.setSpacing(4)
-        
-        scroll_area.setWidget(grid_container)
-        layout.addWidget(scroll_area, 1)
+        # Grid (model/view: cards are painted by the delegate, only when visible)
+        grid_model = MediaGridModel()
+        grid_view = QListView()
+        grid_view.setViewMode(QListView.IconMode)
+        grid_view.setResizeMode(QListView.Adjust)
+        grid_view.setFlow(QListView.LeftToRight)
+        grid_view.setWrapping(True)
+        grid_view.setUniformItemSizes(True)
+        grid_view.setMovement(QListView.Static)
+        grid_view.setSpacing(2)
+        grid_view.setMouseTracking(True)  # hover highlight
+        grid_view.setModel(grid_model)
+        grid_view.setItemDelegate(MediaGridDelegate(grid_view))
+        grid_view.setStyleSheet("QListView { background-color: #2b2b2b; border: none; }")
+
+        # Left click loads in RV, right click shows the playlist menu
+        grid_view.clicked.connect(on_media_grid_clicked)
+        grid_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        grid_view.customContextMenuRequested.connect(on_media_grid_context_menu)
+
+        # Context menu is built once; each right click only retargets it
+        grid_menu = QMenu(grid_view)
+        grid_menu.addAction("Add to Current Playlist").triggered.connect(on_media_grid_add_to_playlist)
+        grid_menu.addAction("Load in RV").triggered.connect(on_media_grid_load_in_rv)
+        grid_view._menu = grid_menu
+        grid_view._menu_media_item = None
+
+        layout.addWidget(grid_view, 1)
         
         # Status
         status_label = QLabel("Ready - Connect to Horus")
@@ -3252,8 +3911,8 @@ def create_media_grid_panel():
         # Store references
         widget.path_label = path_label
         widget.status_label = status_label
-        widget.grid_layout = grid_layout
-        widget.grid_container = grid_container
+        widget.grid_view = grid_view
+        widget.grid_model = grid_model
         
         print("Media grid panel created")
         return widget
@@ -3268,7 +3927,7 @@ def setup_horus_integration():
 
     try:
         # Get widgets first
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             print("Could not find search widget")
             return False
@@ -3276,63 +3935,69 @@ def setup_horus_integration():
         project_selector = search_widget.project_selector
 
         # Block signals during setup to prevent premature triggers
-        project_selector.blockSignals(True)
-        project_selector.clear()
-
-        # Initialize file system backend first (if available)
-        if USE_FILE_SYSTEM_BACKEND and HORUS_FS_AVAILABLE:
-            if init_file_system_backend():
-                print("✅ Using file system backend for media browsing")
-                print(f"   Mode: {horus_fs.access_mode}")
-
-                # Add SWA project
-                project_selector.addItem("SWA", "SWA")
-                current_project_id = "SWA"
+        # (unblocked on every exit path, including errors)
+        use_file_system = False
+        with _blocked(project_selector):
+            project_selector.clear()
+
+            # Initialize file system backend first (if available)
+            if USE_FILE_SYSTEM_BACKEND and HORUS_FS_AVAILABLE:
+                if init_file_system_backend():
+                    print("✅ Using file system backend for media browsing")
+                    print(f"   Mode: {horus_fs.access_mode}")
+
+                    # Add SWA project
+                    project_selector.addItem("SWA", "SWA")
+                    current_project_id = "SWA"
+                    use_file_system = True
+                else:
+                    print("⚠️ File system backend not available, falling back to sample_db")
+
+            if not use_file_system:
+                # Fallback: Initialize Horus connector with sample_db
+                data_dir = get_resource_path("sample_db")
+                print(f"🔍 Looking for Horus database at: {data_dir}")
+                horus_connector = get_horus_connector(data_dir)
+
+                if not horus_connector.is_available():
+                    print("⚠️  Horus data not available - using sample data")
+                    horus_connector = get_horus_connector("sample_db")
+                    if not horus_connector.is_available():
+                        print("❌ No Horus database found")
+                        return False
+
+                # Load projects from sample_db
+                projects = horus_connector.get_available_projects()
+                project_ids = [""] + [p.get('_id', p.get('id', '')) for p in projects]
+                labels = ["Select Project..."] + [
+                    f"{p.get('name', 'Unknown')} ({project_id})"
+                    for p, project_id in zip(projects, project_ids[1:])
+                ]
+
+                # One bulk insert, then attach the project ids as item data
+                project_selector.addItems(labels)
+                for i, project_id in enumerate(project_ids):
+                    project_selector.setItemData(i, project_id)
+
+        # Connect signals now that the selector is populated
+        # Project id is item data, so only an index change can change it
+        project_selector.currentIndexChanged.connect(on_project_changed)
+        search_widget.refresh_horus_btn.clicked.connect(refresh_horus_data)
 
-                # Unblock and connect signals
-                project_selector.blockSignals(False)
-                project_selector.currentTextChanged.connect(on_project_changed)
-                search_widget.refresh_horus_btn.clicked.connect(refresh_horus_data)
+        if use_file_system:
+            # Populate episodes AFTER signals connected
+            populate_episode_filter()
 
-                # Populate episodes AFTER signals connected
-                populate_episode_filter()
+            # Warm the sequence/shot listings so the first filter clicks don't walk the tree
+            prefetch_fs_listings_async()
 
-                # NOW reload playlists from file system backend
-                print("📋 Reloading playlists from file system backend...")
-                load_timeline_playlist_data()
-                update_playlist_autocomplete()
+            # NOW reload playlists from file system backend
+            print("📋 Reloading playlists from file system backend...")
+            load_timeline_playlist_data_async()
 
-                print("✅ File system backend ready - SWA project loaded")
-                print("   Select an Episode to browse media files")
-                return True
-            else:
-                print("⚠️ File system backend not available, falling back to sample_db")
-
-        # Fallback: Initialize Horus connector with sample_db
-        data_dir = get_resource_path("sample_db")
-        print(f"🔍 Looking for Horus database at: {data_dir}")
-        horus_connector = get_horus_connector(data_dir)
-
-        if not horus_connector.is_available():
-            print("⚠️  Horus data not available - using sample data")
-            horus_connector = get_horus_connector("sample_db")
-            if not horus_connector.is_available():
-                print("❌ No Horus database found")
-                project_selector.blockSignals(False)
-                return False
-
-        # Load projects from sample_db
-        projects = horus_connector.get_available_projects()
-        project_selector.addItem("Select Project...", "")
-        for project in projects:
-            project_id = project.get('_id', project.get('id', ''))
-            project_name = project.get('name', 'Unknown')
-            project_selector.addItem(f"{project_name} ({project_id})", project_id)
-
-        # Unblock and connect signals
-        project_selector.blockSignals(False)
-        project_selector.currentTextChanged.connect(on_project_changed)
-        search_widget.refresh_horus_btn.clicked.connect(refresh_horus_data)
+            print("✅ File system backend ready - SWA project loaded")
+            print("   Select an Episode to browse media files")
+            return True
 
         print(f"Horus integration setup (sample_db) - {len(projects)} projects")
         return True
@@ -3341,12 +4006,19 @@ def setup_horus_integration():
         print(f"Error setting up Horus integration: {e}")
         return False
 
+_in_project_change = False  # on_project_changed() re-entrancy guard
+
+
 def on_project_changed():
     """Handle project selection change."""
     global current_project_id, horus_connector, search_dock, media_grid_dock, horus_fs
+    global _in_project_change
+
+    if _in_project_change:
+        return
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -3354,27 +4026,30 @@ def on_project_changed():
         if not project_id or project_id == current_project_id:
             return
 
+        _in_project_change = True
         current_project_id = project_id
-        print(f"Loading project: {project_id}")
+        media_logger.debug("Loading project: %s", project_id)
 
         # Use file system backend if available
         if USE_FILE_SYSTEM_BACKEND and horus_fs and horus_fs.access_mode != "none":
-            # Populate episode filter
-            populate_episode_filter()
-            # Clear other filters
-            search_widget.sequence_filter.clear()
-            search_widget.sequence_filter.addItem("All")
-            search_widget.shot_filter.clear()
-            search_widget.shot_filter.addItem("All")
-            # Clear table (user needs to select episode first)
-            search_widget.media_table.setRowCount(0)
+            # Reset filters and table without cascading apply_filters reloads
+            with _blocked(search_widget.episode_filter, search_widget.sequence_filter,
+                          search_widget.shot_filter, search_widget.media_table):
+                # Populate episode filter
+                populate_episode_filter()
+                # Clear other filters
+                _set_combo_items(search_widget.sequence_filter, ["All"])
+                _set_combo_items(search_widget.shot_filter, ["All"])
+                # Clear table (user needs to select episode first)
+                search_widget.media_table.setRowCount(0)
             print(f"✅ Project {project_id} loaded - Select an episode to see media")
             return
 
         # Fallback to horus_connector
         if horus_connector:
             horus_connector.set_current_project(project_id)
-            media_items = horus_connector.get_media_for_project(project_id)
+            # Media and pre-parsed filter keys are loaded once per project
+            media_items = _get_project_media(project_id)["items"]
 
             # Update grid
             populate_media_grid(media_items)
@@ -3391,10 +4066,12 @@ def on_project_changed():
                 media_grid_widget.path_label.setText(f"Project: {project_id}")
                 media_grid_widget.status_label.setText(f"Loaded {len(media_items)} items")
 
-            print(f"Loaded {len(media_items)} media items")
+            media_logger.debug("Loaded %d media items", len(media_items))
 
     except Exception as e:
         print(f"Error loading project: {e}")
+    finally:
+        _in_project_change = False
 
 def populate_media_grid(media_items):
     """Populate media grid with Horus data."""
@@ -3405,156 +4082,378 @@ def populate_media_grid(media_items):
         if not media_grid_widget:
             return
         
-        # Clear grid
-        grid_layout = media_grid_widget.grid_layout
-        for i in reversed(range(grid_layout.count())):
-            child = grid_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        # Add items
-        for i, media_item in enumerate(media_items):
-            media_widget = create_media_widget(media_item)
-            row = i // 4
-            col = i % 4
-            grid_layout.addWidget(media_widget, row, col)
+        # One model reset; the view only paints the cards that are visible
+        media_grid_widget.grid_model.set_items(media_items)
         
     except Exception as e:
         print(f"Error populating grid: {e}")
 
-def create_media_widget(media_item):
-    """Create widget for media item."""
-    try:
-        from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel
-        from PySide2.QtCore import Qt
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(2)
-        
+
+MEDIA_GRID_CARD_SIZE = QSize(148, 100)
+
+_MEDIA_CARD_BG = QColor("#3a3a3a")
+_MEDIA_CARD_BG_HOVER = QColor("#4a4a4a")
+_MEDIA_CARD_BORDER = QColor("#555555")
+_MEDIA_CARD_BORDER_HOVER = QColor("#0078d4")
+_MEDIA_CARD_TEXT = QColor("#e0e0e0")
+_MEDIA_CARD_DIM_TEXT = QColor("#888888")
+_MEDIA_STATUS_QCOLORS = {
+    "approved": QColor("#00aa00"),
+    "rejected": QColor("#aa0000"),
+}
+_MEDIA_STATUS_DEFAULT_QCOLOR = QColor("#aaaa00")
+
+
+class MediaGridModel(QAbstractListModel):
+    """List model over media item dicts for the media grid view."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+
+    def set_items(self, media_items):
+        self.beginResetModel()
+        self._items = list(media_items)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        media_item = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return media_item.get('file_name', 'Unknown')
+        if role == Qt.UserRole:
+            return media_item
+        if role == Qt.ToolTipRole:
+            return (f"Task: {media_item.get('task_id', '')}\n"
+                    f"Version: {media_item.get('version', '')}\n"
+                    f"Status: {media_item.get('approval_status', 'pending')}")
+        return None
+
+
+class MediaGridDelegate(QStyledItemDelegate):
+    """Paints a media grid card (name, task, version, status) with QPainter."""
+
+    def sizeHint(self, option, index):
+        return MEDIA_GRID_CARD_SIZE
+
+    def paint(self, painter, option, index):
+        media_item = index.data(Qt.UserRole) or {}
+        hovered = bool(option.state & (QStyle.State_MouseOver | QStyle.State_Selected))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        painter.setPen(_MEDIA_CARD_BORDER_HOVER if hovered else _MEDIA_CARD_BORDER)
+        painter.setBrush(_MEDIA_CARD_BG_HOVER if hovered else _MEDIA_CARD_BG)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        text_rect = rect.adjusted(4, 4, -4, -4)
+        line_height = 14
+        name_rect = text_rect.adjusted(0, 0, 0, -3 * line_height)
+
         # File name
-        file_name = media_item.get('file_name', 'Unknown')
-        name_label = QLabel(file_name)
-        name_label.setWordWrap(True)
-        name_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(name_label)
-        
-        # Task
-        task_id = media_item.get('task_id', '')
-        task_label = QLabel(f"Task: {task_id}")
-        task_label.setAlignment(Qt.AlignCenter)
-        task_label.setStyleSheet("font-size: 9px; color: #888888;")
-        layout.addWidget(task_label)
-        
-        # Version
-        version = media_item.get('version', '')
-        version_label = QLabel(f"Version: {version}")
-        version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("font-size: 9px; color: #888888;")
-        layout.addWidget(version_label)
-        
-        # Status
+        painter.setPen(_MEDIA_CARD_TEXT)
+        painter.drawText(name_rect, Qt.AlignCenter | Qt.TextWordWrap,
+                         media_item.get('file_name', 'Unknown'))
+
+        # Task / Version / Status
+        font = painter.font()
+        font.setPixelSize(9)
+        painter.setFont(font)
+
         status = media_item.get('approval_status', 'pending')
-        status_label = QLabel(f"Status: {status}")
-        status_label.setAlignment(Qt.AlignCenter)
-        status_color = "#00aa00" if status == "approved" else "#aa0000" if status == "rejected" else "#aaaa00"
-        status_label.setStyleSheet(f"font-size: 9px; color: {status_color};")
-        layout.addWidget(status_label)
-        
-        # Style with dark theme
-        widget.setStyleSheet("""
-            QWidget {
-                border: 1px solid #555555;
-                background-color: #3a3a3a;
-                border-radius: 4px;
-                min-height: 100px;
-                min-width: 140px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-                background-color: #4a4a4a;
-            }
-            QLabel {
-                background-color: transparent;
-                color: #e0e0e0;
-            }
-        """)
-        
-        # Store data
-        widget.horus_data = media_item
-        
-        # Click handler with right-click context menu
-        def on_click(event):
-            try:
-                from PySide2.QtCore import Qt
-                from PySide2.QtWidgets import QMenu, QAction
-
-                if event.button() == Qt.LeftButton:
-                    # Left click - load in RV
-                    file_path = media_item.get('file_path', '')
-                    if file_path:
-                        try:
-                            import rv.commands as rvc
-                            rvc.addSource(file_path)
-                            print(f"Loaded in RV: {file_name}")
-                        except:
-                            print(f"Selected: {file_name}")
-                    else:
-                        print(f"No path for: {file_name}")
-
-                elif event.button() == Qt.RightButton:
-                    # Right click - show context menu
-                    if ENABLE_TIMELINE_PLAYLIST and timeline_playlist_dock:
-                        menu = QMenu(widget)
-
-                        # Add to playlist action
-                        add_to_playlist_action = QAction("Add to Current Playlist", menu)
-                        add_to_playlist_action.triggered.connect(
-                            lambda: add_media_to_current_playlist(media_item)
-                        )
-                        menu.addAction(add_to_playlist_action)
-
-                        # Load in RV action
-                        load_action = QAction("Load in RV", menu)
-                        load_action.triggered.connect(
-                            lambda: on_click_load_rv(media_item)
-                        )
-                        menu.addAction(load_action)
-
-                        # Show menu at cursor position
-                        menu.exec_(event.globalPos())
+        lines = (
+            (f"Task: {media_item.get('task_id', '')}", _MEDIA_CARD_DIM_TEXT),
+            (f"Version: {media_item.get('version', '')}", _MEDIA_CARD_DIM_TEXT),
+            (f"Status: {status}", _MEDIA_STATUS_QCOLORS.get(status, _MEDIA_STATUS_DEFAULT_QCOLOR)),
+        )
+        y = name_rect.bottom() + 1
+        for text, color in lines:
+            painter.setPen(color)
+            painter.drawText(text_rect.left(), y, text_rect.width(), line_height,
+                             Qt.AlignCenter, text)
+            y += line_height
+
+        painter.restore()
+
+
+def _load_media_item_in_rv(media_item):
+    """Load a media grid item in RV."""
+    file_name = media_item.get('file_name', 'Unknown')
+    file_path = media_item.get('file_path', '')
+    if file_path:
+        if _rvc is not None:
+            _rvc.addSource(file_path)
+            print(f"Loaded in RV: {file_name}")
+        else:
+            print(f"Selected: {file_name}")
+    else:
+        print(f"No path for: {file_name}")
 
-            except Exception as e:
-                print(f"Error: {e}")
-
-        def on_click_load_rv(media_item):
-            """Load media item in RV."""
-            file_path = media_item.get('file_path', '')
-            if file_path:
-                try:
-                    import rv.commands as rvc
-                    rvc.addSource(file_path)
-                    print(f"Loaded in RV: {media_item.get('file_name', 'Unknown')}")
-                except:
-                    print(f"Selected: {media_item.get('file_name', 'Unknown')}")
-
-        widget.mousePressEvent = on_click
-        
-        return widget
-        
+
+@Slot("QModelIndex")
+def on_media_grid_clicked(index):
+    """Left click on a media grid card - load in RV."""
+    try:
+        media_item = index.data(Qt.UserRole)
+        if media_item:
+            _load_media_item_in_rv(media_item)
     except Exception as e:
-        print(f"Error creating widget: {e}")
-        return QWidget()
+        print(f"Error: {e}")
+
+
+@Slot("QPoint")
+def on_media_grid_context_menu(position):
+    """Right click on a media grid card - playlist/RV context menu."""
+    try:
+        if not (ENABLE_TIMELINE_PLAYLIST and timeline_playlist_dock):
+            return
+
+        media_grid_widget = media_grid_dock.widget() if media_grid_dock else None
+        if not media_grid_widget:
+            return
+
+        grid_view = media_grid_widget.grid_view
+        media_item = grid_view.indexAt(position).data(Qt.UserRole)
+        if not media_item:
+            return
+
+        # Point the shared menu at this card and show it at the cursor
+        grid_view._menu_media_item = media_item
+        grid_view._menu.exec_(grid_view.viewport().mapToGlobal(position))
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def _media_grid_menu_item():
+    """Media item the shared media grid context menu was last opened on."""
+    media_grid_widget = media_grid_dock.widget() if media_grid_dock else None
+    if not media_grid_widget:
+        return None
+    return media_grid_widget.grid_view._menu_media_item
+
+
+@Slot()
+def on_media_grid_add_to_playlist():
+    """Media grid menu: add the card's media to the current playlist."""
+    media_item = _media_grid_menu_item()
+    if media_item:
+        add_media_to_current_playlist(media_item)
+
+
+@Slot()
+def on_media_grid_load_in_rv():
+    """Media grid menu: load the card's media in RV."""
+    media_item = _media_grid_menu_item()
+    if media_item:
+        _load_media_item_in_rv(media_item)
+
+
+_THUMB_PLACEHOLDER_BG = QColor("#2d2d2d")
+MEDIA_INDEX_ROLE = Qt.UserRole + 1  # Task Entity item: index into the project's media list
+MEDIA_THUMB_ROLE = Qt.UserRole + 2  # Thumbnail item: thumbnail path ("" if the record has none)
+
+THUMB_SIZE = QSize(128, 96)
+THUMB_CACHE_MAX = 512  # decoded thumbnails kept in memory (~48 KB each at THUMB_SIZE)
+THUMB_LOADER_THREADS = 4  # decode workers; more just contend for the disk
+_thumb_cache = OrderedDict()  # thumbnail path -> scaled QPixmap, least recently used first
+_thumb_pending = {}  # thumbnail path -> QPersistentModelIndexes of cells waiting for it
+_thumb_pool = None
+_thumb_signals = None
+
+
+class MediaThumbnailDelegate(QStyledItemDelegate):
+    """Paints an [IMG] placeholder in media table thumbnail cells without a pixmap.
+
+    Other cells in the column (no MEDIA_THUMB_ROLE) paint normally.
+    """
+
+    def paint(self, painter, option, index):
+        if index.data(MEDIA_THUMB_ROLE) is None or index.data(Qt.DecorationRole) is not None:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        else:
+            painter.fillRect(option.rect, _THUMB_PLACEHOLDER_BG)
+        painter.setPen(_CLIP_TEXT_QCOLOR)
+        painter.drawText(option.rect, Qt.AlignCenter, "[IMG]")
+        painter.restore()
+
+
+def _thumbnail_path(media_item):
+    """Resolve a media record's thumbnail_key against the sample_db directory."""
+    thumbnail_key = media_item.get('thumbnail_key')
+    if not thumbnail_key or not horus_connector:
+        return None
+    return str(horus_connector.data_dir / thumbnail_key)
+
+
+def _cached_thumb(path):
+    """Return the cached QPixmap for path (null for unreadable files), or None if not loaded yet."""
+    pixmap = _thumb_cache.get(path)
+    if pixmap is not None:
+        _thumb_cache.move_to_end(path)
+    return pixmap
+
+
+def _store_thumb(path, pixmap):
+    """Add a decoded thumbnail to _thumb_cache, evicting the least recently used."""
+    _thumb_cache[path] = pixmap
+    if len(_thumb_cache) > THUMB_CACHE_MAX:
+        _thumb_cache.popitem(last=False)
+
+
+class ThumbnailLoaderSignals(QObject):
+    """Signals for ThumbnailLoader (QRunnable is not a QObject)."""
+    loaded = Signal(str, object)  # path, scaled QImage (null if unreadable)
+
+
+class ThumbnailLoader(QRunnable):
+    """Decode and scale one thumbnail on a worker thread.
+
+    Only QImage is touched here; on_thumbnail_loaded() converts it to a
+    QPixmap on the UI thread, which some platforms require.
+    """
+
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        from PySide2.QtGui import QImage
+
+        try:
+            image = QImage(self.path)
+            if not image.isNull():
+                image = image.scaled(THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        except Exception as e:
+            logger.exception("Error decoding thumbnail %s: %s", self.path, e)
+            image = QImage()
+        self.signals.loaded.emit(self.path, image)
+
+
+def _request_thumb(path, index):
+    """Decode path in the background and show it in the cell at index when done."""
+    global _thumb_pool, _thumb_signals
+
+    waiting = _thumb_pending.get(path)
+    if waiting is not None:
+        # Already being decoded for another row
+        waiting.append(QPersistentModelIndex(index))
+        return
+
+    if _thumb_pool is None:
+        _thumb_pool = QThreadPool()
+        _thumb_pool.setMaxThreadCount(THUMB_LOADER_THREADS)
+        _thumb_signals = ThumbnailLoaderSignals()
+        _thumb_signals.loaded.connect(on_thumbnail_loaded)
+
+    _thumb_pending[path] = [QPersistentModelIndex(index)]
+    _thumb_pool.start(ThumbnailLoader(path, _thumb_signals))
+
+
+@Slot(str, object)
+def on_thumbnail_loaded(path, image):
+    """Receive a decoded thumbnail from ThumbnailLoader on the UI thread."""
+    try:
+        from PySide2.QtGui import QPixmap
+
+        pixmap = QPixmap.fromImage(image)
+        _store_thumb(path, pixmap)
+
+        for index in _thumb_pending.pop(path, ()):
+            # Rows removed by a table rebuild since the request are invalid
+            if index.isValid() and not pixmap.isNull():
+                index.model().setData(index, pixmap, Qt.DecorationRole)
+    except Exception as e:
+        logger.exception("Error showing thumbnail %s: %s", path, e)
+
+
+# Canonical task id, e.g. ep00_sq0010_sh0020_lighting -> (episode, sequence, shot, department)
+_TASK_RE = re.compile(r'^(ep\d+)_(sq\d+)_(sh\d+)_([^_]+)$')
+
+
+def _media_table_row(media_item):
+    """Display values for one media table row.
+
+    Returns (task_entity, display_name, version, approval_status, created_display, media_item).
+    """
+    # Extract data from media item
+    file_name = media_item.get('file_name', 'Unknown')
+    version = media_item.get('version', media_item.get('linked_version', 'v001'))
+    task_id = media_item.get('task_id') or media_item.get('linked_task_id', 'Unknown')
+    created_at = media_item.get('created_at', media_item.get('_created_at', ''))
+    approval_status = media_item.get('approval_status', 'pending')
+
+    # Common case: canonical ep##_sq####_sh####_dept in one match
+    match = _TASK_RE.match(task_id)
+    if match:
+        episode, sequence, shot, task_entity = match.groups()
+        if file_name and file_name != 'Unknown':
+            display_name = file_name
+        else:
+            display_name = f"{episode}_{sequence}_{shot}"
+        return (task_entity, display_name, version, approval_status,
+                _format_created_date(created_at), media_item)
+
+    parts = task_id.split("_") if "_" in task_id else []
+
+    # Parse task entity (department from task_id)
+    task_entity = "unknown"
+    if len(parts) >= 4:
+        task_entity = parts[-1]  # Last part is usually the department
+
+    # Use the actual file name or create a proper shot name
+    if file_name and file_name != 'Unknown':
+        display_name = file_name
+    elif len(parts) >= 3:
+        # Parse shot name from task_id as fallback
+        # Format: ep00_sq0010_sh0020_lighting -> ep01_sq0010_sh0010
+        episode = parts[0] if parts[0].startswith('ep') else 'ep01'
+        sequence = parts[1] if parts[1].startswith('sq') else 'sq0010'
+        shot = parts[2] if parts[2].startswith('sh') else 'sh0010'
+        display_name = f"{episode}_{sequence}_{shot}"
+    else:
+        display_name = task_id
+
+    return (task_entity, display_name, version, approval_status,
+            _format_created_date(created_at), media_item)
+
+
+def _format_created_date(created_at):
+    """Date part of a created_at timestamp for the media table."""
+    created_display = ""
+    if created_at:
+        try:
+            # Try to parse and format the date
+            if 'T' in created_at:
+                created_display = created_at.split('T')[0]
+            else:
+                created_display = created_at[:10] if len(created_at) >= 10 else created_at
+        except:
+            created_display = created_at
+    return created_display
+
 
 def update_media_table(project_id, media_items):
     """Update media table with thumbnails."""
     global search_dock
 
     try:
-        print(f"Updating media table for project {project_id} with {len(media_items)} items")
+        media_logger.debug("Updating media table for project %s with %d items",
+                           project_id, len(media_items))
 
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             print("No search widget found")
             return
@@ -3564,93 +4463,97 @@ def update_media_table(project_id, media_items):
             print("No media table found")
             return
 
-        # Clear existing rows
-        media_table.setRowCount(0)
+        # Precompute the row values in one pass before touching the table
+        rows = [_media_table_row(media_item) for media_item in media_items]
 
-        # Populate table with media items
-        from PySide2.QtWidgets import QLabel, QTableWidgetItem
-        from PySide2.QtCore import Qt
-        from PySide2.QtGui import QPixmap
+        # Sorting re-orders on every setItem and each insert repaints;
+        # size the table once and fill it with both suspended
+        sorting = media_table.isSortingEnabled()
+        media_table.setSortingEnabled(False)
+        media_table.setUpdatesEnabled(False)
+        try:
+            media_table.setRowCount(0)
+            media_table.setRowCount(len(rows))
+
+            for row, (task_entity, display_name, version, approval_status,
+                      created_display, media_item) in enumerate(rows):
+                # Thumbnail column - a plain item, not a QLabel cell widget
+                # (MediaThumbnailDelegate paints the placeholder until a pixmap is set)
+                thumb_path = _thumbnail_path(media_item)
+                thumb = _cached_thumb(thumb_path) if thumb_path else None
+                thumbnail_item = QTableWidgetItem()
+                thumbnail_item.setData(MEDIA_THUMB_ROLE, thumb_path or "")
+                if thumb is not None and not thumb.isNull():
+                    thumbnail_item.setData(Qt.DecorationRole, thumb)
+                media_table.setItem(row, 0, thumbnail_item)
+                if thumb_path and thumb is None:
+                    # Not decoded yet: keep the placeholder until the worker delivers it
+                    _request_thumb(thumb_path, media_table.model().index(row, 0))
+
+                # Task Entity column
+                task_item = QTableWidgetItem(task_entity)
+                task_item.setData(Qt.UserRole, media_item)
+                task_item.setData(MEDIA_INDEX_ROLE, row)  # position in media_items, for filtering
+                media_table.setItem(row, 1, task_item)
+
+                # Name column
+                media_table.setItem(row, 2, QTableWidgetItem(display_name))
+
+                # Version column
+                media_table.setItem(row, 3, QTableWidgetItem(version))
+
+                # Status column (colored like the media grid cards)
+                status_item = QTableWidgetItem(approval_status)
+                status_item.setForeground(
+                    _MEDIA_STATUS_QCOLORS.get(approval_status, _MEDIA_STATUS_DEFAULT_QCOLOR))
+                media_table.setItem(row, 4, status_item)
+
+                # Created column
+                media_table.setItem(row, 5, QTableWidgetItem(created_display))
+        finally:
+            media_table.setSortingEnabled(sorting)
+            media_table.setUpdatesEnabled(True)
+
+        search_widget._media_table_project = project_id
+
+        media_logger.debug("Populated media table with %d items", len(media_items))
 
-        for row, media_item in enumerate(media_items):
-            media_table.insertRow(row)
+    except Exception as e:
+        print(f"Error updating media table: {e}")
 
-            # Extract data from media item
-            file_name = media_item.get('file_name', 'Unknown')
-            version = media_item.get('version', media_item.get('linked_version', 'v001'))
-            task_id = media_item.get('task_id') or media_item.get('linked_task_id', 'Unknown')
-            created_at = media_item.get('created_at', media_item.get('_created_at', ''))
-            approval_status = media_item.get('approval_status', 'pending')
+# project_id -> {"items": media list, "filter_index": _build_media_filter_index(items)}
+_project_media_cache = {}
 
-            # Parse task entity (department from task_id)
-            task_entity = "unknown"
-            if "_" in task_id:
-                parts = task_id.split("_")
-                if len(parts) >= 4:
-                    task_entity = parts[-1]  # Last part is usually the department
 
-            # Use the actual file name or create a proper shot name
-            if file_name and file_name != 'Unknown':
-                display_name = file_name
-            else:
-                # Parse shot name from task_id as fallback
-                if "_" in task_id:
-                    parts = task_id.split("_")
-                    if len(parts) >= 3:
-                        # Format: ep00_sq0010_sh0020_lighting -> ep01_sq0010_sh0010
-                        episode = parts[0] if parts[0].startswith('ep') else 'ep01'
-                        sequence = parts[1] if parts[1].startswith('sq') else 'sq0010'
-                        shot = parts[2] if parts[2].startswith('sh') else 'sh0010'
-                        display_name = f"{episode}_{sequence}_{shot}"
-                    else:
-                        display_name = task_id
-                else:
-                    display_name = task_id
-
-            # Format created date
-            created_display = ""
-            if created_at:
-                try:
-                    # Try to parse and format the date
-                    if 'T' in created_at:
-                        date_part = created_at.split('T')[0]
-                        created_display = date_part
-                    else:
-                        created_display = created_at[:10] if len(created_at) >= 10 else created_at
-                except:
-                    created_display = created_at
-
-            # Thumbnail column (placeholder for now)
-            thumbnail_label = QLabel("[IMG]")
-            thumbnail_label.setAlignment(Qt.AlignCenter)
-            thumbnail_label.setStyleSheet("background-color: #2d2d2d; color: #ffffff; border: 1px solid #555;")
-            media_table.setCellWidget(row, 0, thumbnail_label)
-
-            # Task Entity column
-            task_item = QTableWidgetItem(task_entity)
-            task_item.setData(Qt.UserRole, media_item)
-            media_table.setItem(row, 1, task_item)
-
-            # Name column
-            name_item = QTableWidgetItem(display_name)
-            media_table.setItem(row, 2, name_item)
-
-            # Version column
-            version_item = QTableWidgetItem(version)
-            media_table.setItem(row, 3, version_item)
+def _get_project_media(project_id):
+    """Return the cached media entry for project_id, loading it on first use."""
+    entry = _project_media_cache.get(project_id)
+    if entry is None:
+        media_items = horus_connector.get_media_for_project(project_id)
+        entry = _project_media_cache[project_id] = {
+            "items": media_items,
+            "filter_index": _build_media_filter_index(media_items),
+        }
+    return entry
 
-            # Status column
-            status_item = QTableWidgetItem(approval_status)
-            media_table.setItem(row, 4, status_item)
 
-            # Created column
-            created_item = QTableWidgetItem(created_display)
-            media_table.setItem(row, 5, created_item)
+def _build_media_filter_index(media_items):
+    """Pre-parse the fields apply_filters tests, once per project load.
 
-        print(f"Populated media table with {len(media_items)} items")
+    Returns (task_id, task_id_lower, file_name_lower, approval_status, item) tuples.
+    """
+    index = []
+    for item in media_items:
+        task_id = item.get('task_id') or item.get('linked_task_id', '')
+        index.append((
+            task_id,
+            task_id.lower(),
+            item.get('file_name', '').lower(),
+            item.get('approval_status', 'pending'),
+            item,
+        ))
+    return index
 
-    except Exception as e:
-        print(f"Error updating media table: {e}")
 
 def apply_filters():
     """Apply filters to the media table."""
@@ -3665,7 +4568,7 @@ def apply_filters():
         if not current_project_id or not horus_connector:
             return
 
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -3677,53 +4580,42 @@ def apply_filters():
         status = search_widget.status_filter.currentText()
         search_text = search_widget.search_input.text().lower()
 
-        # Get all media items for current project
-        all_media_items = horus_connector.get_media_for_project(current_project_id)
+        # Cached media + pre-parsed filter keys (no refetch per keystroke)
+        filter_index = _get_project_media(current_project_id)["filter_index"]
+
+        # Lowercase the filter values once, not per item
+        department_lc = department.lower() if department != "All" else None
+        episode_lc = episode.lower() if episode != "All" else None
+        sequence_lc = sequence.lower() if sequence != "All" else None
+        shot_lc = shot.lower() if shot != "All" else None
+        status = status if status != "All" else None
+
+        # Apply filters in one pass (collect the indices of matching items)
+        accepted = {
+            i for i, (task_id, task_id_lc, file_name_lc, item_status, item) in enumerate(filter_index)
+            if (department_lc is None or task_id.endswith(department_lc))
+            and (episode_lc is None or task_id.startswith(episode_lc))
+            and (sequence_lc is None or sequence_lc in task_id)
+            and (shot_lc is None or shot_lc in task_id)
+            and (status is None or item_status == status)
+            and (not search_text or search_text in file_name_lc or search_text in task_id_lc)
+        }
 
-        # Apply filters
-        filtered_items = []
-        for item in all_media_items:
-            # Apply department filter
-            if department != "All":
-                task_id = item.get('task_id') or item.get('linked_task_id', '')
-                if not task_id.endswith(department.lower()):
-                    continue
-
-            # Apply episode filter
-            if episode != "All":
-                task_id = item.get('task_id') or item.get('linked_task_id', '')
-                if not task_id.startswith(episode.lower()):
-                    continue
-
-            # Apply sequence filter
-            if sequence != "All":
-                task_id = item.get('task_id') or item.get('linked_task_id', '')
-                if sequence.lower() not in task_id:
-                    continue
-
-            # Apply shot filter
-            if shot != "All":
-                task_id = item.get('task_id') or item.get('linked_task_id', '')
-                if shot.lower() not in task_id:
-                    continue
-
-            # Apply status filter
-            if status != "All":
-                item_status = item.get('approval_status', 'pending')
-                if item_status != status:
-                    continue
-
-            # Apply search text filter
-            if search_text:
-                file_name = item.get('file_name', '').lower()
-                task_id = item.get('task_id') or item.get('linked_task_id', '')
-                if search_text not in file_name and search_text not in task_id.lower():
-                    continue
-
-            filtered_items.append(item)
-
-        # Update table with filtered items
-        update_media_table(current_project_id, filtered_items)
+        # The table holds the project's full media list; filtering only
+        # shows/hides rows, keeping scroll position, selection and sort
+        media_table = search_widget.media_table
+        if (getattr(search_widget, '_media_table_project', None) != current_project_id
+                or media_table.rowCount() != len(filter_index)):
+            update_media_table(current_project_id, _get_project_media(current_project_id)["items"])
+
+        media_table.setUpdatesEnabled(False)
+        try:
+            for row in range(media_table.rowCount()):
+                task_item = media_table.item(row, 1)
+                index = task_item.data(MEDIA_INDEX_ROLE) if task_item else None
+                media_table.setRowHidden(row, index not in accepted)
+        finally:
+            media_table.setUpdatesEnabled(True)
 
     except Exception as e:
         print(f"Error applying filters: {e}")
@@ -3733,7 +4625,7 @@ def update_shot_filter(media_items):
     global search_dock
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -3743,7 +4635,10 @@ def update_shot_filter(media_items):
         shots = set()
         for item in media_items:
             task_id = item.get('task_id') or item.get('linked_task_id', '')
-            if "_" in task_id:
+            match = _TASK_RE.match(task_id)
+            if match:
+                shots.add(match.group(3))
+            elif "_" in task_id:
                 parts = task_id.split("_")
                 if len(parts) >= 3:
                     shot = parts[2]  # Usually the shot part
@@ -3751,10 +4646,7 @@ def update_shot_filter(media_items):
                         shots.add(shot)
 
         # Update shot filter
-        shot_filter.clear()
-        shot_filter.addItem("All")
-        for shot in sorted(shots):
-            shot_filter.addItem(shot)
+        _set_combo_items(shot_filter, ["All"] + sorted(shots))
 
     except Exception as e:
         print(f"Error updating shot filter: {e}")
@@ -3785,6 +4677,123 @@ def init_file_system_backend():
         return False
 
 
+@contextmanager
+def _blocked(*objs):
+    """Block signals of objs for the with-block (restored even on error)."""
+    blockers = [QSignalBlocker(obj) for obj in objs]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+def _set_combo_items(combo, items):
+    """Replace combo items in one bulk insert without emitting change signals.
+
+    Per-item addItem() emits currentTextChanged/currentIndexChanged, each of
+    which re-runs apply_filters.
+    """
+    with _blocked(combo):
+        combo.clear()
+        combo.addItems(items)
+
+
+FS_LISTING_TTL = 30.0  # seconds before an episode/sequence/shot listing is re-read
+# ("list_episodes",) / ("list_sequences", ep) / ("list_shots", ep, seq) -> (time.monotonic(), listing)
+_fs_listing_cache = {}
+
+
+def _cached_fs_list(method, *args):
+    """Return horus_fs.<method>(*args), reusing a listing younger than FS_LISTING_TTL.
+
+    Filter changes re-populate the sequence/shot combos, and each listing is a
+    directory walk (or an SSH round trip) on the backend.
+    """
+    key = (method,) + args
+    now = time.monotonic()
+    entry = _fs_listing_cache.get(key)
+    if entry is not None and now - entry[0] < FS_LISTING_TTL:
+        return entry[1]
+
+    listing = getattr(horus_fs, method)(*args)
+    _fs_listing_cache[key] = (now, listing)
+    return listing
+
+
+def invalidate_fs_cache():
+    """Forget cached episode/sequence/shot listings (Refresh button)."""
+    _fs_listing_cache.clear()
+
+
+FS_PREFETCH_MAX_EPISODES = 20  # larger trees are only listed on demand
+
+
+class FsListingPrefetcherSignals(QObject):
+    """Signals for FsListingPrefetcher (QRunnable is not a QObject)."""
+    finished = Signal(object)  # {_fs_listing_cache key: listing}
+
+
+class FsListingPrefetcher(QRunnable):
+    """Walk episode -> sequence -> shot listings on a QThreadPool worker thread.
+
+    Results go to on_fs_listings_prefetched() on the UI thread, which is the
+    only place _fs_listing_cache is written.
+    """
+
+    def __init__(self, fs, episodes):
+        super().__init__()
+        self.fs = fs
+        self.episodes = episodes
+        self.signals = FsListingPrefetcherSignals()
+
+    def run(self):
+        listings = {}
+        try:
+            for ep in self.episodes:
+                episode = ep['name']
+                sequences = self.fs.list_sequences(episode)
+                listings[("list_sequences", episode)] = sequences
+                for seq in sequences:
+                    sequence = seq['name']
+                    listings[("list_shots", episode, sequence)] = self.fs.list_shots(episode, sequence)
+        except Exception as e:
+            media_logger.exception("Error prefetching file system listings: %s", e)
+        self.signals.finished.emit(listings)
+
+
+_fs_prefetcher = None  # Keep the in-flight prefetcher (and its signals) alive
+
+
+def prefetch_fs_listings_async():
+    """Warm _fs_listing_cache with every episode's sequences and shots in the background."""
+    global _fs_prefetcher
+
+    try:
+        episodes = _cached_fs_list("list_episodes")
+        if not episodes or len(episodes) > FS_PREFETCH_MAX_EPISODES:
+            return
+
+        _fs_prefetcher = FsListingPrefetcher(horus_fs, episodes)
+        _fs_prefetcher.signals.finished.connect(on_fs_listings_prefetched)
+        QThreadPool.globalInstance().start(_fs_prefetcher)
+    except Exception as e:
+        print(f"Error starting file system prefetch: {e}")
+
+
+@Slot(object)
+def on_fs_listings_prefetched(listings):
+    """Merge prefetched listings into _fs_listing_cache on the UI thread."""
+    global _fs_prefetcher
+
+    _fs_prefetcher = None
+    now = time.monotonic()
+    for key, listing in listings.items():
+        # Listings fetched on demand while the worker ran are at least as fresh
+        _fs_listing_cache.setdefault(key, (now, listing))
+    media_logger.debug("Prefetched %d file system listings", len(listings))
+
+
 def populate_episode_filter():
     """Populate episode filter from file system."""
     global search_dock, horus_fs
@@ -3793,20 +4802,13 @@ def populate_episode_filter():
         return
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
-        episode_filter = search_widget.episode_filter
-        episode_filter.blockSignals(True)
-        episode_filter.clear()
-        episode_filter.addItem("All")
-
-        episodes = horus_fs.list_episodes()
-        for ep in episodes:
-            episode_filter.addItem(ep['name'])
-
-        episode_filter.blockSignals(False)
+        episodes = _cached_fs_list("list_episodes")
+        _set_combo_items(search_widget.episode_filter,
+                         ["All"] + [ep['name'] for ep in episodes])
         print(f"📁 Loaded {len(episodes)} episodes")
 
     except Exception as e:
@@ -3821,21 +4823,19 @@ def populate_sequence_filter(episode: str):
         return
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
-        sequence_filter = search_widget.sequence_filter
-        sequence_filter.blockSignals(True)
-        sequence_filter.clear()
-        sequence_filter.addItem("All")
-
+        combo = search_widget.sequence_filter
+        items = ["All"]
         if episode and episode != "All":
-            sequences = horus_fs.list_sequences(episode)
-            for seq in sequences:
-                sequence_filter.addItem(seq['name'])
+            sequences = _cached_fs_list("list_sequences", episode)
+            items.extend(seq['name'] for seq in sequences)
+        elif combo.count() == 1 and combo.itemText(0) == "All":
+            return  # Already cleared
 
-        sequence_filter.blockSignals(False)
+        _set_combo_items(combo, items)
 
     except Exception as e:
         print(f"Error populating sequence filter: {e}")
@@ -3849,21 +4849,19 @@ def populate_shot_filter_fs(episode: str, sequence: str):
         return
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
-        shot_filter = search_widget.shot_filter
-        shot_filter.blockSignals(True)
-        shot_filter.clear()
-        shot_filter.addItem("All")
-
+        combo = search_widget.shot_filter
+        items = ["All"]
         if episode and episode != "All" and sequence and sequence != "All":
-            shots = horus_fs.list_shots(episode, sequence)
-            for shot in shots:
-                shot_filter.addItem(shot['name'])
+            shots = _cached_fs_list("list_shots", episode, sequence)
+            items.extend(shot['name'] for shot in shots)
+        elif combo.count() == 1 and combo.itemText(0) == "All":
+            return  # Already cleared
 
-        shot_filter.blockSignals(False)
+        _set_combo_items(combo, items)
 
     except Exception as e:
         print(f"Error populating shot filter: {e}")
@@ -3872,20 +4870,138 @@ def populate_shot_filter_fs(episode: str, sequence: str):
 _last_episode_filter = None
 _last_sequence_filter = None
 
+class MediaListLoaderSignals(QObject):
+    """Signals for MediaListLoader (QRunnable is not a QObject)."""
+    finished = Signal(object)  # (generation, list_args, media_items, filter_keys, status, search_text, status_revision)
+
+
+class MediaListLoader(QRunnable):
+    """Run horus_fs.list_media_files() on a QThreadPool worker thread.
+
+    The status and search-text filters travel with the job and are applied
+    on the UI thread in on_media_list_loaded(), which also re-reads statuses
+    saved while the scan ran.
+    """
+
+    def __init__(self, generation, fs, list_args, status, search_text):
+        super().__init__()
+        self.generation = generation
+        self.fs = fs
+        self.list_args = list_args  # (episode, sequence, shot, department, latest_only)
+        self.status = status
+        self.search_text = search_text
+        self.status_revision = fs.status_revision  # status saves seen when the scan started
+        self.signals = MediaListLoaderSignals()
+
+    def run(self):
+        episode, sequence, shot, department, latest_only = self.list_args
+        try:
+            media_items = self.fs.list_media_files(
+                episode, sequence, shot, department, latest_only=latest_only
+            )
+            media_items = media_items or []
+        except Exception as e:
+            media_logger.exception("Error listing media files: %s", e)
+            media_items = []
+        self.signals.finished.emit((self.generation, self.list_args, media_items,
+                                    _build_media_search_keys(media_items),
+                                    self.status, self.search_text, self.status_revision))
+
+
+_media_list_generation = 0  # bumped per apply_filters_fs(); older listings are dropped
+_media_list_loaders = {}  # generation -> in-flight loader (keeps it and its signals alive)
+
+# Last list_media_files() result, reused while only status/search text change;
+# status_revision is the horus_fs.status_revision its statuses reflect
+_last_media_listing = {"args": None, "items": [], "search_keys": [], "status_revision": None}
+
+
+def _build_media_search_keys(media_items):
+    """Lowercased (name, file_name) per item, computed once per listing, not per keystroke."""
+    return [(m.get('name', '').lower(), m.get('file_name', '').lower()) for m in media_items]
+
+
+@Slot(object)
+def on_media_list_loaded(result):
+    """Receive a MediaListLoader result on the UI thread."""
+    generation, list_args, media_items, search_keys, status, search_text, status_revision = result
+    _media_list_loaders.pop(generation, None)
+
+    # Filters changed while this listing ran; a newer one is on its way
+    if generation != _media_list_generation:
+        return
+
+    # A status was set while the scan ran; its items may hold the old value
+    if horus_fs and horus_fs.status_revision != status_revision:
+        horus_fs.apply_cached_statuses(media_items)
+
+    _last_media_listing.update(args=list_args, items=media_items, search_keys=search_keys,
+                               status_revision=horus_fs.status_revision if horus_fs else None)
+    try:
+        media_logger.debug("Found %d media files", len(media_items))
+        update_media_table_fs(_filter_media_items_fs(media_items, search_keys, status, search_text))
+    except Exception as e:
+        print(f"Error applying filters (fs): {e}")
+
+
+def _filter_media_items_fs(media_items, search_keys, status, search_text):
+    """Apply the status and search-text filters to a list_media_files() result."""
+    if status == "All" and not search_text:
+        return media_items
+
+    # Callers refresh the items' statuses first (see _reuse_media_listing())
+    return [
+        m for m, (name_lc, file_name_lc) in zip(media_items, search_keys)
+        if (status == "All" or m.get('status', 'submit') == status)
+        and (not search_text or search_text in name_lc or search_text in file_name_lc)
+    ]
+
+
+def invalidate_media_listing():
+    """Forget the last file system media listing so the next filter pass rescans."""
+    _last_media_listing.update(args=None, items=[], search_keys=[], status_revision=None)
+
+
+def _reuse_media_listing():
+    """The last listing's items, with statuses saved since the scan re-read.
+
+    on_navigator_status_changed() edits the combo's "item_data" property,
+    which PySide2 may hand back as a copy rather than the dict kept here.
+    """
+    items = _last_media_listing["items"]
+    if horus_fs and horus_fs.status_revision != _last_media_listing["status_revision"]:
+        horus_fs.apply_cached_statuses(items)
+        _last_media_listing["status_revision"] = horus_fs.status_revision
+    return items
+
+
 def apply_filters_fs():
-    """Apply filters using file system backend."""
+    """Apply filters using file system backend.
+
+    The directory scan runs on a worker thread; the table is updated by
+    on_media_list_loaded() when it finishes.
+    """
     global search_dock, horus_fs, _last_episode_filter, _last_sequence_filter
+    global _media_list_generation
 
     if not horus_fs or horus_fs.access_mode == "none":
         return
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
         # Get filter values
         episode = search_widget.episode_filter.currentText()
+
+        # Still no episode selected: the sequence/shot combos already hold
+        # only "All", so skip straight to clearing the table
+        if episode == "All" and _last_episode_filter == "All":
+            _media_list_generation += 1
+            update_media_table_fs([])
+            return
+
         sequence = search_widget.sequence_filter.currentText()
         department = search_widget.department_filter.currentText()
         shot = search_widget.shot_filter.currentText()
@@ -3906,101 +5022,156 @@ def apply_filters_fs():
             populate_shot_filter_fs(episode, sequence)
             shot = search_widget.shot_filter.currentText()  # Re-read after populate
 
+        # Any listing still in flight is for older filter values
+        _media_list_generation += 1
+
         # Get media files from file system
         if episode == "All":
-            # No episode selected, show nothing or all
-            media_items = []
-        else:
-            seq = sequence if sequence != "All" else None
-            sh = shot if shot != "All" else None
-            dept = department if department != "All" else None
-            print(f"🔍 Filter: ep={episode}, seq={seq}, shot={sh}, dept={dept}, latest={latest_only}")
-            media_items = horus_fs.list_media_files(
-                episode, seq, sh, dept, latest_only=latest_only
-            )
-            print(f"📋 Found {len(media_items)} media files")
-
-        # Apply status filter
-        if status != "All":
-            media_items = [m for m in media_items if m.get('status', 'submit') == status]
+            # No episode selected, show nothing
+            update_media_table_fs([])
+            return
 
-        # Apply search text filter
-        if search_text:
-            media_items = [m for m in media_items
-                          if search_text in m.get('name', '').lower()
-                          or search_text in m.get('file_name', '').lower()]
+        seq = sequence if sequence != "All" else None
+        sh = shot if shot != "All" else None
+        dept = department if department != "All" else None
+        media_logger.debug("Filter: ep=%s, seq=%s, shot=%s, dept=%s, latest=%s",
+                           episode, seq, sh, dept, latest_only)
+        list_args = (episode, seq, sh, dept, latest_only)
+
+        # Only status/search text changed: filter the listing we already have
+        if list_args == _last_media_listing["args"]:
+            update_media_table_fs(_filter_media_items_fs(
+                _reuse_media_listing(), _last_media_listing["search_keys"],
+                status, search_text))
+            return
 
-        # Update table
-        update_media_table_fs(media_items)
+        loader = MediaListLoader(_media_list_generation, horus_fs, list_args, status, search_text)
+        loader.signals.finished.connect(on_media_list_loaded)
+        _media_list_loaders[_media_list_generation] = loader
+        QThreadPool.globalInstance().start(loader)
 
     except Exception as e:
         print(f"Error applying filters (fs): {e}")
 
 
+_last_table_fingerprint = None  # rows last rendered by update_media_table_fs()
+# Items rendered by update_media_table_fs(); Name cells store an index into
+# this list as their UserRole instead of a dict each
+_current_media_rows = []
+
+
+def _navigator_media_item(row_ref):
+    """Resolve a Navigator Name cell's UserRole value to its media item (or None)."""
+    if isinstance(row_ref, int) and 0 <= row_ref < len(_current_media_rows):
+        return _current_media_rows[row_ref]
+    return None
+
+
+def _media_table_fingerprint(media_items):
+    """Identity of the rows update_media_table_fs() would render.
+
+    The name is only {ep}_{shot}, so the sequence and the media paths are
+    included to tell apart sequences with the same shot names.
+    """
+    return tuple(
+        (m.get('name'), m.get('sequence'), m.get('department'), m.get('version'),
+         m.get('status'), m.get('mov_path'), m.get('image_seq_path'))
+        for m in media_items
+    )
+
+
 def update_media_table_fs(media_items):
     """Update media table with file system data."""
-    global search_dock
+    global search_dock, _last_table_fingerprint, _current_media_rows
 
     try:
-        from PySide2.QtWidgets import QTableWidgetItem, QComboBox
-        from PySide2.QtCore import Qt
-
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
         media_table = search_widget.media_table
 
-        # Clear all cell widgets before clearing rows
-        for row in range(media_table.rowCount()):
-            for col in range(media_table.columnCount()):
-                widget = media_table.cellWidget(row, col)
-                if widget:
-                    media_table.removeCellWidget(row, col)
+        # Row indices in the Name cells always resolve against the newest list
+        _current_media_rows = media_items
 
-        # Clear all rows
-        media_table.clearContents()
-        media_table.setRowCount(0)
+        # Same rows as last time (e.g. a filter toggled back): keep the table,
+        # its selection and status dropdowns. The row count check catches
+        # tables cleared elsewhere (project change, Refresh).
+        fingerprint = _media_table_fingerprint(media_items)
+        if fingerprint == _last_table_fingerprint and media_table.rowCount() == len(media_items):
+            return
+        _last_table_fingerprint = fingerprint
 
-        for item in media_items:
-            row = media_table.rowCount()
-            media_table.insertRow(row)
+        # Size the table once and fill it with sorting and repaints suspended,
+        # instead of an insertRow() (and re-sort/relayout) per item
+        sorting = media_table.isSortingEnabled()
+        media_table.setSortingEnabled(False)
+        media_table.setUpdatesEnabled(False)
+        try:
+            media_table.clearContents()
+            media_table.setRowCount(0)
+            media_table.setRowCount(len(media_items))
 
-            # Name column: {ep}_{shot}
-            name = item.get('name', 'Unknown')
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, item)  # Store full item data
-            media_table.setItem(row, 0, name_item)
+            for row, item in enumerate(media_items):
+                # Name column: {ep}_{shot}
+                name = item.get('name', 'Unknown')
+                name_item = QTableWidgetItem(name)
+                name_item.setData(Qt.UserRole, row)  # Index into _current_media_rows
+                media_table.setItem(row, 0, name_item)
 
-            # Department column
-            dept = item.get('department', '')
-            dept_item = QTableWidgetItem(dept)
-            media_table.setItem(row, 1, dept_item)
+                # Department column
+                dept = item.get('department', '')
+                dept_item = QTableWidgetItem(dept)
+                media_table.setItem(row, 1, dept_item)
 
-            # Version column
-            version = item.get('version', 'v001')
-            version_item = QTableWidgetItem(version)
-            media_table.setItem(row, 2, version_item)
+                # Version column
+                version = item.get('version', 'v001')
+                version_item = QTableWidgetItem(version)
+                media_table.setItem(row, 2, version_item)
 
-            # Status column - DROPDOWN (using shared function)
-            status = item.get('status', 'submit')
+                # Status column - DROPDOWN (using shared function)
+                status = item.get('status', 'submit')
 
-            # DEBUG: Log status from item
-            print(f"   🔍 Navigator row {row}: item status={status}, name={name}, dept={dept}, version={version}")
+                media_logger.debug("Navigator row %d: item status=%s, name=%s, dept=%s, version=%s",
+                                   row, status, name, dept, version)
 
-            status_combo = create_status_dropdown(status, item, on_navigator_status_changed)
-            media_table.setCellWidget(row, 3, status_combo)
+                status_combo = create_status_dropdown(status, item, on_navigator_status_changed)
+                media_table.setCellWidget(row, 3, status_combo)
+        finally:
+            media_table.setSortingEnabled(sorting)
+            media_table.setUpdatesEnabled(True)
 
-        print(f"📊 Updated table with {len(media_items)} items")
+        media_logger.debug("Updated table with %d items", len(media_items))
 
     except Exception as e:
         print(f"Error updating media table (fs): {e}")
 
 
+# Set on the Navigator and Playlist tables; cascades to their status dropdowns.
+# A stylesheet per combo made Qt parse and polish it again for every row.
+STATUS_COMBO_STYLE = """
+    QComboBox {
+        background-color: #3a3a3a;
+        color: #e0e0e0;
+        border: 1px solid #555555;
+        padding: 2px 5px;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3a3a3a;
+        color: #e0e0e0;
+        selection-background-color: #0078d4;
+    }
+"""
+
+
 def create_status_dropdown(status, item_data, on_change_callback):
     """Create a status dropdown widget - SHARED by Navigator and Playlist tables.
 
     Status values: "wip", "approved", "submit", "need fix", "on hold"
+    Styling comes from STATUS_COMBO_STYLE on the owning table.
     """
     from PySide2.QtWidgets import QComboBox
 
@@ -4009,24 +5180,9 @@ def create_status_dropdown(status, item_data, on_change_callback):
     status_combo.addItems(["wip", "approved", "submit", "need fix", "on hold"])
     status_combo.setCurrentText(status)
 
-    # DEBUG: Log status being set
-    print(f"   🎨 create_status_dropdown: status='{status}', current_text='{status_combo.currentText()}'")
-    status_combo.setStyleSheet("""
-        QComboBox {
-            background-color: #3a3a3a;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 2px 5px;
-        }
-        QComboBox::drop-down {
-            border: none;
-        }
-        QComboBox QAbstractItemView {
-            background-color: #3a3a3a;
-            color: #e0e0e0;
-            selection-background-color: #0078d4;
-        }
-    """)
+    if media_logger.isEnabledFor(logging.DEBUG):
+        media_logger.debug("create_status_dropdown: status=%r, current_text=%r",
+                           status, status_combo.currentText())
     # Store item data on combo box
     status_combo.setProperty("item_data", item_data)
 
@@ -4096,7 +5252,7 @@ def get_preferred_media_source():
     """Get the preferred media source from UI toggle (Image Seq or MOV)."""
     global search_dock
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if search_widget and hasattr(search_widget, 'img_seq_radio'):
             return "image_seq" if search_widget.img_seq_radio.isChecked() else "mov"
     except:
@@ -4116,6 +5272,38 @@ def get_media_playback_path(media_item):
     global horus_fs
 
     prefer_image_seq = get_preferred_media_source() == "image_seq"
+    path = _media_source_path(media_item, prefer_image_seq)
+    if not path:
+        return ''
+
+    # Convert path for RV
+    if horus_fs and horus_fs.access_mode != "none":
+        path = horus_fs.convert_path_for_rv(path)
+
+    return path
+
+
+def get_media_playback_paths(media_items):
+    """Batch version of get_media_playback_path() for a multi-selection.
+
+    Reads the source preference once and converts all paths in one call.
+    Items without a playable path are skipped.
+    """
+    global horus_fs
+
+    prefer_image_seq = get_preferred_media_source() == "image_seq"
+    paths = [_media_source_path(item, prefer_image_seq) for item in media_items]
+    paths = [path for path in paths if path]
+
+    if paths and horus_fs and horus_fs.access_mode != "none":
+        paths = horus_fs.convert_paths_for_rv(paths)
+
+    return paths
+
+
+def _media_source_path(media_item, prefer_image_seq):
+    """Pick the image sequence or MOV path of media_item (unconverted)."""
+    global horus_fs
 
     if prefer_image_seq:
         # Prefer image sequence, fallback to MOV
@@ -4135,10 +5323,6 @@ def get_media_playback_path(media_item):
     if '*' in path and horus_fs:
         path = horus_fs.resolve_image_sequence_pattern(path)
 
-    # Convert path for RV
-    if horus_fs and horus_fs.access_mode != "none":
-        path = horus_fs.convert_path_for_rv(path)
-
     return path
 
 
@@ -4147,14 +5331,12 @@ def on_media_table_double_click(item):
     global horus_fs, horus_comments, current_media_context
 
     try:
-        from PySide2.QtCore import Qt
-
         if not item:
             return
 
         # Get the media item data from the Name column (column 0)
         row = item.row()
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -4162,7 +5344,7 @@ def on_media_table_double_click(item):
         name_item = media_table.item(row, 0)  # Name column stores UserRole data
 
         if name_item:
-            media_item = name_item.data(Qt.UserRole)
+            media_item = _navigator_media_item(name_item.data(Qt.UserRole))
             if media_item:
                 # Get playback path based on media source preference (Image Seq / MOV)
                 file_path = get_media_playback_path(media_item)
@@ -4208,10 +5390,7 @@ def on_navigator_table_context_menu(position):
     global search_dock, timeline_playlist_data, current_playlist_id, horus_playlists, horus_fs
 
     try:
-        from PySide2.QtWidgets import QMenu, QMessageBox
-        from PySide2.QtCore import Qt
-
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -4253,20 +5432,17 @@ def on_navigator_table_context_menu(position):
             create_new_playlist_with_items(selected_rows, media_table)
         elif action == load_action:
             # Load ALL selected items in RV using preferred media source
-            file_paths = []
             source_pref = get_preferred_media_source()
             print(f"🎬 Loading with source preference: {source_pref}")
 
+            media_items = []
             for index in selected_rows:
-                row = index.row()
-                name_item = media_table.item(row, 0)
+                name_item = media_table.item(index.row(), 0)
                 if name_item:
-                    media_item = name_item.data(Qt.UserRole)
+                    media_item = _navigator_media_item(name_item.data(Qt.UserRole))
                     if media_item:
-                        # Use the preference-aware path getter
-                        file_path = get_media_playback_path(media_item)
-                        if file_path:
-                            file_paths.append(file_path)
+                        media_items.append(media_item)
+            file_paths = get_media_playback_paths(media_items)
 
             # Load all files in RV
             if file_paths:
@@ -4296,55 +5472,40 @@ def add_selected_media_to_playlist(playlist_id, selected_rows, media_table):
             print("❌ Playlist manager not available")
             return
 
-        added_count = 0
+        # Create clip data for every selected media item
+        clip_datas = []
         for index in selected_rows:
             row = index.row()
             name_item = media_table.item(row, 0)
             if not name_item:
                 continue
 
-            media_item = name_item.data(Qt.UserRole)
+            media_item = _navigator_media_item(name_item.data(Qt.UserRole))
             if not media_item:
                 continue
 
-            # Create clip data from media item
-            clip_data = {
-                "name": media_item.get('name', 'Unknown'),
-                "shot": media_item.get('shot', ''),
-                "episode": media_item.get('episode', ''),
-                "sequence": media_item.get('sequence', ''),
-                "department": media_item.get('department', ''),
-                "version": media_item.get('version', 'v001'),
-                "status": media_item.get('status', 'submit'),
-                "file_path": media_item.get('file_path', ''),
-            }
+            clip_datas.append(_clip_data_from_media(media_item))
 
-            # Add clip to playlist
-            clip_id = pm.add_clip(playlist_id, clip_data)
-            if clip_id:
-                added_count += 1
+        # Add all clips to the playlist with a single save
+        added_count = len(pm.add_clips(playlist_id, clip_datas))
 
         if added_count > 0:
-            # Reload data
-            timeline_playlist_data = pm.load_playlists()
+            # Shared with the manager cache; only the index needs updating
+            _index_playlist(pm.get_playlist(playlist_id))
             update_playlist_autocomplete()
 
             # Get playlist name for message
             playlist_name = "Unknown"
-            for p in timeline_playlist_data or []:
-                if p.get("_id") == playlist_id:
-                    playlist_name = p.get("name", "Unknown")
-                    # If this is the current playlist, refresh the table
-                    if playlist_id == current_playlist_id:
-                        load_playlist_items_to_table(p)
-                        # Update label
-                        if timeline_playlist_dock and timeline_playlist_dock.widget():
-                            widget = timeline_playlist_dock.widget()
-                            current_label = getattr(widget, 'current_label', None)
-                            if current_label:
-                                clip_count = len(p.get("clips", []))
-                                current_label.setText(f"📋 Current: {playlist_name} ({clip_count} clips)")
-                    break
+            p = _playlist_by_id.get(playlist_id)
+            if p:
+                playlist_name = p.get("name", "Unknown")
+                # If this is the current playlist, refresh the table
+                if playlist_id == current_playlist_id:
+                    load_playlist_items_to_table(p)
+                    # Update label
+                    if _current_label is not None:
+                        clip_count = _playlist_clip_count(p)
+                        _current_label.setText(f"📋 Current: {playlist_name} ({clip_count} clips)")
 
             print(f"✅ Added {added_count} items to playlist: {playlist_name}")
             QMessageBox.information(
@@ -4360,45 +5521,37 @@ def add_selected_media_to_playlist(playlist_id, selected_rows, media_table):
         traceback.print_exc()
 
 
+# scale -> (widths for Thumbnail, Task Entity, Name, Version, Status, Created; row height)
+_TABLE_SCALES = {
+    "Small": ((40, 60, 100, 40, 60, 80), 30),
+    "Medium": ((60, 90, 150, 60, 90, 120), 45),
+    "Large": ((80, 120, 200, 80, 120, 160), 60),
+}
+
+
 def on_scale_changed():
     """Handle scale change for table size."""
     global search_dock
 
     try:
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
         scale = search_widget.scale_combo.currentText()
         media_table = search_widget.media_table
 
-        if scale == "Small":
-            # Small scale
-            media_table.setColumnWidth(0, 40)   # Thumbnail
-            media_table.setColumnWidth(1, 60)   # Task Entity
-            media_table.setColumnWidth(2, 100)  # Name
-            media_table.setColumnWidth(3, 40)   # Version
-            media_table.setColumnWidth(4, 60)   # Status
-            media_table.setColumnWidth(5, 80)   # Created
-            media_table.verticalHeader().setDefaultSectionSize(30)
-        elif scale == "Medium":
-            # Medium scale
-            media_table.setColumnWidth(0, 60)   # Thumbnail
-            media_table.setColumnWidth(1, 90)   # Task Entity
-            media_table.setColumnWidth(2, 150)  # Name
-            media_table.setColumnWidth(3, 60)   # Version
-            media_table.setColumnWidth(4, 90)   # Status
-            media_table.setColumnWidth(5, 120)  # Created
-            media_table.verticalHeader().setDefaultSectionSize(45)
-        elif scale == "Large":
-            # Large scale
-            media_table.setColumnWidth(0, 80)   # Thumbnail
-            media_table.setColumnWidth(1, 120)  # Task Entity
-            media_table.setColumnWidth(2, 200)  # Name
-            media_table.setColumnWidth(3, 80)   # Version
-            media_table.setColumnWidth(4, 120)  # Status
-            media_table.setColumnWidth(5, 160)  # Created
-            media_table.verticalHeader().setDefaultSectionSize(60)
+        sizes = _TABLE_SCALES.get(scale)
+        if sizes:
+            widths, row_height = sizes
+            # One repaint for all columns instead of one per setColumnWidth
+            media_table.setUpdatesEnabled(False)
+            try:
+                for column, width in enumerate(widths):
+                    media_table.setColumnWidth(column, width)
+                media_table.verticalHeader().setDefaultSectionSize(row_height)
+            finally:
+                media_table.setUpdatesEnabled(True)
 
         print(f"Table scale changed to: {scale}")
 
@@ -4407,13 +5560,16 @@ def on_scale_changed():
 
 # Comments and Annotations Functions
 
+COMMENT_WIDGET_BATCH = 20  # comment widgets built per event-loop turn
+_comments_load_generation = 0  # bumped per reload; stale insert batches stop
+
+
 def load_comments_for_current_media():
     """Load comments for the currently selected media."""
     global horus_comments, current_media_context, comments_dock, horus_fs
+    global _comments_load_generation
 
     try:
-        from PySide2.QtWidgets import QWidget
-
         # Initialize comment manager if needed
         if horus_comments is None:
             from horus_comments import get_comment_manager
@@ -4443,7 +5599,6 @@ def load_comments_for_current_media():
         print(f"📝 Loaded {len(comments_list)} comments for {ep}/{seq}/{shot}")
 
         # Update header to show shot name
-        from PySide2.QtWidgets import QLabel
         comments_title = comments_widget.findChild(QLabel, "comments_title")
         if comments_title:
             comments_title.setText(f"Comments: {shot} ({len(comments_list)})")
@@ -4451,55 +5606,78 @@ def load_comments_for_current_media():
         # Clear existing comments in UI
         container = comments_widget.comments_container
         layout = container.layout()
+        no_comments_label = comments_widget.no_comments_label
 
-        # Remove all widgets except the stretch at the end
-        while layout.count() > 1:
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Remove all widgets except the stretch at the end and the reusable
+        # "no comments" placeholder
+        for i in reversed(range(layout.count() - 1)):
+            child = layout.itemAt(i).widget()
+            if child is not no_comments_label:
+                layout.takeAt(i)
+                if child:
+                    child.deleteLater()
 
         # Show "no comments" placeholder if empty, otherwise show comments
-        if len(comments_list) == 0:
-            from PySide2.QtWidgets import QLabel
-            from PySide2.QtCore import Qt
-            no_comments_label = QLabel("No comments yet. Be the first to comment!")
-            no_comments_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-style: italic;
-                    padding: 20px;
-                }
-            """)
-            no_comments_label.setAlignment(Qt.AlignCenter)
-            layout.insertWidget(layout.count() - 1, no_comments_label)
-        else:
-            # Add loaded comments to UI
-            for comment in comments_list:
-                # Convert backend format to UI format
-                ui_comment = {
-                    "id": comment.get("id"),
-                    "user": comment.get("user_display", comment.get("user", "Unknown")),
-                    "avatar": comment.get("avatar", "??"),
-                    "time": _format_timestamp(comment.get("timestamp")),
-                    "frame": comment.get("frame"),
-                    "text": comment.get("text", ""),
-                    "likes": comment.get("likes", 0),
-                    "status": comment.get("status", "open"),
-                    "priority": comment.get("priority", "medium"),
-                    "replies": _convert_replies_for_ui(comment.get("replies", []))
-                }
-                comment_widget = create_comment_widget(ui_comment)
-                layout.insertWidget(layout.count() - 1, comment_widget)
+        no_comments_label.setVisible(not comments_list)
+
+        # Any batches still queued from a previous load are now stale
+        _comments_load_generation += 1
+        if comments_list:
+            _insert_comment_batch(layout, comments_list, 0, _comments_load_generation)
 
     except Exception as e:
         print(f"Error loading comments: {e}")
         import traceback
         traceback.print_exc()
 
+
+def _insert_comment_batch(layout, comments_list, start, generation):
+    """Add comments_list[start:start + COMMENT_WIDGET_BATCH] to layout.
+
+    The rest is queued with a zero-delay timer so the UI keeps handling
+    events between batches on long threads.
+    """
+    if generation != _comments_load_generation:
+        return  # Another load replaced these comments
+
+    try:
+        for comment in comments_list[start:start + COMMENT_WIDGET_BATCH]:
+            # Convert backend format to UI format
+            ui_comment = {
+                "id": comment.get("id"),
+                "user": comment.get("user_display", comment.get("user", "Unknown")),
+                "avatar": comment.get("avatar", "??"),
+                "time": _format_timestamp(comment.get("timestamp")),
+                "frame": comment.get("frame"),
+                "text": comment.get("text", ""),
+                "likes": comment.get("likes", 0),
+                "status": comment.get("status", "open"),
+                "priority": comment.get("priority", "medium"),
+                "replies": _convert_replies_for_ui(comment.get("replies", []))
+            }
+            comment_widget = create_comment_widget(ui_comment)
+            layout.insertWidget(layout.count() - 1, comment_widget)
+    except Exception as e:
+        print(f"Error loading comments: {e}")
+        return
+
+    next_start = start + COMMENT_WIDGET_BATCH
+    if next_start < len(comments_list):
+        QTimer.singleShot(0, lambda: _insert_comment_batch(
+            layout, comments_list, next_start, generation))
+
 def _format_timestamp(timestamp_str):
     """Format ISO timestamp to human-readable format."""
     if not timestamp_str:
         return "Unknown"
+    # Relative times ("5 mins ago") only change once a minute, so reloads
+    # within the same minute reuse the formatted string
+    return _format_timestamp_for_minute(timestamp_str, int(time.time()) // 60)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_for_minute(timestamp_str, minute):
+    """_format_timestamp() body; minute only keys the cache."""
     try:
         from datetime import datetime
         # Parse ISO format
@@ -4523,25 +5701,33 @@ def _format_timestamp(timestamp_str):
         return timestamp_str[:10] if len(timestamp_str) > 10 else timestamp_str
 
 def _convert_replies_for_ui(replies):
-    """Convert backend reply format to UI format."""
+    """Convert backend reply format to UI format.
+
+    Walks the reply tree with an explicit stack, so deep threads don't recurse.
+    """
     ui_replies = []
-    for reply in replies:
-        ui_reply = {
-            "id": reply.get("id"),
-            "user": reply.get("user_display", reply.get("user", "Unknown")),
-            "avatar": reply.get("avatar", "??"),
-            "time": _format_timestamp(reply.get("timestamp")),
-            "text": reply.get("text", ""),
-            "likes": reply.get("likes", 0),
-            "replies": _convert_replies_for_ui(reply.get("replies", []))
-        }
-        ui_replies.append(ui_reply)
+    stack = [(replies, ui_replies)]
+    while stack:
+        source, target = stack.pop()
+        for reply in source:
+            nested = []
+            target.append({
+                "id": reply.get("id"),
+                "user": reply.get("user_display", reply.get("user", "Unknown")),
+                "avatar": reply.get("avatar", "??"),
+                "time": _format_timestamp(reply.get("timestamp")),
+                "text": reply.get("text", ""),
+                "likes": reply.get("likes", 0),
+                "replies": nested
+            })
+            child_replies = reply.get("replies")
+            if child_replies:
+                stack.append((child_replies, nested))
     return ui_replies
 
 def _get_current_user():
-    """Get current user name."""
-    import os
-    return os.environ.get("USER", os.environ.get("USERNAME", "unknown.user"))
+    """Get current user name (the same _CURRENT_USER playlists record)."""
+    return _CURRENT_USER
 
 def on_add_comment():
     """Handle adding a general comment."""
@@ -4668,10 +5854,6 @@ def on_add_frame_comment():
 def create_annotations_popup():
     """Create the annotations popup window."""
     try:
-        from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget,
-                                       QPushButton, QLabel, QFrame)
-        from PySide2.QtCore import Qt
-
         popup = QDialog()
         popup.setWindowTitle("Annotations")
         popup.setModal(False)  # Non-modal so it can float
@@ -4735,22 +5917,13 @@ def create_annotations_popup():
 
 def show_reply_input(comment_id):
     """Show the reply input for a specific comment."""
-    global comments_dock
-
     try:
-        from PySide2.QtWidgets import QFrame, QTextEdit
-
-        comments_widget = comments_dock.widget() if comments_dock else None
-        if not comments_widget:
-            return
-
         # Find and show the reply input frame for this comment
-        reply_input_frame = comments_widget.findChild(QFrame, f"reply_input_{comment_id}")
+        reply_input_frame, reply_text = _reply_widgets.get(comment_id, (None, None))
         if reply_input_frame:
             reply_input_frame.setVisible(True)
 
             # Focus on the text input
-            reply_text = comments_widget.findChild(QTextEdit, f"reply_text_{comment_id}")
             if reply_text:
                 reply_text.setFocus()
 
@@ -4761,22 +5934,13 @@ def show_reply_input(comment_id):
 
 def hide_reply_input(comment_id):
     """Hide the reply input for a specific comment."""
-    global comments_dock
-
     try:
-        from PySide2.QtWidgets import QFrame, QTextEdit
-
-        comments_widget = comments_dock.widget() if comments_dock else None
-        if not comments_widget:
-            return
-
         # Find and hide the reply input frame for this comment
-        reply_input_frame = comments_widget.findChild(QFrame, f"reply_input_{comment_id}")
+        reply_input_frame, reply_text = _reply_widgets.get(comment_id, (None, None))
         if reply_input_frame:
             reply_input_frame.setVisible(False)
 
             # Clear the text input
-            reply_text = comments_widget.findChild(QTextEdit, f"reply_text_{comment_id}")
             if reply_text:
                 reply_text.clear()
 
@@ -4790,14 +5954,8 @@ def post_reply(comment_id):
     global comments_dock, horus_comments, current_media_context, horus_fs
 
     try:
-        from PySide2.QtWidgets import QTextEdit
-
-        comments_widget = comments_dock.widget() if comments_dock else None
-        if not comments_widget:
-            return
-
         # Get the reply text
-        reply_text_widget = comments_widget.findChild(QTextEdit, f"reply_text_{comment_id}")
+        _, reply_text_widget = _reply_widgets.get(comment_id, (None, None))
         if not reply_text_widget:
             return
 
@@ -4870,12 +6028,30 @@ def on_open_annotations_popup():
     except Exception as e:
         print(f"Error opening annotations popup: {e}")
 
+_mockup_data_cache = None  # generate_comprehensive_mockup_data() result, built once
+_mockup_shot_index = {}  # episode -> sequence -> shot keys of _mockup_data_cache
+
+
 def generate_comprehensive_mockup_data():
-    """Generate comprehensive mockup shot data for timeline demonstration."""
+    """Generate comprehensive mockup shot data for timeline demonstration.
+
+    Keys are (episode, sequence, shot) tuples (all lowercase), so consumers
+    never have to split a "ep_seq_shot" string. The data is built once and
+    the same dict is returned on later calls; callers must not mutate it.
+    """
+    global _mockup_data_cache, _mockup_shot_index
+
+    if _mockup_data_cache is not None:
+        return _mockup_data_cache
+
     try:
         import random
 
+        # Fixed seed: the same mock timeline every session, without
+        # touching the global random state
+        rng = random.Random(0)
         mockup_data = {}
+        shot_index = {}
 
         # Define episodes, sequences, and shots
         episodes = ["ep01", "ep02"]
@@ -4896,20 +6072,22 @@ def generate_comprehensive_mockup_data():
         for episode in episodes:
             for sequence in sequences[episode]:
                 for shot in shots_per_sequence[sequence]:
-                    shot_key = f"{episode}_{sequence}_{shot}"
+                    shot_key = (episode, sequence, shot)
+                    shot_id = f"{episode}_{sequence}_{shot}"
                     mockup_data[shot_key] = {}
+                    shot_index.setdefault(episode, {}).setdefault(sequence, []).append(shot_key)
 
                     for dept in departments:
                         # Randomly decide if this department has data for this shot
                         # 80% chance of having data, 20% chance of being empty
-                        if random.random() < 0.8:
+                        if rng.random() < 0.8:
                             # Generate 1-4 versions for this department/shot
-                            num_versions = random.randint(1, 4)
+                            num_versions = rng.randint(1, 4)
                             versions = []
 
                             for v in range(1, num_versions + 1):
                                 version_data = {
-                                    "id": f"{shot_key}_{dept}_v{v:03d}",
+                                    "id": f"{shot_id}_{dept}_v{v:03d}",
                                     "task_id": f"{episode}_{sequence}_{shot}_{dept}",
                                     "version": f"v{v:03d}",
                                     "linked_version": f"v{v:03d}",
@@ -4918,7 +6096,7 @@ def generate_comprehensive_mockup_data():
                                     "episode": episode,
                                     "sequence": sequence,
                                     "shot": shot,
-                                    "status": random.choice(["approved", "pending", "in_progress", "rejected"]),
+                                    "status": rng.choice(["approved", "pending", "in_progress", "rejected"]),
                                     "file_path": f"/projects/{episode}/{sequence}/{shot}/{dept}/{shot}_{dept}_v{v:03d}.mov"
                                 }
                                 versions.append(version_data)
@@ -4926,12 +6104,37 @@ def generate_comprehensive_mockup_data():
                             mockup_data[shot_key][dept] = versions
 
         print(f"Generated mockup data for {len(mockup_data)} shots across {len(departments)} departments")
+        _mockup_data_cache = mockup_data
+        _mockup_shot_index = shot_index
         return mockup_data
 
     except Exception as e:
         print(f"Error generating mockup data: {e}")
         return {}
 
+def _mockup_shot_keys(all_shots_data, ep_filter, seq_filter):
+    """Mockup shot keys matching the episode/sequence filters (None means "All").
+
+    Resolved through _mockup_shot_index instead of testing every shot.
+    """
+    if ep_filter is None and seq_filter is None:
+        return list(all_shots_data)
+
+    if ep_filter is not None:
+        episode_index = [_mockup_shot_index.get(ep_filter, {})]
+    else:
+        episode_index = list(_mockup_shot_index.values())
+
+    shot_keys = []
+    for sequences in episode_index:
+        if seq_filter is not None:
+            shot_keys.extend(sequences.get(seq_filter, ()))
+        else:
+            for keys in sequences.values():
+                shot_keys.extend(keys)
+    return shot_keys
+
+
 def populate_timeline_shots(timeline_widget):
     """Populate timeline with shots based on current filters."""
     try:
@@ -4947,34 +6150,27 @@ def populate_timeline_shots(timeline_widget):
         # Use comprehensive mockup data for demonstration
         all_shots_data = generate_comprehensive_mockup_data()
 
+        # Filter values lowercased once; the mockup keys are already lowercase
+        ep_filter = episode.lower() if episode != "All" else None
+        seq_filter = sequence.lower() if sequence != "All" else None
+        dept_filter = department.lower() if department != "All" else None
+
         # Filter shots based on episode and sequence
         filtered_shots = {}
 
-        for shot_key, shot_data in all_shots_data.items():
-            parts = shot_key.split('_')
-            if len(parts) >= 3:
-                item_episode = parts[0]
-                item_sequence = parts[1]
-                item_shot = parts[2]
-
-                # Apply episode filter
-                if episode != "All" and item_episode.lower() != episode.lower():
-                    continue
-
-                # Apply sequence filter
-                if sequence != "All" and item_sequence.lower() != sequence.lower():
-                    continue
-
-                # Apply department filter
-                if department != "All":
-                    # Filter to only show selected department
-                    filtered_shot_data = {}
-                    if department.lower() in shot_data:
-                        filtered_shot_data[department.lower()] = shot_data[department.lower()]
-                    filtered_shots[shot_key] = filtered_shot_data
-                else:
-                    # Show all departments
-                    filtered_shots[shot_key] = shot_data
+        for shot_key in _mockup_shot_keys(all_shots_data, ep_filter, seq_filter):
+            shot_data = all_shots_data[shot_key]
+
+            # Apply department filter
+            if dept_filter:
+                # Filter to only show selected department
+                filtered_shot_data = {}
+                if dept_filter in shot_data:
+                    filtered_shot_data[dept_filter] = shot_data[dept_filter]
+                filtered_shots[shot_key] = filtered_shot_data
+            else:
+                # Show all departments
+                filtered_shots[shot_key] = shot_data
 
         # Update timeline display
         update_timeline_display(timeline_widget, filtered_shots)
@@ -4990,104 +6186,191 @@ def update_timeline_display(timeline_widget, shots_data):
         from PySide2.QtWidgets import QLabel, QPushButton, QFrame, QHBoxLayout, QVBoxLayout
         from PySide2.QtCore import Qt
 
-        # Clear existing timeline
-        clear_timeline_display(timeline_widget)
+        # Hold repaints until every row is in the grid, then paint once
+        timeline_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing timeline
+            clear_timeline_display(timeline_widget)
 
-        # Get sorted shot list
-        shot_keys = sorted(shots_data.keys())
-        if not shot_keys:
-            print("No shots to display")
-            return
+            # Get sorted shot list
+            shot_keys = sorted(shots_data.keys())
+            if not shot_keys:
+                print("No shots to display")
+                return
 
-        # Professional NLE dimensions - uniform track height
-        TRACK_HEIGHT = 45  # Uniform height for all tracks
-        TRACK_LABEL_WIDTH = 80  # Width for track labels (V1, V2, etc.)
+            # Professional NLE dimensions - uniform track height
+            TRACK_HEIGHT = 45  # Uniform height for all tracks
+            TRACK_LABEL_WIDTH = 80  # Width for track labels (V1, V2, etc.)
 
-        # Fixed department order
-        departments = ["animation", "lighting", "compositing", "fx", "modeling"]
+            # Fixed department order
+            departments = ["animation", "lighting", "compositing", "fx", "modeling"]
 
-        grid_layout = timeline_widget.timeline_grid_layout
-        grid_layout.setSpacing(0)  # No spacing
-        grid_layout.setContentsMargins(0, 0, 0, 0)
+            grid_layout = timeline_widget.timeline_grid_layout
+            grid_layout.setSpacing(0)  # No spacing
+            grid_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Add timeline ruler at top (like NLE)
-        ruler_frame = create_legacy_timeline_ruler(shot_keys, TRACK_LABEL_WIDTH)
-        grid_layout.addWidget(ruler_frame, 0, 0)
+            # Add timeline ruler at top (like NLE)
+            ruler_frame = create_legacy_timeline_ruler(shot_keys, TRACK_LABEL_WIDTH)
+            grid_layout.addWidget(ruler_frame, 0, 0)
 
-        # Create timeline tracks like NLE
-        for row, dept in enumerate(departments):
-            # Get department data for all shots
-            dept_data = {}
-            for shot_key in shot_keys:
-                shot_data = shots_data.get(shot_key, {})
-                if dept in shot_data:
-                    dept_data[shot_key] = shot_data[dept][0] if shot_data[dept] else {}
+            # Create timeline tracks like NLE
+            for row, dept in enumerate(departments):
+                # Get department data for all shots
+                dept_data = {}
+                for shot_key in shot_keys:
+                    shot_data = shots_data.get(shot_key, {})
+                    if dept in shot_data:
+                        dept_data[shot_key] = shot_data[dept][0] if shot_data[dept] else {}
 
-            # Create track row
-            track_frame = create_nle_track_row(dept, shot_keys, dept_data, TRACK_HEIGHT, TRACK_LABEL_WIDTH)
-            grid_layout.addWidget(track_frame, row + 1, 0)  # +1 to account for ruler
+                # Create track row
+                track_frame = create_nle_track_row(dept, shot_keys, dept_data, TRACK_HEIGHT, TRACK_LABEL_WIDTH)
+                grid_layout.addWidget(track_frame, row + 1, 0)  # +1 to account for ruler
 
-        print(f"Updated NLE-style timeline with {len(shot_keys)} shots and {len(departments)} departments")
+            print(f"Updated NLE-style timeline with {len(shot_keys)} shots and {len(departments)} departments")
+        finally:
+            timeline_widget.setUpdatesEnabled(True)
+            timeline_widget.update()
 
     except Exception as e:
         print(f"Error updating timeline display: {e}")
 
+# NLE timeline department colors
+NLE_DEPT_COLORS = {
+    "animation": "#4472C4",    # Blue like V1
+    "lighting": "#70AD47",     # Green like V2
+    "compositing": "#FFC000",  # Yellow like A1
+    "fx": "#C55A5A",          # Red like A2
+    "modeling": "#7030A0"      # Purple
+}
+
+# Track label (like V1, V2, A1, A2)
+NLE_TRACK_NAMES = {
+    "animation": "V1",
+    "lighting": "V2",
+    "compositing": "A1",
+    "fx": "A2",
+    "modeling": "V3"
+}
+
+# Timeline stylesheets, built once at import and shared by every track/clip
+NLE_TRACK_FRAME_QSS = "QFrame { background-color: #2d2d2d; border: none; }"
+NLE_TRACK_LABEL_QSS = """
+    QLabel {
+        background-color: #404040;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 11px;
+        border: 1px solid #555555;
+        padding: 0px;
+        margin: 0px;
+    }
+"""
+NLE_CLIPS_CONTAINER_QSS_TEMPLATE = """
+    QFrame {{
+        background-color: {color};
+        border: 1px solid #333333;
+        margin: 0px;
+    }}
+"""
+NLE_CLIPS_CONTAINER_QSS = {
+    dept: NLE_CLIPS_CONTAINER_QSS_TEMPLATE.format(color=color)
+    for dept, color in NLE_DEPT_COLORS.items()
+}
+NLE_CLIP_QSS = """
+    QLabel {
+        background-color: rgba(255, 255, 255, 0.1);
+        color: #ffffff;
+        font-size: 9px;
+        font-weight: bold;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        padding: 2px;
+        margin: 0px;
+    }
+"""
+RULER_FRAME_QSS = "QFrame { background-color: #1e1e1e; border-bottom: 1px solid #555555; }"
+RULER_SPACER_QSS = "QLabel { background-color: #1e1e1e; border-right: 1px solid #555555; }"
+RULER_MARKER_QSS = """
+    QLabel {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        font-size: 9px;
+        border-right: 1px solid #555555;
+        padding: 2px;
+    }
+"""
+
+
+class ShotClipLabel(QLabel):
+    """Flat, clickable timeline clip.
+
+    A QLabel with a clicked signal, which is all the clips need from a
+    QPushButton, without the button's focus and style machinery.
+    """
+
+    clicked = Signal()
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.setAttribute(Qt.WA_Hover)  # for the :hover rules in SHOT_CLIP_QSS
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
+# Timeline stylesheets, built once at import and shared by every clip
+SHOT_CLIP_QSS = """
+    QLabel {
+        background-color: rgba(255, 255, 255, 0.9);
+        color: #000000;
+        border: 2px solid #ffffff;
+        font-size: 11px;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QLabel:hover {
+        background-color: #ffffff;
+        border: 2px solid #ffff00;
+    }
+"""
+EMPTY_SHOT_CLIP_QSS = """
+    QLabel {
+        background-color: rgba(0, 0, 0, 0.3);
+        color: #666666;
+        border: 1px dashed #444444;
+        font-size: 10px;
+        border-radius: 3px;
+    }
+"""
+
+
 def create_nle_track_row(department, shot_keys, dept_shots_data, track_height, label_width):
     """Create a single track row like Adobe Premiere Pro."""
     try:
         from PySide2.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
         from PySide2.QtCore import Qt
 
-        # Department colors
-        dept_colors = {
-            "animation": "#4472C4",    # Blue like V1
-            "lighting": "#70AD47",     # Green like V2
-            "compositing": "#FFC000",  # Yellow like A1
-            "fx": "#C55A5A",          # Red like A2
-            "modeling": "#7030A0"      # Purple
-        }
-
         track_frame = QFrame()
         track_frame.setFixedHeight(track_height)
-        track_frame.setStyleSheet("QFrame { background-color: #2d2d2d; border: none; }")
+        track_frame.setStyleSheet(NLE_TRACK_FRAME_QSS)
 
         track_layout = QHBoxLayout(track_frame)
         track_layout.setContentsMargins(0, 0, 0, 0)
         track_layout.setSpacing(0)
 
-        # Track label (like V1, V2, A1, A2)
-        track_names = {
-            "animation": "V1",
-            "lighting": "V2",
-            "compositing": "A1",
-            "fx": "A2",
-            "modeling": "V3"
-        }
-        track_label = QLabel(track_names.get(department, "V1"))
+        track_label = QLabel(NLE_TRACK_NAMES.get(department, "V1"))
         track_label.setFixedSize(label_width, track_height)
-        track_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: #404040;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 11px;
-                border: 1px solid #555555;
-                padding: 0px;
-                margin: 0px;
-            }}
-        """)
+        track_label.setStyleSheet(NLE_TRACK_LABEL_QSS)
         track_label.setAlignment(Qt.AlignCenter)
         track_layout.addWidget(track_label)
 
         # Timeline clips area - continuous like NLE
         clips_container = QFrame()
-        clips_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {dept_colors.get(department, '#404040')};
-                border: 1px solid #333333;
-                margin: 0px;
-            }}
-        """)
+        clips_container.setStyleSheet(
+            NLE_CLIPS_CONTAINER_QSS.get(department)
+            or NLE_CLIPS_CONTAINER_QSS_TEMPLATE.format(color='#404040'))
         clips_container.setFixedHeight(track_height - 2)  # Account for border
 
         clips_layout = QHBoxLayout(clips_container)
@@ -5100,22 +6383,12 @@ def create_nle_track_row(department, shot_keys, dept_shots_data, track_height, l
             shot_data = dept_shots_data.get(shot_key, {})
             if shot_data:
                 # Shot has data - create clip
-                shot_name = shot_key.split('_')[-1]
+                shot_name = shot_key[-1]
                 version = shot_data.get('version', 'v001')
 
                 clip_label = QLabel(f"{shot_name}\n{version}")
                 clip_label.setFixedSize(120, track_height - 4)  # Fixed width for each shot
-                clip_label.setStyleSheet("""
-                    QLabel {
-                        background-color: rgba(255, 255, 255, 0.1);
-                        color: #ffffff;
-                        font-size: 9px;
-                        font-weight: bold;
-                        border: 1px solid rgba(255, 255, 255, 0.2);
-                        padding: 2px;
-                        margin: 0px;
-                    }
-                """)
+                clip_label.setStyleSheet(NLE_CLIP_QSS)
                 clip_label.setAlignment(Qt.AlignCenter)
                 clips_layout.addWidget(clip_label)
                 total_width += 120
@@ -5138,7 +6411,7 @@ def create_legacy_timeline_ruler(shot_keys, label_width):
 
         ruler_frame = QFrame()
         ruler_frame.setFixedHeight(25)
-        ruler_frame.setStyleSheet("QFrame { background-color: #1e1e1e; border-bottom: 1px solid #555555; }")
+        ruler_frame.setStyleSheet(RULER_FRAME_QSS)
 
         ruler_layout = QHBoxLayout(ruler_frame)
         ruler_layout.setContentsMargins(0, 0, 0, 0)
@@ -5147,23 +6420,15 @@ def create_legacy_timeline_ruler(shot_keys, label_width):
         # Empty space for track labels
         spacer_label = QLabel("")
         spacer_label.setFixedSize(label_width, 25)
-        spacer_label.setStyleSheet("QLabel { background-color: #1e1e1e; border-right: 1px solid #555555; }")
+        spacer_label.setStyleSheet(RULER_SPACER_QSS)
         ruler_layout.addWidget(spacer_label)
 
         # Timeline markers for each shot
         for i, shot_key in enumerate(shot_keys):
-            shot_name = shot_key.split('_')[-1]
+            shot_name = shot_key[-1]
             marker_label = QLabel(shot_name)
             marker_label.setFixedSize(120, 25)  # Match clip width
-            marker_label.setStyleSheet("""
-                QLabel {
-                    background-color: #1e1e1e;
-                    color: #cccccc;
-                    font-size: 9px;
-                    border-right: 1px solid #555555;
-                    padding: 2px;
-                }
-            """)
+            marker_label.setStyleSheet(RULER_MARKER_QSS)
             marker_label.setAlignment(Qt.AlignCenter)
             ruler_layout.addWidget(marker_label)
 
@@ -5336,25 +6601,14 @@ def create_grid_department_label(department, label_width, label_height):
 def create_shot_clip(shot_key, department, shot_data):
     """Create a shot clip widget for the timeline with enhanced styling."""
     try:
-        from PySide2.QtWidgets import QPushButton, QMenu
-        from PySide2.QtCore import Qt
-
         # Get versions for this department
         dept_items = shot_data.get(department, [])
 
         if not dept_items:
             # Empty clip with better styling
-            clip = QPushButton("---")
+            clip = ShotClipLabel("---")
             clip.setFixedSize(85, 50)  # Increased size to match track height
-            clip.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 0.3);
-                    color: #666666;
-                    border: 1px dashed #444444;
-                    font-size: 10px;
-                    border-radius: 3px;
-                }
-            """)
+            clip.setStyleSheet(EMPTY_SHOT_CLIP_QSS)
             clip.setEnabled(False)
             return clip
 
@@ -5363,28 +6617,12 @@ def create_shot_clip(shot_key, department, shot_data):
         version = latest_item.get('version', latest_item.get('linked_version', 'v001'))
 
         # Create clip button with enhanced styling
-        clip = QPushButton(version)
+        clip = ShotClipLabel(version)
         clip.setFixedSize(85, 50)  # Increased size for better visibility
-        clip.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.9);
-                color: #000000;
-                border: 2px solid #ffffff;
-                font-size: 11px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #ffffff;
-                border: 2px solid #ffff00;
-            }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-            }
-        """)
+        clip.setStyleSheet(SHOT_CLIP_QSS)
 
         # Store data for version switching
-        clip.setProperty("shot_key", shot_key)
+        clip.setProperty("shot_key", "_".join(shot_key))
         clip.setProperty("department", department)
         clip.setProperty("versions", [item.get('version', 'v001') for item in dept_items])
 
@@ -5395,30 +6633,19 @@ def create_shot_clip(shot_key, department, shot_data):
 
     except Exception as e:
         print(f"Error creating shot clip: {e}")
-        return QPushButton("Error")
+        return ShotClipLabel("Error")
 
 def create_aligned_shot_clip(shot_key, department, shot_data, clip_width, clip_height):
     """Create a shot clip widget with standardized sizing for perfect grid alignment."""
     try:
-        from PySide2.QtWidgets import QPushButton, QMenu
-        from PySide2.QtCore import Qt
-
         # Get versions for this department
         dept_items = shot_data.get(department, [])
 
         if not dept_items:
             # Empty clip with standardized sizing
-            clip = QPushButton("---")
+            clip = ShotClipLabel("---")
             clip.setFixedSize(clip_width, clip_height)
-            clip.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 0.3);
-                    color: #666666;
-                    border: 1px dashed #444444;
-                    font-size: 10px;
-                    border-radius: 3px;
-                }
-            """)
+            clip.setStyleSheet(EMPTY_SHOT_CLIP_QSS)
             clip.setEnabled(False)
             return clip
 
@@ -5427,28 +6654,12 @@ def create_aligned_shot_clip(shot_key, department, shot_data, clip_width, clip_h
         version = latest_item.get('version', latest_item.get('linked_version', 'v001'))
 
         # Create clip button with standardized sizing
-        clip = QPushButton(version)
+        clip = ShotClipLabel(version)
         clip.setFixedSize(clip_width, clip_height)  # Standardized size for perfect alignment
-        clip.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.9);
-                color: #000000;
-                border: 2px solid #ffffff;
-                font-size: 11px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #ffffff;
-                border: 2px solid #ffff00;
-            }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-            }
-        """)
+        clip.setStyleSheet(SHOT_CLIP_QSS)
 
         # Store data for version switching
-        clip.setProperty("shot_key", shot_key)
+        clip.setProperty("shot_key", "_".join(shot_key))
         clip.setProperty("department", department)
         clip.setProperty("versions", [item.get('version', 'v001') for item in dept_items])
 
@@ -5459,7 +6670,7 @@ def create_aligned_shot_clip(shot_key, department, shot_data, clip_width, clip_h
 
     except Exception as e:
         print(f"Error creating aligned shot clip: {e}")
-        return QPushButton("Error")
+        return ShotClipLabel("Error")
 
 def create_grid_department_label(department, label_width, label_height):
     """Create a department label for the grid layout."""
@@ -5498,36 +6709,42 @@ def create_grid_department_label(department, label_width, label_height):
         print(f"Error creating grid department label: {e}")
         return QLabel("Error")
 
+# Professional NLE color scheme - more subtle and industry-standard
+PROFESSIONAL_DEPT_COLORS = {
+    "animation": {"bg": "#2c5aa0", "text": "#ffffff"},      # Professional blue
+    "lighting": {"bg": "#b8860b", "text": "#ffffff"},       # Professional gold
+    "compositing": {"bg": "#228b22", "text": "#ffffff"},    # Professional green
+    "fx": {"bg": "#8b008b", "text": "#ffffff"},             # Professional magenta
+    "modeling": {"bg": "#b22222", "text": "#ffffff"}        # Professional red
+}
+PROFESSIONAL_DEPT_LABEL_QSS_TEMPLATE = """
+    QLabel {{
+        color: {text};
+        font-weight: bold;
+        font-size: 10px;
+        background-color: {bg};
+        padding: 0px;
+        border: none;
+        margin: 0px;
+    }}
+"""
+PROFESSIONAL_DEPT_LABEL_QSS = {
+    dept: PROFESSIONAL_DEPT_LABEL_QSS_TEMPLATE.format(**colors)
+    for dept, colors in PROFESSIONAL_DEPT_COLORS.items()
+}
+PROFESSIONAL_DEPT_LABEL_DEFAULT_QSS = PROFESSIONAL_DEPT_LABEL_QSS_TEMPLATE.format(
+    bg="#404040", text="#ffffff")
+
+
 def create_professional_department_label(department, label_width, label_height):
     """Create a professional department label matching NLE standards."""
     try:
         from PySide2.QtWidgets import QLabel
         from PySide2.QtCore import Qt
 
-        # Professional NLE color scheme - more subtle and industry-standard
-        dept_colors = {
-            "animation": {"bg": "#2c5aa0", "text": "#ffffff"},      # Professional blue
-            "lighting": {"bg": "#b8860b", "text": "#ffffff"},       # Professional gold
-            "compositing": {"bg": "#228b22", "text": "#ffffff"},    # Professional green
-            "fx": {"bg": "#8b008b", "text": "#ffffff"},             # Professional magenta
-            "modeling": {"bg": "#b22222", "text": "#ffffff"}        # Professional red
-        }
-
-        # Get colors for this department
-        colors = dept_colors.get(department.lower(), {"bg": "#404040", "text": "#ffffff"})
-
         dept_label = QLabel(department.upper())  # Uppercase for professional look
-        dept_label.setStyleSheet(f"""
-            QLabel {{
-                color: {colors['text']};
-                font-weight: bold;
-                font-size: 10px;
-                background-color: {colors['bg']};
-                padding: 0px;
-                border: none;
-                margin: 0px;
-            }}
-        """)
+        dept_label.setStyleSheet(PROFESSIONAL_DEPT_LABEL_QSS.get(
+            department.lower(), PROFESSIONAL_DEPT_LABEL_DEFAULT_QSS))
         dept_label.setFixedSize(label_width, label_height)
         dept_label.setAlignment(Qt.AlignCenter)
 
@@ -5540,21 +6757,18 @@ def create_professional_department_label(department, label_width, label_height):
 def create_professional_shot_clip(shot_key, department, shot_data, clip_width, clip_height):
     """Create a professional shot clip matching NLE standards."""
     try:
-        from PySide2.QtWidgets import QPushButton, QMenu
-        from PySide2.QtCore import Qt
-
         # Get versions for this department
         dept_items = shot_data.get(department, [])
 
-        # Extract shot name from shot_key
-        shot_name = shot_key.split('_')[-1] if '_' in shot_key else shot_key
+        # Shot name is the last part of the (episode, sequence, shot) key
+        shot_name = shot_key[-1]
 
         if not dept_items:
             # Empty clip with no spacing
-            clip = QPushButton(f"{shot_name}\n---")
+            clip = ShotClipLabel(f"{shot_name}\n---")
             clip.setFixedSize(clip_width, clip_height)
             clip.setStyleSheet("""
-                QPushButton {
+                QLabel {
                     background-color: #1a1a1a;
                     color: #666666;
                     border: none;
@@ -5571,10 +6785,10 @@ def create_professional_shot_clip(shot_key, department, shot_data, clip_width, c
         version = latest_item.get('version', latest_item.get('linked_version', 'v001'))
 
         # Create professional clip button with no spacing
-        clip = QPushButton(f"{shot_name}\n{version}")
+        clip = ShotClipLabel(f"{shot_name}\n{version}")
         clip.setFixedSize(clip_width, clip_height)
         clip.setStyleSheet("""
-            QPushButton {
+            QLabel {
                 background-color: #4a4a4a;
                 color: #ffffff;
                 border: none;
@@ -5583,16 +6797,13 @@ def create_professional_shot_clip(shot_key, department, shot_data, clip_width, c
                 margin: 0px;
                 padding: 0px;
             }
-            QPushButton:hover {
+            QLabel:hover {
                 background-color: #5a5a5a;
             }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
         """)
 
         # Store data for version switching
-        clip.setProperty("shot_key", shot_key)
+        clip.setProperty("shot_key", "_".join(shot_key))
         clip.setProperty("shot_name", shot_name)
         clip.setProperty("department", department)
         clip.setProperty("versions", [item.get('version', 'v001') for item in dept_items])
@@ -5604,33 +6815,22 @@ def create_professional_shot_clip(shot_key, department, shot_data, clip_width, c
 
     except Exception as e:
         print(f"Error creating professional shot clip: {e}")
-        return QPushButton("Error")
+        return ShotClipLabel("Error")
 
 def create_shot_clip_with_name(shot_key, department, shot_data, clip_width, clip_height):
     """Create a shot clip widget with shot name and version displayed."""
     try:
-        from PySide2.QtWidgets import QPushButton, QMenu
-        from PySide2.QtCore import Qt
-
         # Get versions for this department
         dept_items = shot_data.get(department, [])
 
-        # Extract shot name from shot_key (e.g., "ep01_sq0010_sh0020" -> "sh0020")
-        shot_name = shot_key.split('_')[-1] if '_' in shot_key else shot_key
+        # Shot name from shot_key (e.g., ("ep01", "sq0010", "sh0020") -> "sh0020")
+        shot_name = shot_key[-1]
 
         if not dept_items:
             # Empty clip with shot name
-            clip = QPushButton(f"{shot_name}\n---")
+            clip = ShotClipLabel(f"{shot_name}\n---")
             clip.setFixedSize(clip_width, clip_height)
-            clip.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 0.3);
-                    color: #666666;
-                    border: 1px dashed #444444;
-                    font-size: 10px;
-                    border-radius: 3px;
-                }
-            """)
+            clip.setStyleSheet(EMPTY_SHOT_CLIP_QSS)
             clip.setEnabled(False)
             return clip
 
@@ -5639,10 +6839,10 @@ def create_shot_clip_with_name(shot_key, department, shot_data, clip_width, clip
         version = latest_item.get('version', latest_item.get('linked_version', 'v001'))
 
         # Create clip button with shot name and version
-        clip = QPushButton(f"{shot_name}\n{version}")
+        clip = ShotClipLabel(f"{shot_name}\n{version}")
         clip.setFixedSize(clip_width, clip_height)
         clip.setStyleSheet("""
-            QPushButton {
+            QLabel {
                 background-color: rgba(255, 255, 255, 0.9);
                 color: #000000;
                 border: 2px solid #ffffff;
@@ -5650,17 +6850,14 @@ def create_shot_clip_with_name(shot_key, department, shot_data, clip_width, clip
                 font-weight: bold;
                 border-radius: 4px;
             }
-            QPushButton:hover {
+            QLabel:hover {
                 background-color: #ffffff;
                 border: 2px solid #ffff00;
             }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-            }
         """)
 
         # Store data for version switching
-        clip.setProperty("shot_key", shot_key)
+        clip.setProperty("shot_key", "_".join(shot_key))
         clip.setProperty("shot_name", shot_name)
         clip.setProperty("department", department)
         clip.setProperty("versions", [item.get('version', 'v001') for item in dept_items])
@@ -5672,7 +6869,7 @@ def create_shot_clip_with_name(shot_key, department, shot_data, clip_width, clip
 
     except Exception as e:
         print(f"Error creating shot clip with name: {e}")
-        return QPushButton("Error")
+        return ShotClipLabel("Error")
 
 # Legacy timeline function removed - using playlist timeline version
 
@@ -5711,6 +6908,7 @@ def on_timeline_height_changed():
     except Exception as e:
         print(f"Error changing timeline height: {e}")
 
+@Slot()
 def on_timeline_zoom_changed():
     """Handle timeline zoom changes."""
     global timeline_dock
@@ -5967,7 +7165,7 @@ def refresh_horus_data():
 
     try:
         print("Resetting filters...")
-        search_widget = search_dock.widget() if search_dock else None
+        search_widget = _get_search_widget()
         if not search_widget:
             return
 
@@ -5983,10 +7181,8 @@ def refresh_horus_data():
         # Reset all filters to "All" or default
         search_widget.department_filter.setCurrentIndex(0)  # "All"
         search_widget.episode_filter.setCurrentIndex(0)  # "All"
-        search_widget.sequence_filter.clear()
-        search_widget.sequence_filter.addItem("All")
-        search_widget.shot_filter.clear()
-        search_widget.shot_filter.addItem("All")
+        _set_combo_items(search_widget.sequence_filter, ["All"])
+        _set_combo_items(search_widget.shot_filter, ["All"])
         search_widget.status_filter.setCurrentIndex(0)  # "All"
         search_widget.search_input.clear()
         search_widget.version_toggle.setChecked(True)  # Latest only
@@ -5995,6 +7191,12 @@ def refresh_horus_data():
         _last_episode_filter = None
         _last_sequence_filter = None
 
+        # Drop cached project media so the next filter pass refetches it
+        _project_media_cache.pop(current_project_id, None)
+        _thumb_cache.clear()
+        invalidate_fs_cache()
+        invalidate_media_listing()
+
         # Unblock signals
         search_widget.department_filter.blockSignals(False)
         search_widget.episode_filter.blockSignals(False)